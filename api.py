@@ -1,13 +1,35 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
-from datetime import datetime
-import json
-from db_manager import TodoDB
+import os
+import io
+import csv
+import zlib
+import logging
+import tempfile
+from datetime import date, datetime
+from contextlib import asynccontextmanager
+import orjson
+from db_manager import Note, TODO_COLUMNS, NOTE_COLUMNS, migrate, env_bool
+from async_db_manager import get_db
+from importer import import_rows_async
 from typing import List, Optional
-import uvicorn
+from sqlalchemy.ext.asyncio import AsyncSession
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+# 데이터베이스 초기화는 import 시점이 아닌 lifespan에서 수행
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스키마는 마이그레이션으로 관리 - DB_AUTO_MIGRATE=1이면 시작 시 upgrade head 실행
+    if env_bool('DB_AUTO_MIGRATE', False):
+        migrate()
+    db = get_db()
+    yield
+    await db.dispose()
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS 설정 추가
 app.add_middleware(
@@ -16,10 +38,117 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
-# 데이터베이스 초기화
-db = TodoDB()
+# 요청 단위 세션 - 요청이 끝나면 반드시 반환됨
+async def get_session():
+    async for session in get_db().request_session():
+        yield session
+
+# 목록 페이지 크기
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# 일괄(bulk) 요청 한 번에 처리할 최대 항목 수
+BULK_MAX_BATCH_SIZE = int(os.getenv('BULK_MAX_BATCH_SIZE', 1000))
+
+def check_batch_size(items):
+    if not items:
+        raise HTTPException(status_code=400, detail="Empty batch")
+    if len(items) > BULK_MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch size {len(items)} exceeds limit {BULK_MAX_BATCH_SIZE}"
+        )
+
+# 컬렉션 ETag - DB의 공유 세대 번호(모든 프로세스의 쓰기마다 증가)와 URL로 계산
+# 다른 프로세스의 쓰기가 반영되기까지의 지연은 ReadCache.sync 참고
+async def collection_etag(collection, request, session):
+    version = await get_db().collection_version(collection, session=session)
+    url_hash = zlib.crc32(f"{request.url.path}?{request.url.query}".encode())
+    return f'W/"{collection}-{version}-{url_hash:08x}"'
+
+def is_not_modified(request, etag):
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]
+
+def not_modified_response(etag):
+    # DB 조회와 직렬화 없이 바로 304 반환
+    return Response(status_code=304, headers={"ETag": etag})
+
+# 행(tuple) 목록을 orjson으로 바로 인코딩해 bytes 응답으로 반환
+# 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 전달
+def rows_response(columns, rows, next_cursor=None, etag=None):
+    headers = {}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    if etag:
+        headers["ETag"] = etag
+    return Response(
+        content=orjson.dumps([dict(zip(columns, row)) for row in rows]),
+        media_type="application/json",
+        headers=headers
+    )
+
+# 스트리밍 내보내기 - batch(행 tuple 목록)마다 인코딩해 바로 전송
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+def _csv_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+async def encode_ndjson(columns, partitions):
+    async for rows in partitions:
+        yield b"".join(orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+async def encode_csv(columns, partitions):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue().encode()
+    async for rows in partitions:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode()
+
+def export_response(name, columns, partitions, format):
+    encode = encode_csv if format == "csv" else encode_ndjson
+    return StreamingResponse(
+        encode(columns, partitions),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{format}"'}
+    )
+
+# 대량 가져오기 - 요청 본문을 임시 파일에 받은 뒤 chunk 단위로 검증/적재하며
+# chunk마다 진행 상황을, 마지막에 오류 목록을 포함한 결과를 NDJSON 한 줄씩 전송
+IMPORT_SPOOL_SIZE = int(os.getenv('IMPORT_SPOOL_SIZE', 8 * 1024 * 1024))
+
+async def import_response(collection, request, format):
+    body = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_SIZE)
+    async for chunk in request.stream():
+        body.write(chunk)
+    body.seek(0)
+    lines = io.TextIOWrapper(body, encoding="utf-8-sig", newline="")
+
+    async def events():
+        try:
+            async for state in import_rows_async(get_db(), collection, lines, format):
+                yield orjson.dumps(state) + b"\n"
+        except Exception as e:
+            # 이미 기록된 chunk는 유지되고 실패한 chunk만 rollback됨
+            yield orjson.dumps({"done": True, "error": str(e)}) + b"\n"
+        finally:
+            lines.close()
+
+    return StreamingResponse(events(), media_type=EXPORT_MEDIA_TYPES["ndjson"])
 
 # TodoItem 모델
 class TodoItem(BaseModel):
@@ -37,191 +166,339 @@ class NoteItem(BaseModel):
     content: str
     created_at: Optional[str] = None
 
+# 일괄 수정 모델 - id 외에는 변경할 필드만 전달
+class TodoUpdate(BaseModel):
+    id: int
+    task: Optional[str] = None
+    due_date: Optional[str] = None
+    priority: Optional[str] = None
+    status: Optional[str] = None
+
+class NoteUpdate(BaseModel):
+    id: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+
 # Todo API 라우트
 @app.get("/api/todos/")
-def get_todos():
+async def get_todos(
+    request: Request,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    ordering: str = "id",
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_session),
+):
+    etag = await collection_etag("todos", request, session)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
     try:
-        todos_df = db.get_todos()
-        if todos_df.empty:
-            return []
-        
-        # DataFrame을 JSON으로 변환
-        todos = json.loads(todos_df.to_json(orient='records', date_format='iso'))
-        return todos
+        rows, next_cursor = await get_db().get_todo_page(
+            status=status, priority=priority, due_from=due_from, due_to=due_to,
+            ordering=ordering, limit=limit, cursor=cursor, session=session
+        )
+        return rows_response(TODO_COLUMNS, rows, next_cursor, etag)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/todos/")
-def create_todo(todo: TodoItem):
+async def create_todo(todo: TodoItem, session: AsyncSession = Depends(get_session)):
     try:
-        # 저장 로직
-        db.add_todo(todo.task, todo.due_date, todo.priority)
-        
-        # 저장 후 최신 데이터 가져오기
-        todos_df = db.get_todos()
-        if todos_df.empty:
-            raise HTTPException(status_code=404, detail="Todo was not created properly")
-        
-        # 가장 최근에 추가된 항목 반환
-        latest_todo = json.loads(todos_df.sort_values(by='created_at', ascending=False).head(1).to_json(orient='records', date_format='iso'))
-        return latest_todo[0] if latest_todo else {}
+        # 저장 후 저장된 행을 그대로 반환
+        return await get_db().add_todo(todo.task, todo.due_date, todo.priority, session=session)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 내보내기 라우트 ({todo_id} 라우트보다 먼저 등록해야 함)
+# 요청 세션 대신 스트리밍이 끝날 때까지 유지되는 별도 세션 사용
+@app.get("/api/todos/export")
+async def export_todos(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+):
+    partitions = get_db().iter_todo_rows(status=status, priority=priority, due_from=due_from, due_to=due_to)
+    return export_response("todos", TODO_COLUMNS, partitions, format)
+
+@app.post("/api/todos/import")
+async def import_todos(request: Request, format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    return await import_response("todos", request, format)
+
+# 검색 결과 최대 개수
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+def search_response(results, etag):
+    return Response(content=orjson.dumps(results), media_type="application/json", headers={"ETag": etag})
+
+# 전문 검색 라우트 ({todo_id} 라우트보다 먼저 등록해야 함)
+# 관련도 순으로 반환하며 snippet에 검색어가 <mark>로 강조됨
+@app.get("/api/todos/search")
+async def search_todos(
+    request: Request,
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    session: AsyncSession = Depends(get_session),
+):
+    etag = await collection_etag("todos", request, session)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    try:
+        return search_response(await get_db().search_todos(q, limit=limit, session=session), etag)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 통계 라우트 ({todo_id} 라우트보다 먼저 등록해야 함)
+@app.get("/api/todos/stats")
+async def get_todo_stats(request: Request, response: Response, session: AsyncSession = Depends(get_session)):
+    etag = await collection_etag("todos", request, session)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    try:
+        response.headers["ETag"] = etag
+        return await get_db().stats(session=session)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 일괄 처리 라우트 ({todo_id} 라우트보다 먼저 등록해야 함)
+@app.post("/api/todos/bulk")
+async def create_todos_bulk(todos: List[TodoItem], session: AsyncSession = Depends(get_session)):
+    check_batch_size(todos)
+    try:
+        results = await get_db().add_todos([todo.model_dump() for todo in todos], session=session)
+        return {"results": results}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.patch("/api/todos/bulk")
+async def update_todos_bulk(changes: List[TodoUpdate], session: AsyncSession = Depends(get_session)):
+    check_batch_size(changes)
+    try:
+        results = await get_db().update_todos([change.model_dump() for change in changes], session=session)
+        return {"results": results}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.delete("/api/todos/bulk")
+async def delete_todos_bulk(todo_ids: List[int], session: AsyncSession = Depends(get_session)):
+    check_batch_size(todo_ids)
+    try:
+        results = await get_db().delete_todos(todo_ids, session=session)
+        return {"results": results}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/todos/{todo_id}")
-def get_todo(todo_id: int):
+async def get_todo(todo_id: int, request: Request, response: Response, session: AsyncSession = Depends(get_session)):
+    etag = await collection_etag("todos", request, session)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
     try:
-        todos_df = db.get_todos()
-        if todos_df.empty:
-            raise HTTPException(status_code=404, detail="Todo not found")
-        
-        todo = todos_df[todos_df['id'] == todo_id]
-        if todo.empty:
+        todo = await get_db().get_todo(todo_id, session=session)
+        if todo is None:
             raise HTTPException(status_code=404, detail=f"Todo with id {todo_id} not found")
         
-        return json.loads(todo.to_json(orient='records', date_format='iso'))[0]
+        response.headers["ETag"] = etag
+        return todo
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/todos/{todo_id}")
-def update_todo(todo_id: int, todo: TodoItem):
+async def update_todo(todo_id: int, todo: TodoItem, session: AsyncSession = Depends(get_session)):
     try:
-        todos_df = db.get_todos()
-        if todos_df.empty or todos_df[todos_df['id'] == todo_id].empty:
+        # 상태 업데이트 후 변경된 행 반환
+        updated_todo = await get_db().update_status(todo_id, todo.status, session=session)
+        if updated_todo is None:
             raise HTTPException(status_code=404, detail=f"Todo with id {todo_id} not found")
         
-        # 기존 todo 가져오기
-        existing_todo = todos_df[todos_df['id'] == todo_id].iloc[0]
-        
-        # 상태 업데이트
-        db.update_status(todo_id, todo.status)
-        
-        # 최신 데이터 반환
-        updated_df = db.get_todos()
-        updated_todo = updated_df[updated_df['id'] == todo_id]
-        if updated_todo.empty:
-            raise HTTPException(status_code=404, detail=f"Updated todo with id {todo_id} not found")
-        
-        return json.loads(updated_todo.to_json(orient='records', date_format='iso'))[0]
+        return updated_todo
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/todos/{todo_id}")
-def delete_todo(todo_id: int):
+async def delete_todo(todo_id: int, session: AsyncSession = Depends(get_session)):
     try:
-        todos_df = db.get_todos()
-        if todos_df.empty or todos_df[todos_df['id'] == todo_id].empty:
+        if not await get_db().exists(todo_id, session=session):
             raise HTTPException(status_code=404, detail=f"Todo with id {todo_id} not found")
         
-        db.delete_todo(todo_id)
+        await get_db().delete_todo(todo_id, session=session)
         return {"message": f"Todo with id {todo_id} deleted successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Note API 라우트
 @app.get("/api/notes/")
-def get_notes():
+async def get_notes(
+    request: Request,
+    ordering: str = "id",
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_session),
+):
+    etag = await collection_etag("notes", request, session)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
     try:
-        notes_df = db.get_notes()
-        if notes_df.empty:
-            return []
-        
-        # DataFrame을 JSON으로 변환
-        notes = json.loads(notes_df.to_json(orient='records', date_format='iso'))
-        print(f"Returning {len(notes)} notes")
-        return notes
+        notes, next_cursor = await get_db().get_note_page(ordering=ordering, limit=limit, cursor=cursor, session=session)
+        logger.debug("Returning %d notes", len(notes))
+        return rows_response(NOTE_COLUMNS, notes, next_cursor, etag)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Error getting notes: {str(e)}")
+        logger.exception("Error getting notes")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/notes/")
-def create_note(note: NoteItem):
+async def create_note(note: NoteItem, session: AsyncSession = Depends(get_session)):
     try:
-        print(f"Creating note with title: {note.title}, content: {note.content}")
-        # 저장 로직
-        db.add_note(note.title, note.content)
-        
-        # 저장 후 최신 데이터 가져오기
-        notes_df = db.get_notes()
-        if notes_df.empty:
-            raise HTTPException(status_code=404, detail="Note was not created properly")
-        
-        # 가장 최근에 추가된 항목 반환
-        latest_note = json.loads(notes_df.sort_values(by='created_at', ascending=False).head(1).to_json(orient='records', date_format='iso'))
-        print(f"Note created with id: {latest_note[0]['id'] if latest_note else 'unknown'}")
-        return latest_note[0] if latest_note else {}
+        logger.debug("Creating note with title: %s", note.title)
+        # 저장 후 저장된 행을 그대로 반환
+        new_note = await get_db().add_note(note.title, note.content, session=session)
+        logger.debug("Note created with id: %s", new_note['id'])
+        return new_note
+    except Exception as e:
+        logger.exception("Error creating note")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/notes/export")
+async def export_notes(format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    return export_response("notes", NOTE_COLUMNS, get_db().iter_note_rows(), format)
+
+@app.post("/api/notes/import")
+async def import_notes(request: Request, format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    return await import_response("notes", request, format)
+
+@app.get("/api/notes/search")
+async def search_notes(
+    request: Request,
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    session: AsyncSession = Depends(get_session),
+):
+    etag = await collection_etag("notes", request, session)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    try:
+        return search_response(await get_db().search_notes(q, limit=limit, session=session), etag)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/notes/bulk")
+async def create_notes_bulk(notes: List[NoteItem], session: AsyncSession = Depends(get_session)):
+    check_batch_size(notes)
+    try:
+        results = await get_db().add_notes([note.model_dump() for note in notes], session=session)
+        return {"results": results}
+    except Exception as e:
+        logger.exception("Error bulk creating notes")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.patch("/api/notes/bulk")
+async def update_notes_bulk(changes: List[NoteUpdate], session: AsyncSession = Depends(get_session)):
+    check_batch_size(changes)
+    try:
+        results = await get_db().update_notes([change.model_dump() for change in changes], session=session)
+        return {"results": results}
     except Exception as e:
-        print(f"Error creating note: {str(e)}")
+        logger.exception("Error bulk updating notes")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.delete("/api/notes/bulk")
+async def delete_notes_bulk(note_ids: List[int], session: AsyncSession = Depends(get_session)):
+    check_batch_size(note_ids)
+    try:
+        results = await get_db().delete_notes(note_ids, session=session)
+        return {"results": results}
+    except Exception as e:
+        logger.exception("Error bulk deleting notes")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/notes/{note_id}")
-def get_note(note_id: int):
+async def get_note(note_id: int, request: Request, response: Response, session: AsyncSession = Depends(get_session)):
+    etag = await collection_etag("notes", request, session)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
     try:
-        notes_df = db.get_notes()
-        if notes_df.empty:
-            raise HTTPException(status_code=404, detail="Note not found")
-        
-        note = notes_df[notes_df['id'] == note_id]
-        if note.empty:
+        note = await get_db().get_note(note_id, session=session)
+        if note is None:
             raise HTTPException(status_code=404, detail=f"Note with id {note_id} not found")
         
-        return json.loads(note.to_json(orient='records', date_format='iso'))[0]
+        response.headers["ETag"] = etag
+        return note
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/notes/{note_id}")
-def update_note(note_id: int, note: NoteItem):
+async def update_note(note_id: int, note: NoteItem, session: AsyncSession = Depends(get_session)):
     try:
-        print(f"Updating note {note_id} with title: {note.title}, content: {note.content}")
-        notes_df = db.get_notes()
-        if notes_df.empty or notes_df[notes_df['id'] == note_id].empty:
+        logger.debug("Updating note %s with title: %s", note_id, note.title)
+        # 제목과 내용 업데이트 후 변경된 행 반환
+        result = await get_db().update_note(note_id, note.title, note.content, session=session)
+        if result is None:
             raise HTTPException(status_code=404, detail=f"Note with id {note_id} not found")
         
-        # 제목과 내용 업데이트
-        db.update_note(note_id, note.title, note.content)
-        
-        # 최신 데이터 반환
-        updated_df = db.get_notes()
-        updated_note = updated_df[updated_df['id'] == note_id]
-        if updated_note.empty:
-            raise HTTPException(status_code=404, detail=f"Updated note with id {note_id} not found")
-        
-        result = json.loads(updated_note.to_json(orient='records', date_format='iso'))[0]
-        print(f"Note updated successfully: {result}")
+        logger.debug("Note %s updated", note_id)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error updating note: {str(e)}")
+        logger.exception("Error updating note")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/notes/{note_id}")
-def delete_note(note_id: int):
+async def delete_note(note_id: int, session: AsyncSession = Depends(get_session)):
     try:
-        print(f"Deleting note with id: {note_id}")
-        notes_df = db.get_notes()
-        if notes_df.empty or notes_df[notes_df['id'] == note_id].empty:
+        logger.debug("Deleting note with id: %s", note_id)
+        if not await get_db().exists(note_id, Note, session=session):
             raise HTTPException(status_code=404, detail=f"Note with id {note_id} not found")
         
-        db.delete_note(note_id)
-        print(f"Note {note_id} deleted successfully")
+        await get_db().delete_note(note_id, session=session)
+        logger.debug("Note %s deleted", note_id)
         return {"message": f"Note with id {note_id} deleted successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error deleting note: {str(e)}")
+        logger.exception("Error deleting note")
         raise HTTPException(status_code=500, detail=str(e))
 
 # 테스트 엔드포인트 추가
 @app.get("/api/test/")
-def test_api():
+async def test_api():
     return {"status": "API is working!"}
 
+@app.get("/api/test/pool/")
+async def test_pool():
+    # 커넥션 풀 상태 (사용 중 커넥션 수, 대기 시간, overflow)
+    return get_db().pool_stats()
+
+@app.get("/api/test/cache/")
+async def test_cache():
+    # 읽기 캐시 상태 (항목 수, hit/miss, 컬렉션 버전)
+    return get_db().cache.stats()
+
 @app.get("/api/test/notes/")
-def test_notes_db():
+async def test_notes_db():
     try:
-        notes_df = db.get_notes()
-        count = len(notes_df) if not notes_df.empty else 0
+        notes = await get_db().get_note_rows()
         return {
             "status": "Notes DB connection successful",
-            "note_count": count,
-            "notes": json.loads(notes_df.to_json(orient='records', date_format='iso')) if not notes_df.empty else []
+            "note_count": len(notes),
+            "notes": [dict(zip(NOTE_COLUMNS, row)) for row in notes]
         }
     except Exception as e:
         return {
@@ -231,4 +508,5 @@ def test_notes_db():
 
 # 서버 직접 실행 (streamlit 앱과 별도로)
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,10 +1,14 @@
 import streamlit as st
-import pandas as pd
-from datetime import datetime
-from db_manager import TodoDB
+from db_manager import get_db
+from frame_cache import FrameCache
 
-# 데이터베이스 초기화
-db = TodoDB()
+# 데이터베이스 연결과 목록 캐시는 프로세스당 한 번만 생성 (rerun 시 재사용)
+@st.cache_resource
+def get_store():
+    return FrameCache(get_db())
+
+store = get_store()
+db = store.db
 
 # 페이지 설정
 st.set_page_config(page_title="Todo List & Notes App", page_icon="✅")
@@ -12,17 +16,21 @@ st.set_page_config(page_title="Todo List & Notes App", page_icon="✅")
 # 사이드바
 st.sidebar.title("Menu")
 page = st.sidebar.selectbox("Choose a page", ["Todo List", "Notes"])
+# 다른 곳(API 등)에서 바뀐 데이터 다시 읽기
+if st.sidebar.button("새로고침"):
+    store.refresh()
 
 # 노트 페이지
 if page == "Notes":
     st.title("📝 Notes")
-    notes = db.get_notes()
+    notes = store.notes()
     if st.button("Add Note"):
         st.session_state['add_note'] = True
     if 'add_note' in st.session_state and st.session_state['add_note']:
+        title = st.text_input("Title:")
         content = st.text_area("Write your note in Markdown:")
         if st.button("Save Note"):
-            db.add_note(content)
+            store.add_note(title, content)
             st.success("Note added!")
             st.session_state['add_note'] = False
             st.rerun()
@@ -33,12 +41,12 @@ if page == "Notes":
         if f'edit_{row["id"]}' in st.session_state and st.session_state[f'edit_{row["id"]}']:
             new_content = st.text_area("Edit your note:", row['content'])
             if st.button("Update", key=f"update_{row['id']}"):
-                db.update_note(row['id'], new_content)
+                store.update_note(row['id'], row['title'], new_content)
                 st.success("Note updated!")
                 st.session_state[f'edit_{row["id"]}'] = False
                 st.rerun()
         if st.button("Delete", key=f"delete_{row['id']}"):
-            db.delete_note(row['id'])
+            store.delete_note(row['id'])
             st.success("Note deleted!")
             st.rerun()
 
@@ -47,21 +55,19 @@ elif page == "Todo List":
     # 제목
     st.title("📝 Todo List Application")
 
-    # 데이터베이스에서 할 일 목록 가져오기
-    todos = db.get_todos()
+    # 캐시된 할 일 목록 (첫 조회 이후에는 DB를 다시 읽지 않음)
+    todos = store.todos()
 
-    # 통계 표시
-    if not todos.empty:
-        total_tasks = len(todos)
-        completed_tasks = len(todos[todos['status'] == 'Completed'])
+    # 통계 표시 (집계 쿼리 한 번)
+    stats = db.stats()
+    if stats['total'] > 0:
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("총 할 일", f"{total_tasks}개")
+            st.metric("총 할 일", f"{stats['total']}개")
         with col2:
-            st.metric("완료된 할 일", f"{completed_tasks}개")
+            st.metric("완료된 할 일", f"{stats['completed']}개")
         with col3:
-            completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-            st.metric("완료율", f"{completion_rate:.1f}%")
+            st.metric("완료율", f"{stats['completion_rate']:.1f}%")
 
     # 새로운 할 일 입력 폼
     with st.form("todo_form", clear_on_submit=True):
@@ -77,41 +83,81 @@ elif page == "Todo List":
         submit = st.form_submit_button("추가")
         
         if submit and task:
-            db.add_todo(task, due_date.strftime("%Y-%m-%d"), priority)
+            store.add_todo(task, due_date.strftime("%Y-%m-%d"), priority)
             st.success("할 일이 추가되었습니다!")
             st.rerun()
 
     # 할 일 목록 표시
     st.subheader("할 일 목록")
 
-    # 상태 필터
-    status_filter = st.selectbox("상태 필터", ["All", "Pending", "Completed"])
+    # 직전 저장 결과 (저장 후 rerun되므로 session_state로 전달)
+    failed = st.session_state.pop('todo_save_failed', None)
+    if failed == []:
+        st.success("변경 사항이 저장되었습니다!")
+    elif failed:
+        st.error("일부 항목을 저장하지 못했습니다: " + ", ".join(
+            f"ID {result['id']} ({'없는 항목' if result['status'] == 'not_found' else result.get('detail', result['status'])})"
+            for result in failed
+        ))
+
+    # 상태 필터 / 페이지 크기
+    col1, col2 = st.columns(2)
+    with col1:
+        status_filter = st.selectbox("상태 필터", ["All", "Pending", "Completed"])
+    with col2:
+        page_size = st.selectbox("페이지 크기", [25, 50, 100, 200], index=1)
 
     if not todos.empty:
-        filtered_todos = todos
-        if status_filter != "All":
-            filtered_todos = filtered_todos[filtered_todos['status'] == status_filter]
-        
-        # 각 할 일 항목 표시
-        for idx, todo in filtered_todos.iterrows():
-            col1, col2, col3, col4, col5 = st.columns([2, 1, 1, 1, 1])
-            
-            with col1:
-                st.write(f"**{todo['task']}**")
-            with col2:
-                st.write(f"마감일: {todo['due_date']}")
-            with col3:
-                st.write(f"우선순위: {todo['priority']}")
-            with col4:
-                if st.button("완료" if todo['status'] == "Pending" else "취소", key=f"btn_{todo['id']}"):
-                    new_status = "Completed" if todo['status'] == "Pending" else "Pending"
-                    db.update_status(todo['id'], new_status)
-                    st.rerun()
-            with col5:
-                if st.button("삭제", key=f"del_{todo['id']}"):
-                    db.delete_todo(todo['id'])
-                    st.rerun()
-            
-            st.markdown("---")
+        filtered_todos = store.todos(None if status_filter == "All" else status_filter)
+        page_count = max(1, -(-len(filtered_todos) // page_size))
+        page_number = st.number_input(f"페이지 (전체 {page_count}, {len(filtered_todos)}개)",
+                                      min_value=1, max_value=page_count, value=1)
+
+        # 현재 페이지만 그리드로 표시 - 여러 행을 수정한 뒤 한 번에 저장
+        page_todos = filtered_todos.iloc[(page_number - 1) * page_size:page_number * page_size]
+        page_todos = page_todos[['id', 'task', 'due_date', 'priority', 'status']].assign(delete=False)
+        # 저장 후 편집 상태를 초기화하기 위해 key에 버전 포함
+        editor_version = st.session_state.get('todo_editor_version', 0)
+        edited = st.data_editor(
+            page_todos,
+            key=f"todo_editor_{editor_version}",
+            hide_index=True,
+            use_container_width=True,
+            disabled=['id'],
+            column_config={
+                'id': st.column_config.NumberColumn("ID"),
+                'task': st.column_config.TextColumn("할 일", required=True),
+                'due_date': st.column_config.DateColumn("마감일", format="YYYY-MM-DD", required=True),
+                'priority': st.column_config.SelectboxColumn("우선순위", options=["High", "Medium", "Low"], required=True),
+                'status': st.column_config.SelectboxColumn("상태", options=["Pending", "Completed"], required=True),
+                'delete': st.column_config.CheckboxColumn("삭제"),
+            },
+        )
+
+        # 원래 값과 비교해 바뀐 필드만 모음
+        changes, delete_ids = [], []
+        for (_, before), (_, after) in zip(page_todos.iterrows(), edited.iterrows()):
+            if after['delete']:
+                delete_ids.append(before['id'])
+                continue
+            change = {
+                field: after[field] for field in ('task', 'due_date', 'priority', 'status')
+                if after[field] != before[field]
+            }
+            if change:
+                if 'due_date' in change:
+                    change['due_date'] = change['due_date'].strftime("%Y-%m-%d")
+                changes.append({'id': before['id'], **change})
+
+        if st.button(f"변경 사항 저장 (수정 {len(changes)}개, 삭제 {len(delete_ids)}개)",
+                     disabled=not (changes or delete_ids)):
+            # 수정과 삭제를 한 트랜잭션으로 저장 - 없는 항목/잘못된 값은 항목별 결과로 확인
+            update_results, delete_results = store.save_todos(changes, delete_ids)
+            st.session_state['todo_editor_version'] = editor_version + 1
+            st.session_state['todo_save_failed'] = [
+                result for result in update_results + delete_results
+                if result['status'] not in ('updated', 'deleted')
+            ]
+            st.rerun()
     else:
         st.info("할 일이 없습니다. 새로운 할 일을 추가해보세요!")
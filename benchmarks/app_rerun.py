@@ -0,0 +1,69 @@
+"""
+Streamlit 앱 rerun 시 데이터 조회 시간 벤치마크
+
+기존 방식(rerun마다 TodoDB 생성 + get_todos()/get_notes() 전체 조회)과
+FrameCache(연결/목록 캐시 + 쓰기 시 해당 행만 반영)의 rerun당 조회 시간을 비교합니다.
+
+실행:
+    python benchmarks/app_rerun.py [--rows 50000] [--reruns 20]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from db_manager import TodoDB
+from frame_cache import FrameCache
+from serialization import make_db
+
+
+def bench(label, reruns, rerun):
+    timings = []
+    for i in range(reruns):
+        start = time.perf_counter()
+        rerun(i)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    print(f"{label:<12} median {timings[len(timings) // 2] * 1000:9.2f} ms  "
+          f"max {timings[-1] * 1000:9.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=50_000)
+    parser.add_argument('--reruns', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        make_db(path, args.rows).engine.dispose()
+        url = f"sqlite:///{path}"
+
+        # 기존: 클릭(상태 변경) 후 rerun마다 새 연결로 두 목록 전체 조회
+        def baseline(i):
+            db = TodoDB(url)
+            db.update_status(i + 1, 'Completed')
+            db.get_todos()
+            db.get_notes()
+            db.engine.dispose()
+
+        store = FrameCache(TodoDB(url))
+        store.todos(), store.notes()
+
+        # FrameCache: 쓰기는 해당 행만 반영, 조회는 캐시된 DataFrame 사용
+        def cached(i):
+            store.update_status(i + 1, 'Pending')
+            store.todos()
+            store.notes()
+
+        bench('baseline', args.reruns, baseline)
+        bench('FrameCache', args.reruns, cached)
+
+
+if __name__ == '__main__':
+    main()
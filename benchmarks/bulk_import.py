@@ -0,0 +1,87 @@
+"""
+대량 가져오기 벤치마크 (SQLite)
+
+행마다 TodoDB.add_todo를 호출하는 기존 방식과 importer.import_rows(CSV/NDJSON,
+chunk 단위 검증 + load_rows 적재)의 처리량(rows/sec)을 비교합니다. 목표: 50k rows/sec 이상
+
+실행:
+    python benchmarks/bulk_import.py [--rows 200000] [--chunk-size 20000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_manager import TodoDB, migrate
+from importer import import_rows
+
+TARGET_ROWS_PER_SEC = 50_000
+
+
+def todo_record(i):
+    return {
+        'task': f"할 일 {i} 가져오기",
+        'due_date': f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        'priority': ('High', 'Medium', 'Low')[i % 3],
+        'status': ('Pending', 'Completed')[i % 2],
+    }
+
+
+def write_file(path, format, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if format == 'csv':
+            f.write('task,due_date,priority,status\n')
+            for i in range(rows):
+                record = todo_record(i)
+                f.write(f"{record['task']},{record['due_date']},{record['priority']},{record['status']}\n")
+        else:
+            for i in range(rows):
+                f.write(json.dumps(todo_record(i), ensure_ascii=False) + '\n')
+
+
+def fresh_db(tmp, name):
+    url = f"sqlite:///{os.path.join(tmp, name)}"
+    migrate(url)
+    return TodoDB(url)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--baseline-rows', type=int, default=2_000)
+    parser.add_argument('--chunk-size', type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = fresh_db(tmp, 'baseline.db')
+        start = time.perf_counter()
+        for i in range(args.baseline_rows):
+            record = todo_record(i)
+            db.add_todo(record['task'], record['due_date'], record['priority'])
+        rate = args.baseline_rows / (time.perf_counter() - start)
+        print(f"add_todo x{args.baseline_rows:<8} {rate:10.0f} rows/s")
+
+        failed = False
+        for format in ('csv', 'ndjson'):
+            path = os.path.join(tmp, f"todos.{format}")
+            write_file(path, format, args.rows)
+            db = fresh_db(tmp, f"{format}.db")
+            start = time.perf_counter()
+            with open(path, encoding='utf-8-sig', newline='') as lines:
+                summary = import_rows(db, 'todos', lines, format, args.chunk_size)
+            rate = summary['created'] / (time.perf_counter() - start)
+            ok = rate >= TARGET_ROWS_PER_SEC and summary['created'] == args.rows
+            failed |= not ok
+            print(f"import {format:<6} x{args.rows:<8} {rate:10.0f} rows/s  "
+                  f"(target {TARGET_ROWS_PER_SEC})  {'OK' if ok else 'BELOW TARGET'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Django 부하 테스트: WSGI vs ASGI(동기 뷰셋) vs ASGI(네이티브 비동기 뷰)
+
+같은 SQLite 데이터베이스로 세 가지 구성을 각각 uvicorn 프로세스로 띄우고
+동시 클라이언트 500개로 단건 조회와 목록 조회(page_size=20)를 섞어 호출합니다.
+    wsgi   todo_api.wsgi (uvicorn --interface wsgi, 스레드 풀) + /api/todos/
+    asgi   todo_api.asgi + DRF 뷰셋 /api/todos/ (동기 뷰를 스레드로 넘겨 실행)
+    async  todo_api.asgi + 비동기 뷰 /api/async/todos/
+응답 캐시는 끄고(API_RESPONSE_CACHE_TIMEOUT=0) 처리량(requests/sec)과 p50/p99 지연시간을 비교합니다.
+
+실행:
+    python benchmarks/django_async.py [--clients 500] [--duration 10] [--rows 10000]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'todo_api'))
+
+import httpx
+
+MODES = {
+    # mode: (application, uvicorn interface, URL 접두사)
+    'wsgi': ('todo_api.wsgi', 'wsgi', '/api/todos'),
+    'asgi': ('todo_api.asgi', 'asgi3', '/api/todos'),
+    'async': ('todo_api.asgi', 'asgi3', '/api/async/todos'),
+}
+
+
+def setup_django(path):
+    # 벤치마크용 데이터베이스를 쓰도록 환경 변수를 정한 뒤 django.setup()
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todo_api.settings')
+    os.environ['DJANGO_DB_NAME'] = path
+    os.environ['API_RESPONSE_CACHE_TIMEOUT'] = '0'
+    from todo_api import settings
+    # DEBUG의 쿼리 기록은 측정에서 제외
+    settings.DEBUG = False
+    settings.ALLOWED_HOSTS = ['127.0.0.1']
+
+    import django
+    django.setup()
+
+
+def make_db(path, rows):
+    setup_django(path)
+    from django.core.management import call_command
+    from api.models import Todo
+
+    call_command('migrate', verbosity=0)
+    Todo.objects.bulk_create([
+        Todo(task=f'할 일 {i}', due_date=date(2025, 1, 1) + timedelta(days=i % 365),
+             priority=['High', 'Medium', 'Low'][i % 3], status=['Pending', 'Completed'][i % 2])
+        for i in range(rows)
+    ], batch_size=1000)
+
+
+def serve(mode, port, path):
+    import importlib
+    import uvicorn
+
+    setup_django(path)
+    module, interface, _ = MODES[mode]
+    app = importlib.import_module(module).application
+    uvicorn.run(app, host="127.0.0.1", port=port, interface=interface, log_level="warning")
+
+
+async def wait_ready(base_url, prefix):
+    async with httpx.AsyncClient() as client:
+        for _ in range(100):
+            try:
+                await client.get(f"{base_url}{prefix}/1/")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+async def run_load(base_url, prefix, clients, duration, rows):
+    # load_test.run_load와 같은 부하 (단건 80%, 목록 20%)
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                if random.random() < 0.8:
+                    url = f"{prefix}/{random.randint(1, rows)}/"
+                else:
+                    url = f"{prefix}/?page_size=20"
+                start = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(clients)])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000,
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=500)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--rows', type=int, default=10_000)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        process = context.Process(target=make_db, args=(path, args.rows))
+        process.start()
+        process.join()
+
+        for port, mode in enumerate(MODES, start=8111):
+            process = context.Process(target=serve, args=(mode, port, path), daemon=True)
+            process.start()
+            try:
+                base_url, prefix = f"http://127.0.0.1:{port}", MODES[mode][2]
+                asyncio.run(wait_ready(base_url, prefix))
+                result = asyncio.run(run_load(base_url, prefix, args.clients, args.duration, args.rows))
+            finally:
+                process.terminate()
+                process.join()
+            print(f"{mode:<6} clients={args.clients}  {result['rps']:8.1f} req/s  "
+                  f"p50 {result['p50_ms']:8.1f} ms  p99 {result['p99_ms']:8.1f} ms  "
+                  f"errors {result['errors']}")
+
+
+if __name__ == '__main__':
+    main()
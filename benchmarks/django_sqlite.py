@@ -0,0 +1,130 @@
+"""
+Django SQLite 설정 동시성 테스트: 기존 설정 vs 튜닝 설정(WAL + 지속 연결)
+
+같은 데이터로 만든 SQLite 파일을 각 설정으로 todo_api.wsgi(uvicorn --interface wsgi, 스레드 10개)에 연결하고
+동시 클라이언트 100개로 단건 조회 60%, 목록 조회 10%, 부분 수정(PATCH) 30%를 섞어 호출합니다.
+    default  rollback journal, synchronous=FULL, 캐시/메모리 맵 기본값, 요청마다 새 연결 (CONN_MAX_AGE=0)
+    tuned    settings.py 기본값 (WAL, synchronous=NORMAL, mmap, 64MB 캐시, 지속 연결 + 상태 확인)
+두 설정 모두 busy timeout은 5초입니다 (sqlite3 모듈 기본값과 같음).
+처리량(requests/sec), p50/p99 지연시간과 오류("database is locked" 등 200이 아닌 응답) 수를 비교합니다.
+
+실행:
+    python benchmarks/django_sqlite.py [--clients 100] [--duration 10] [--rows 10000]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+
+from django_async import make_db, setup_django, wait_ready
+
+MODES = {
+    'default': {
+        'DJANGO_DB_CONN_MAX_AGE': '0',
+        'SQLITE_JOURNAL_MODE': 'DELETE',
+        'SQLITE_SYNCHRONOUS': 'FULL',
+        'SQLITE_MMAP_SIZE': '0',
+        'SQLITE_BUSY_TIMEOUT': '5000',
+        'SQLITE_CACHE_SIZE': '-2000',
+    },
+    # settings.py 기본값
+    'tuned': {},
+}
+
+
+def prepare(mode, path, rows):
+    os.environ.update(MODES[mode])
+    make_db(path, rows)
+
+
+def serve(mode, port, path):
+    import uvicorn
+
+    os.environ.update(MODES[mode])
+    setup_django(path)
+    from todo_api.wsgi import application
+    uvicorn.run(application, host="127.0.0.1", port=port, interface='wsgi', log_level="warning")
+
+
+async def run_load(base_url, clients, duration, rows):
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                todo_id = random.randint(1, rows)
+                kind = random.random()
+                start = time.perf_counter()
+                try:
+                    if kind < 0.6:
+                        response = await client.get(f"/api/todos/{todo_id}/")
+                    elif kind < 0.7:
+                        response = await client.get("/api/todos/?page_size=20")
+                    else:
+                        response = await client.patch(f"/api/todos/{todo_id}/",
+                                                      json={'status': random.choice(['Pending', 'Completed'])})
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(clients)])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000,
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--rows', type=int, default=10_000)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as tmp:
+        for port, mode in enumerate(MODES, start=8121):
+            # journal_mode는 파일에 남으므로 설정마다 데이터베이스를 따로 생성
+            path = os.path.join(tmp, f'{mode}.sqlite3')
+            process = context.Process(target=prepare, args=(mode, path, args.rows))
+            process.start()
+            process.join()
+
+            process = context.Process(target=serve, args=(mode, port, path), daemon=True)
+            process.start()
+            try:
+                base_url = f"http://127.0.0.1:{port}"
+                asyncio.run(wait_ready(base_url, '/api/todos'))
+                result = asyncio.run(run_load(base_url, args.clients, args.duration, args.rows))
+            finally:
+                process.terminate()
+                process.join()
+            print(f"{mode:<8} clients={args.clients}  {result['rps']:8.1f} req/s  "
+                  f"p50 {result['p50_ms']:8.1f} ms  p99 {result['p99_ms']:8.1f} ms  "
+                  f"errors {result['errors']}")
+
+
+if __name__ == '__main__':
+    main()
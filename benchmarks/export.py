@@ -0,0 +1,84 @@
+"""
+스트리밍 내보내기 벤치마크
+
+GET /api/todos/export (NDJSON/CSV)의 첫 바이트까지 시간, 전체 시간,
+최대 메모리 사용량(tracemalloc)을 기존 전체 조회(get_todos() -> DataFrame)와 비교합니다.
+
+실행:
+    python benchmarks/export.py [--rows 200000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from serialization import make_db
+
+
+def measure(label, run):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first_byte, size = run(start)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    first = f"{first_byte * 1000:8.1f} ms" if first_byte is not None else "       -   "
+    print(f"{label:<16} first byte {first}  total {elapsed:7.2f} s  "
+          f"{size / 1e6:7.1f} MB  peak memory {peak / 1e6:8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        make_db(path, args.rows).engine.dispose()
+        os.environ['DATABASE_URL'] = f"sqlite:///{path}"
+        os.environ['DB_AUTO_MIGRATE'] = '0'
+
+        import httpx
+        import uvicorn
+        import api
+        from db_manager import TodoDB
+
+        # TestClient는 응답 본문을 모두 모은 뒤 반환하므로 실제 서버로 첫 바이트 시간 측정
+        server = uvicorn.Server(uvicorn.Config(api.app, host="127.0.0.1", port=8103, log_level="warning"))
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        while not server.started:
+            time.sleep(0.05)
+
+        def dataframe(start):
+            frame = TodoDB().get_todos()
+            return None, len(frame.to_json(orient='records', date_format='iso'))
+
+        def export(format):
+            def run(start):
+                first_byte, size = None, 0
+                with client.stream('GET', '/api/todos/export', params={'format': format}) as response:
+                    for chunk in response.iter_bytes():
+                        if first_byte is None:
+                            first_byte = time.perf_counter() - start
+                        size += len(chunk)
+                return first_byte, size
+            return run
+
+        with httpx.Client(base_url="http://127.0.0.1:8103", timeout=None) as client:
+            measure('get_todos()', dataframe)
+            measure('export ndjson', export('ndjson'))
+            measure('export csv', export('csv'))
+        server.should_exit = True
+        thread.join()
+
+
+if __name__ == '__main__':
+    main()
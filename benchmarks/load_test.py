@@ -0,0 +1,140 @@
+"""
+동기(TodoDB + def 라우트) vs 비동기(AsyncTodoDB + async def 라우트) 부하 테스트
+
+두 앱을 각각 uvicorn 프로세스로 띄우고 동시 클라이언트 500개로
+단건 조회(GET /api/todos/{id})와 목록 조회(GET /api/todos/?limit=20)를 섞어 호출합니다.
+처리량(requests/sec)과 p50/p99 지연시간을 비교합니다.
+
+실행:
+    python benchmarks/load_test.py [--clients 500] [--duration 10] [--rows 10000]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+
+from serialization import make_db
+
+
+def make_sync_app(db):
+    # api.py의 기존(동기) 라우트와 같은 구조
+    from fastapi import FastAPI, HTTPException
+    from api import rows_response
+    from db_manager import TODO_COLUMNS
+
+    app = FastAPI()
+
+    @app.get("/api/todos/")
+    def get_todos(limit: int = 100):
+        rows, next_cursor = db.get_todo_page(limit=limit)
+        return rows_response(TODO_COLUMNS, rows, next_cursor)
+
+    @app.get("/api/todos/{todo_id}")
+    def get_todo(todo_id: int):
+        todo = db.get_todo(todo_id)
+        if todo is None:
+            raise HTTPException(status_code=404, detail=f"Todo with id {todo_id} not found")
+        return todo
+
+    return app
+
+
+def serve(mode, port, path):
+    import uvicorn
+
+    os.environ['DATABASE_URL'] = f"sqlite:///{path}"
+    if mode == 'async':
+        from api import app
+    else:
+        from db_manager import TodoDB
+        app = make_sync_app(TodoDB())
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+async def wait_ready(base_url):
+    async with httpx.AsyncClient() as client:
+        for _ in range(100):
+            try:
+                await client.get(f"{base_url}/api/todos/1")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+async def run_load(base_url, clients, duration, rows):
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                if random.random() < 0.8:
+                    url = f"/api/todos/{random.randint(1, rows)}"
+                else:
+                    url = "/api/todos/?limit=20"
+                start = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(clients)])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000,
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=500)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--rows', type=int, default=10_000)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        make_db(path, args.rows).engine.dispose()
+
+        for port, mode in ((8101, 'sync'), (8102, 'async')):
+            process = context.Process(target=serve, args=(mode, port, path), daemon=True)
+            process.start()
+            try:
+                base_url = f"http://127.0.0.1:{port}"
+                asyncio.run(wait_ready(base_url))
+                result = asyncio.run(run_load(base_url, args.clients, args.duration, args.rows))
+            finally:
+                process.terminate()
+                process.join()
+            print(f"{mode:<6} clients={args.clients}  {result['rps']:8.1f} req/s  "
+                  f"p50 {result['p50_ms']:8.1f} ms  p99 {result['p99_ms']:8.1f} ms  "
+                  f"errors {result['errors']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+목록 API 직렬화 벤치마크
+
+기존 경로(DataFrame -> to_json -> json.loads -> FastAPI JSON 인코딩)와
+행(tuple) + orjson 경로의 처리량과 최대 메모리 사용량을 비교합니다.
+
+실행:
+    python benchmarks/serialization.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert
+
+from db_manager import Todo, TodoDB, TODO_COLUMNS
+
+
+def make_db(path, rows):
+    # PostgreSQL 없이 SQLite 파일로 TodoDB 구성
+    db = TodoDB(f"sqlite:///{path}")
+    db.create_all()
+
+    now = datetime.now()
+    with db.engine.begin() as conn:
+        conn.execute(insert(Todo), [
+            {
+                'task': f"할 일 {i}",
+                'due_date': (now + timedelta(days=i % 30)).date(),
+                'priority': ('High', 'Medium', 'Low')[i % 3],
+                'status': ('Pending', 'Completed')[i % 2],
+                'created_at': now,
+            } for i in range(rows)
+        ])
+    return db
+
+
+def dataframe_path(db):
+    todos_df = db.get_todos()
+    todos = json.loads(todos_df.to_json(orient='records', date_format='iso'))
+    # FastAPI 기본 JSONResponse 인코딩
+    return json.dumps(jsonable_encoder(todos), ensure_ascii=False).encode('utf-8')
+
+
+def rows_path(db):
+    return orjson.dumps([dict(zip(TODO_COLUMNS, row)) for row in db.get_todo_rows()])
+
+
+def measure(func, db, repeat):
+    func(db)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(db)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    func(db)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    for rows, repeat in ((10_000, 10), (100_000, 3)):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = make_db(os.path.join(tmp, 'bench.db'), rows)
+            print(f"\n[{rows:,} rows]")
+            results = {}
+            for name, func in (('dataframe', dataframe_path), ('rows+orjson', rows_path)):
+                elapsed, peak = measure(func, db, repeat)
+                results[name] = (elapsed, peak)
+                print(f"  {name:<12} {elapsed * 1000:8.1f} ms/req  {rows / elapsed:12,.0f} rows/s  peak {peak / 2**20:7.1f} MiB")
+            base, fast = results['dataframe'], results['rows+orjson']
+            print(f"  speedup x{base[0] / fast[0]:.1f}, peak memory x{base[1] / fast[1]:.1f} lower")
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
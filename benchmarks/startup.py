@@ -0,0 +1,81 @@
+"""
+시작 시간 예산 측정
+
+새 파이썬 프로세스에서 다음을 측정하고 예산을 넘으면 종료 코드 1을 반환합니다.
+- import db_manager / import api 시간 (pandas가 import되지 않았는지도 확인)
+- lifespan 시작부터 첫 요청(GET /api/todos/) 응답까지의 시간
+
+실행:
+    python benchmarks/startup.py
+
+예산은 환경 변수로 조정할 수 있습니다.
+    IMPORT_BUDGET_MS (기본 1000), FIRST_REQUEST_BUDGET_MS (기본 500)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_BUDGET_MS = float(os.getenv('IMPORT_BUDGET_MS', 1000))
+FIRST_REQUEST_BUDGET_MS = float(os.getenv('FIRST_REQUEST_BUDGET_MS', 500))
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'pandas': 'pandas' in sys.modules}}))
+"""
+
+FIRST_REQUEST_SCRIPT = """
+import json, time
+from fastapi.testclient import TestClient
+import api
+start = time.perf_counter()
+with TestClient(api.app) as client:
+    response = client.get('/api/todos/')
+    elapsed = time.perf_counter() - start
+print(json.dumps({'ms': elapsed * 1000, 'status': response.status_code}))
+"""
+
+
+def run(script, env):
+    output = subprocess.run(
+        [sys.executable, '-c', script], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'startup.db')}"
+        env = dict(os.environ, DATABASE_URL=url, DB_AUTO_MIGRATE='0')
+        subprocess.run(
+            [sys.executable, '-c', f"from db_manager import TodoDB; TodoDB({url!r}).create_all()"],
+            cwd=ROOT, env=env, check=True
+        )
+
+        for module in ('db_manager', 'api'):
+            result = run(IMPORT_SCRIPT.format(module=module), env)
+            ok = result['ms'] <= IMPORT_BUDGET_MS and not result['pandas']
+            failed |= not ok
+            print(f"import {module:<11} {result['ms']:8.1f} ms  (budget {IMPORT_BUDGET_MS:.0f} ms)  "
+                  f"pandas loaded: {result['pandas']}  {'OK' if ok else 'OVER BUDGET'}")
+
+        result = run(FIRST_REQUEST_SCRIPT, env)
+        ok = result['ms'] <= FIRST_REQUEST_BUDGET_MS and result['status'] == 200
+        failed |= not ok
+        print(f"first request      {result['ms']:8.1f} ms  (budget {FIRST_REQUEST_BUDGET_MS:.0f} ms)  "
+              f"status {result['status']}  {'OK' if ok else 'OVER BUDGET'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,19 @@
 import os
-import pandas as pd
-from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Date, DateTime, Text
+import io
+import re
+import csv
+import json
+import time
+import base64
+from contextlib import contextmanager
+from operator import methodcaller
+from datetime import date, datetime, timedelta
+from sqlalchemy import create_engine, event, exc, make_url, select, insert, update, delete, and_, or_, case, func, table, column, literal_column, Column, Index, Integer, String, Date, DateTime, Text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 from sqlalchemy.ext.declarative import declarative_base
 from dotenv import load_dotenv
+from read_cache import ReadCache, MISSING
 
 # Load environment variables
 load_dotenv()
@@ -12,6 +21,116 @@ load_dotenv()
 # SQLAlchemy setup
 Base = declarative_base()
 
+def env_bool(name, default):
+    return os.getenv(name, str(default)).lower() in ('1', 'true', 'yes', 'on')
+
+class TimedQueuePool(QueuePool):
+    """커넥션 대기 시간과 타임아웃 횟수를 기록하는 QueuePool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.wait_count += 1
+            self.wait_total += elapsed
+            self.wait_max = max(self.wait_max, elapsed)
+
+def _pool_options():
+    # 커넥션 풀 설정 (.env)
+    return {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', 30)),
+        'pool_pre_ping': env_bool('DB_POOL_PRE_PING', True),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+    }
+
+def database_url():
+    # DATABASE_URL이 있으면 사용 (예: sqlite:///todo_local.db, postgresql://user:pw@host:5432/db)
+    url = os.getenv('DATABASE_URL')
+    if url:
+        return url
+    # 없으면 기존 .env의 PostgreSQL 설정으로 구성
+    db_host = os.getenv('DB_HOST')
+    db_port = os.getenv('DB_PORT')
+    db_username = os.getenv('DB_USERNAME')
+    db_password = os.getenv('DB_PASSWORD')
+    db_name = os.getenv('DB_NAME')
+    return f'postgresql://{db_username}:{db_password}@{db_host}:{db_port}/{db_name}'
+
+def _is_memory_sqlite(url):
+    return url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')
+
+def _engine_options(url, poolclass):
+    # 메모리 SQLite는 모든 세션이 하나의 커넥션을 공유해야 함
+    if _is_memory_sqlite(url):
+        return {'poolclass': StaticPool}
+    return {'poolclass': poolclass, **_pool_options()}
+
+def _sqlite_pragmas():
+    # 단일 노드 배포용 SQLite 튜닝 (.env로 조정 가능)
+    return {
+        'journal_mode': os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),
+        'synchronous': os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),
+        'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT', 5000)),
+        # 음수는 KiB 단위 (-65536 = 64MB)
+        'cache_size': int(os.getenv('SQLITE_CACHE_SIZE', -65536)),
+        'temp_store': 'MEMORY',
+    }
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in _sqlite_pragmas().items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+def configure_engine(engine):
+    # 백엔드별 커넥션 초기화 (동기 엔진 기준, 비동기 엔진은 sync_engine 전달)
+    if engine.url.get_backend_name() == 'sqlite':
+        event.listen(engine, 'connect', _apply_sqlite_pragmas)
+
+def migrate(url=None, revision='head'):
+    # alembic upgrade를 코드에서 실행 (배포 시에는 `alembic upgrade head` 사용)
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'alembic.ini'))
+    config.attributes['configure_logger'] = False
+    if url:
+        config.attributes['url'] = url
+    command.upgrade(config, revision)
+
+def _pool_stats(pool):
+    if not isinstance(pool, QueuePool):
+        return {'pool': type(pool).__name__}
+    stats = {
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        'overflow': pool.overflow(),
+    }
+    if isinstance(pool, TimedQueuePool):
+        stats.update({
+            'wait_count': pool.wait_count,
+            'wait_avg_ms': pool.wait_total / pool.wait_count * 1000 if pool.wait_count else 0.0,
+            'wait_max_ms': pool.wait_max * 1000,
+            'timeouts': pool.timeouts,
+        })
+    return stats
+
 class Todo(Base):
     __tablename__ = 'todos'
     
@@ -22,6 +141,14 @@ class Todo(Base):
     status = Column(String)
     created_at = Column(DateTime)
 
+    # 상태/우선순위 필터 + 마감일 정렬, 생성일 정렬용 인덱스
+    # 변경 시 migrations/versions에 마이그레이션 추가
+    __table_args__ = (
+        Index('ix_todos_status_due_date', 'status', 'due_date'),
+        Index('ix_todos_priority_due_date', 'priority', 'due_date'),
+        Index('ix_todos_created_at', 'created_at'),
+    )
+
 class Note(Base):
     __tablename__ = 'notes'
     
@@ -30,109 +157,872 @@ class Note(Base):
     content = Column(Text, nullable=False)
     created_at = Column(DateTime)
 
+    __table_args__ = (
+        Index('ix_notes_created_at', 'created_at'),
+    )
+
+class CollectionVersion(Base):
+    """
+    컬렉션('todos', 'notes')별 공유 세대 번호 - 쓰기 트랜잭션이 커밋된 직후 짧은 별도 트랜잭션에서 1 증가
+
+    프로세스별 ReadCache 버전과 달리 같은 DB를 쓰는 모든 프로세스(API 워커, Streamlit 앱, importer)의
+    쓰기가 반영되므로 ETag와 읽기 캐시 동기화에 사용.
+    쓰기 트랜잭션 안에서 올리면 같은 행 잠금 때문에 컬렉션의 모든 쓰기(대량 적재 chunk 포함)가 직렬화되므로
+    커밋 뒤에 올림 - 커밋과 증가 사이의 짧은 구간에는 다른 프로세스가 이전 세대 번호를 볼 수 있음.
+    """
+    __tablename__ = 'collection_versions'
+
+    name = Column(String(32), primary_key=True)
+    version = Column(Integer, nullable=False, server_default='0')
+
+COLLECTIONS = ('todos', 'notes')
+
+def _bump_version_statement(collection):
+    return (
+        update(CollectionVersion)
+        .where(CollectionVersion.name == collection)
+        .values(version=CollectionVersion.version + 1)
+        .returning(CollectionVersion.version)
+    )
+
+def _mark_changed(session, collection):
+    # 커밋 후 세대 번호를 올릴 컬렉션 기록 (가장 바깥 session_scope가 커밋 직후 처리)
+    session.info.setdefault('changed', set()).add(collection)
+
+def _version_statement(collection):
+    return select(CollectionVersion.version).where(CollectionVersion.name == collection)
+
+# create_all로 만들 때도 마이그레이션(0004)과 같이 컬렉션 행을 추가
+@event.listens_for(CollectionVersion.__table__, 'after_create')
+def _seed_collection_versions(target, connection, **kw):
+    connection.execute(insert(target), [{'name': name, 'version': 0} for name in COLLECTIONS])
+
+# 전문 검색(full-text search) 대상 필드
+# SQLite: FTS5 external content 테이블({table}_fts) + 트리거로 쓰기마다 색인 갱신
+# PostgreSQL: to_tsvector 식에 대한 GIN 인덱스 (쓰기 시 자동 갱신)
+# 변경 시 migrations/versions에 마이그레이션 추가
+SEARCH_FIELDS = {
+    'todos': ('task',),
+    'notes': ('title', 'content'),
+}
+
+def _search_document_sql(table_name):
+    return " || ' ' || ".join(f"coalesce({field}, '')" for field in SEARCH_FIELDS[table_name])
+
+def _search_vector_sql(table_name):
+    # PostgreSQL 인덱스 식과 검색 쿼리 식이 정확히 같아야 인덱스가 사용됨
+    return f"to_tsvector('simple', {_search_document_sql(table_name)})"
+
+def _sqlite_insert_trigger_sql(table_name):
+    fts = f"{table_name}_fts"
+    columns = ', '.join(SEARCH_FIELDS[table_name])
+    new_values = ', '.join(f"new.{field}" for field in SEARCH_FIELDS[table_name])
+    return (
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+    )
+
+def search_index_ddl(dialect_name, table_name):
+    fields = SEARCH_FIELDS[table_name]
+    if dialect_name == 'sqlite':
+        fts = f"{table_name}_fts"
+        columns = ', '.join(fields)
+        new_values = ', '.join(f"new.{field}" for field in fields)
+        old_values = ', '.join(f"old.{field}" for field in fields)
+        return [
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, content='{table_name}', content_rowid='id')",
+            _sqlite_insert_trigger_sql(table_name),
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END",
+            # 검색 대상 필드가 바뀐 경우에만 재색인 (상태 변경 등은 제외)
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {columns} ON {table_name} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+    if dialect_name == 'postgresql':
+        return [f"CREATE INDEX ix_{table_name}_search ON {table_name} USING GIN ({_search_vector_sql(table_name)})"]
+    return []
+
+def drop_search_index_ddl(dialect_name, table_name):
+    if dialect_name == 'sqlite':
+        return [f"DROP TABLE IF EXISTS {table_name}_fts"]
+    if dialect_name == 'postgresql':
+        return [f"DROP INDEX IF EXISTS ix_{table_name}_search"]
+    return []
+
+def is_search_index_table(name):
+    # FTS5 가상 테이블과 내부(shadow) 테이블 - 모델에 없으므로 autogenerate 비교에서 제외
+    return any(name.startswith(f"{table_name}_fts") for table_name in SEARCH_FIELDS)
+
+# create_all/drop_all로 테이블을 만들거나 지울 때 검색 색인도 함께 처리
+@event.listens_for(Base.metadata, 'after_create')
+def _create_search_indexes(target, connection, tables=(), **kw):
+    for created in tables:
+        if created.name in SEARCH_FIELDS:
+            for statement in search_index_ddl(connection.dialect.name, created.name):
+                connection.exec_driver_sql(statement)
+
+@event.listens_for(Base.metadata, 'before_drop')
+def _drop_search_indexes(target, connection, tables=(), **kw):
+    for dropped in tables:
+        if dropped.name in SEARCH_FIELDS:
+            for statement in drop_search_index_ddl(connection.dialect.name, dropped.name):
+                connection.exec_driver_sql(statement)
+
+# 행(tuple) 단위 조회 시 컬럼 순서
+TODO_COLUMNS = ('id', 'task', 'due_date', 'priority', 'status', 'created_at')
+NOTE_COLUMNS = ('id', 'title', 'content', 'created_at')
+
+# 목록 조회 시 정렬 가능한 필드 ('-' 접두사는 내림차순)
+TODO_ORDERING_FIELDS = ('id', 'due_date', 'created_at')
+NOTE_ORDERING_FIELDS = ('id', 'created_at')
+
+# 내보내기(export) 시 한 번에 가져올 행 수 - 메모리 사용량은 이 크기에 비례
+EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', 1000))
+
+def _export_statement(model, columns, filters=(), batch_size=None):
+    # yield_per: PostgreSQL에서는 서버 측 커서, 그 외에는 fetchmany로 batch_size씩 조회
+    return (
+        select(*[getattr(model, column) for column in columns])
+        .where(*filters)
+        .order_by(model.id)
+        .execution_options(yield_per=batch_size or EXPORT_BATCH_SIZE)
+    )
+
+def _encode_cursor(ordering, value, item_id):
+    if isinstance(value, date):
+        value = value.isoformat()
+    raw = json.dumps([ordering, value, item_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def _decode_cursor(cursor, ordering, sort_column):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        cursor_ordering, value, item_id = json.loads(raw)
+        if value is not None:
+            python_type = sort_column.type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is date:
+                value = date.fromisoformat(value)
+            else:
+                value = int(value)
+        item_id = int(item_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if cursor_ordering != ordering:
+        raise ValueError("Cursor does not match ordering")
+    return value, item_id
+
+def _seek_condition(sort_column, id_column, last_value, last_id, descending):
+    # keyset(seek) 조건: 마지막으로 반환한 (정렬값, id) 이후의 행만 조회
+    id_after = id_column < last_id if descending else id_column > last_id
+    if sort_column is id_column:
+        return id_after
+    # NULL은 정렬 방향과 관계없이 마지막에 위치
+    if last_value is None:
+        return and_(sort_column.is_(None), id_after)
+    value_after = sort_column < last_value if descending else sort_column > last_value
+    return or_(value_after, and_(sort_column == last_value, id_after), sort_column.is_(None))
+
+def _todo_filters(status=None, priority=None, due_from=None, due_to=None):
+    filters = []
+    if status:
+        filters.append(Todo.status == status)
+    if priority:
+        filters.append(Todo.priority == priority)
+    if due_from:
+        filters.append(Todo.due_date >= due_from)
+    if due_to:
+        filters.append(Todo.due_date <= due_to)
+    return filters
+
+def _page_statement(model, columns, ordering_fields, filters, ordering, limit, cursor):
+    descending = ordering.startswith('-')
+    field = ordering.lstrip('-')
+    if field not in ordering_fields:
+        raise ValueError(f"Invalid ordering field: {field}")
+
+    sort_column = getattr(model, field)
+    id_order = model.id.desc() if descending else model.id.asc()
+    if sort_column is model.id:
+        order_by = [id_order]
+    else:
+        sort_order = sort_column.desc() if descending else sort_column.asc()
+        order_by = [sort_order.nulls_last(), id_order]
+
+    stmt = select(*[getattr(model, column) for column in columns]).where(*filters)
+    if cursor:
+        last_value, last_id = _decode_cursor(cursor, ordering, sort_column)
+        stmt = stmt.where(_seek_condition(sort_column, model.id, last_value, last_id, descending))
+    # 다음 페이지 존재 여부 확인을 위해 limit + 1개 조회
+    return stmt.order_by(*order_by).limit(limit + 1)
+
+def _split_page(rows, columns, ordering, limit):
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = _encode_cursor(ordering, last[columns.index(ordering.lstrip('-'))], last[columns.index('id')])
+    return rows, next_cursor
+
+# 일괄 수정 시 변경 가능한 필드
+TODO_UPDATE_FIELDS = ('task', 'due_date', 'priority', 'status')
+NOTE_UPDATE_FIELDS = ('title', 'content')
+
+def _parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+def _bulk_todo_inserts(items):
+    # 일괄 생성 파라미터 - (index, 파라미터) 목록과 잘못된 항목의 결과 목록 반환
+    now = datetime.now()
+    params, errors = [], []
+    for index, item in enumerate(items):
+        try:
+            params.append((index, {
+                'task': item['task'],
+                'due_date': _parse_date(item['due_date']),
+                'priority': item['priority'],
+                'status': item.get('status') or 'Pending',
+                'created_at': now
+            }))
+        except (KeyError, TypeError, ValueError) as e:
+            errors.append({'index': index, 'status': 'error', 'detail': str(e)})
+    return params, errors
+
+def _bulk_note_inserts(items):
+    now = datetime.now()
+    params, errors = [], []
+    for index, item in enumerate(items):
+        try:
+            params.append((index, {
+                'title': item.get('title') or 'Untitled Note',
+                'content': item['content'],
+                'created_at': now
+            }))
+        except (KeyError, TypeError) as e:
+            errors.append({'index': index, 'status': 'error', 'detail': str(e)})
+    return params, errors
+
+def _bulk_updates(changes, fields, existing_ids):
+    # 일괄 수정 파라미터 - 없는 id나 잘못된 값은 결과에만 기록
+    params, results = [], []
+    for index, change in enumerate(changes):
+        item_id = change.get('id')
+        if item_id not in existing_ids:
+            results.append({'index': index, 'id': item_id, 'status': 'not_found'})
+            continue
+        values = {field: change[field] for field in fields if change.get(field) is not None}
+        try:
+            if 'due_date' in values:
+                values['due_date'] = _parse_date(values['due_date'])
+        except (TypeError, ValueError) as e:
+            results.append({'index': index, 'id': item_id, 'status': 'error', 'detail': str(e)})
+            continue
+        if values:
+            params.append({'id': item_id, **values})
+        results.append({'index': index, 'id': item_id, 'status': 'updated'})
+    return params, results
+
+def _bulk_insert_results(params, ids, errors):
+    results = errors + [
+        {'index': index, 'id': item_id, 'status': 'created'}
+        for (index, _), item_id in zip(params, ids)
+    ]
+    return sorted(results, key=lambda result: result['index'])
+
+def _bulk_delete_results(ids, deleted):
+    return [
+        {'index': index, 'id': item_id, 'status': 'deleted' if item_id in deleted else 'not_found'}
+        for index, item_id in enumerate(ids)
+    ]
+
+def _stats_statement(today):
+    # 통계용 단일 집계 쿼리 - (status, priority) 그룹별 개수/지연/이번 주 마감 개수
+    week_end = today + timedelta(days=6 - today.weekday())
+    open_todo = Todo.status != 'Completed'
+    return select(
+        Todo.status,
+        Todo.priority,
+        func.count(),
+        func.sum(case((and_(open_todo, Todo.due_date < today), 1), else_=0)),
+        func.sum(case((and_(open_todo, Todo.due_date >= today, Todo.due_date <= week_end), 1), else_=0)),
+    ).group_by(Todo.status, Todo.priority)
+
+def _stats_from_rows(rows):
+    by_status, by_priority = {}, {}
+    total = overdue = due_this_week = 0
+    for status, priority, count, group_overdue, group_due in rows:
+        by_status[status] = by_status.get(status, 0) + count
+        by_priority[priority] = by_priority.get(priority, 0) + count
+        total += count
+        overdue += group_overdue or 0
+        due_this_week += group_due or 0
+    completed = by_status.get('Completed', 0)
+    return {
+        'total': total,
+        'completed': completed,
+        'pending': total - completed,
+        'completion_rate': round(completed / total * 100, 1) if total else 0.0,
+        'by_status': by_status,
+        'by_priority': by_priority,
+        'overdue': overdue,
+        'due_this_week': due_this_week,
+    }
+
+# 검색 결과 강조 표시
+SEARCH_HIGHLIGHT = ('<mark>', '</mark>')
+
+def _search_terms(query):
+    # 검색어를 단어 단위로 분리 (FTS 쿼리 문법 문자는 모두 제거)
+    return re.findall(r'\w+', query or '')
+
+def _search_statement(model, columns, dialect_name, terms, limit):
+    """
+    전문 검색 쿼리 - 모든 단어(접두어 일치)를 포함하는 행을 관련도 순으로 조회
+
+    반환 행: columns + rank(클수록 관련도 높음) + snippet(검색어를 강조한 일부 내용)
+    """
+    table_name = model.__tablename__
+    selected = [getattr(model, column) for column in columns]
+    start, stop = SEARCH_HIGHLIGHT
+    if dialect_name == 'sqlite':
+        fts = table(f"{table_name}_fts", column('rowid'))
+        fts_column = literal_column(f"{table_name}_fts")
+        match = ' '.join('"%s"*' % term for term in terms)
+        bm25 = func.bm25(fts_column)
+        return (
+            select(*selected, (-bm25).label('rank'),
+                   func.snippet(fts_column, -1, start, stop, '…', 16).label('snippet'))
+            .join_from(model, fts, fts.c.rowid == model.id)
+            .where(fts_column.op('MATCH')(match))
+            .order_by(bm25, model.id)
+            .limit(limit)
+        )
+    if dialect_name == 'postgresql':
+        vector = literal_column(_search_vector_sql(table_name))
+        tsquery = func.to_tsquery(literal_column("'simple'"), ' & '.join(f"{term}:*" for term in terms))
+        rank = func.ts_rank(vector, tsquery)
+        snippet = func.ts_headline(
+            literal_column("'simple'"), literal_column(_search_document_sql(table_name)), tsquery,
+            f"StartSel={start}, StopSel={stop}, MaxWords=16, MinWords=5"
+        )
+        return (
+            select(*selected, rank.label('rank'), snippet.label('snippet'))
+            .where(vector.op('@@')(tsquery))
+            .order_by(rank.desc(), model.id)
+            .limit(limit)
+        )
+    raise ValueError(f"Full-text search is not supported on {dialect_name}")
+
+def _search_results(rows, columns):
+    return [
+        {**dict(zip(columns, row[:len(columns)])), 'rank': float(row.rank), 'snippet': row.snippet}
+        for row in rows
+    ]
+
+# 대량 적재(load_rows) 시 컬렉션별 모델과 컬럼 순서 (PostgreSQL COPY 컬럼 목록)
+LOAD_MODELS = {
+    'todos': Todo,
+    'notes': Note,
+}
+LOAD_COLUMNS = {
+    'todos': ('task', 'due_date', 'priority', 'status', 'created_at'),
+    'notes': ('title', 'content', 'created_at'),
+}
+
+def _copy_statement(collection):
+    return f"COPY {collection} ({', '.join(LOAD_COLUMNS[collection])}) FROM STDIN WITH (FORMAT csv)"
+
+def _copy_buffer(rows):
+    # COPY ... (FORMAT csv) 입력 - None은 따옴표 없는 빈 값(NULL)으로 기록됨
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    return buffer
+
+def _sqlite_load_statements(collection):
+    """
+    SQLite 대량 적재 순서 - (색인 트리거 제거, 마지막 id 조회, 일괄 색인, 트리거 복원) SQL
+
+    행 단위 색인 트리거 대신 적재한 행을 한 번에 색인합니다. pysqlite/aiosqlite는 DDL 앞에
+    BEGIN을 보내지 않으므로 호출하는 쪽에서 먼저 BEGIN IMMEDIATE로 쓰기 트랜잭션을 열어야 합니다
+    (_sqlite_begin_write). 그러면 DROP TRIGGER도 같은 트랜잭션에 포함되어 실패 시 rollback으로
+    트리거가 복원되고, 쓰기 잠금을 잡은 뒤 max(id)를 읽으므로 그 사이 다른 연결이 추가한 행 없이
+    적재한 행만 그보다 큰 id를 가집니다.
+    """
+    fields = ', '.join(SEARCH_FIELDS[collection])
+    return (
+        f"DROP TRIGGER {collection}_fts_ai",
+        f"SELECT coalesce(max(id), 0) FROM {collection}",
+        f"INSERT INTO {collection}_fts (rowid, {fields}) SELECT id, {fields} FROM {collection} WHERE id > ?",
+        _sqlite_insert_trigger_sql(collection),
+    )
+
+def _sqlite_begin_write(in_transaction):
+    # 드라이버가 이미 트랜잭션을 시작했으면 그대로 사용, 아니면 쓰기 잠금을 잡는 BEGIN IMMEDIATE
+    return None if in_transaction else "BEGIN IMMEDIATE"
+
+def _sqlite_insert_statement(collection):
+    columns = LOAD_COLUMNS[collection]
+    return f"INSERT INTO {collection} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+# SQLAlchemy의 SQLite Date/DateTime 저장 형식과 같은 문자열 (YYYY-MM-DD, YYYY-MM-DD HH:MM:SS.ffffff)
+_SQLITE_CONVERTERS = {
+    Date: methodcaller('isoformat'),
+    DateTime: methodcaller('isoformat', ' ', 'microseconds'),
+}
+
+def _memoized(convert):
+    converted = {None: None}
+    def convert_cached(value):
+        if value in converted:
+            return converted[value]
+        result = converted[value] = convert(value)
+        return result
+    return convert_cached
+
+def _sqlite_load_params(rows, collection):
+    # SQLAlchemy 타입 변환을 거치지 않고 드라이버에 tuple로 직접 전달 (대량 적재 시 주요 비용)
+    # 열 단위로 바꿔 날짜 열만 변환 - 같은 날짜가 반복되므로 변환 결과를 재사용
+    table = LOAD_MODELS[collection].__table__
+    columns = list(zip(*rows))
+    for index, column in enumerate(LOAD_COLUMNS[collection]):
+        convert = _SQLITE_CONVERTERS.get(type(table.c[column].type))
+        if convert:
+            columns[index] = list(map(_memoized(convert), columns[index]))
+    return list(zip(*columns))
+
+def _todo_to_dict(todo):
+    return {
+        'id': todo.id,
+        'task': todo.task,
+        'due_date': todo.due_date,
+        'priority': todo.priority,
+        'status': todo.status,
+        'created_at': todo.created_at
+    }
+
+def _note_to_dict(note):
+    return {
+        'id': note.id,
+        'title': note.title,
+        'content': note.content,
+        'created_at': note.created_at
+    }
+
 class TodoDB:
-    def __init__(self):
-        # PostgreSQL connection string from .env
-        db_host = os.getenv('DB_HOST')
-        db_port = os.getenv('DB_PORT')
-        db_username = os.getenv('DB_USERNAME')
-        db_password = os.getenv('DB_PASSWORD')
-        db_name = os.getenv('DB_NAME')
+    def __init__(self, url=None):
+        # 백엔드는 DATABASE_URL로 선택 (없으면 .env의 PostgreSQL 설정)
+        url = make_url(url or database_url())
         
         # Create SQLAlchemy engine for the database
-        self.engine = create_engine(
-            f'postgresql://{db_username}:{db_password}@{db_host}:{db_port}/{db_name}'
-        )
+        # 커넥션 풀 설정도 .env에서 읽음
+        self.engine = create_engine(url, **_engine_options(url, TimedQueuePool))
+        configure_engine(self.engine)
         
-        # Create tables if not exist
-        Base.metadata.create_all(self.engine)
+        # 테이블 생성/변경은 마이그레이션으로 처리 (alembic upgrade head 또는 migrate())
         
         # Create session
         self.Session = sessionmaker(bind=self.engine)
+        
+        # 목록/단건 조회 캐시 - 모든 쓰기 메서드에서 무효화
+        self.cache = ReadCache()
 
-    def add_todo(self, task, due_date, priority):
-        session = self.Session()
-        new_todo = Todo(
-            task=task, 
-            due_date=datetime.strptime(due_date, "%Y-%m-%d").date(), 
-            priority=priority, 
-            status='Pending', 
-            created_at=datetime.now()
-        )
-        session.add(new_todo)
-        session.commit()
-        session.close()
+    def create_all(self):
+        # 마이그레이션 없이 현재 모델로 테이블 생성 (메모리 DB, 테스트, 벤치마크용)
+        Base.metadata.create_all(self.engine)
 
-    def get_todos(self):
-        session = self.Session()
-        todos = session.query(Todo).all()
-        df = pd.DataFrame([
-            {
-                'id': todo.id, 
-                'task': todo.task, 
-                'due_date': todo.due_date, 
-                'priority': todo.priority, 
-                'status': todo.status, 
-                'created_at': todo.created_at
-            } for todo in todos
-        ])
-        session.close()
-        return df
-
-    def update_status(self, todo_id, new_status):
-        session = self.Session()
-        todo = session.query(Todo).filter(Todo.id == todo_id).first()
-        if todo:
-            todo.status = new_status
-            session.commit()
-        session.close()
+    @contextmanager
+    def session_scope(self, session=None):
+        """
+        세션 컨텍스트 - 정상 종료 시 commit, 예외 시 rollback
 
-    def delete_todo(self, todo_id):
-        session = self.Session()
-        todo = session.query(Todo).filter(Todo.id == todo_id).first()
-        if todo:
-            session.delete(todo)
-            session.commit()
-        session.close()
+        session이 주어지면(요청 단위 세션) 그대로 사용하고 닫지 않음.
+        주어지지 않으면 새 세션을 만들고 반드시 close.
+        다른 session_scope 안에서 같은 세션으로 다시 열면 commit/rollback은 바깥 scope가 한 번만 실행
+        (여러 쓰기 메서드를 한 트랜잭션으로 묶을 때 사용).
+        """
+        owned = session is None
+        if owned:
+            session = self.Session()
+        nested = session.info.get('in_scope', False)
+        session.info['in_scope'] = True
+        try:
+            yield session
+            if not nested:
+                session.commit()
+                self._bump_versions(session.info.pop('changed', ()))
+        except Exception:
+            if not nested:
+                session.info.pop('changed', None)
+                session.rollback()
+            raise
+        finally:
+            if not nested:
+                session.info['in_scope'] = False
+            if owned:
+                session.close()
 
-    def add_note(self, title, content):
+    def request_session(self):
+        # FastAPI Depends용 제너레이터 - 요청마다 세션 하나, 요청이 끝나면 close
         session = self.Session()
-        new_note = Note(
-            title=title,
-            content=content, 
-            created_at=datetime.now()
-        )
-        session.add(new_note)
-        session.commit()
-        session.close()
+        try:
+            yield session
+        finally:
+            session.close()
 
-    def get_notes(self):
-        session = self.Session()
-        notes = session.query(Note).all()
-        df = pd.DataFrame([
-            {
-                'id': note.id,
-                'title': note.title, 
-                'content': note.content, 
-                'created_at': note.created_at
-            } for note in notes
-        ])
-        session.close()
-        return df
-
-    def update_note(self, note_id, new_title, new_content):
-        session = self.Session()
-        note = session.query(Note).filter(Note.id == note_id).first()
-        if note:
-            note.title = new_title
-            note.content = new_content
-            session.commit()
-        session.close()
-
-    def delete_note(self, note_id):
-        session = self.Session()
-        note = session.query(Note).filter(Note.id == note_id).first()
-        if note:
-            session.delete(note)
-            session.commit()
-        session.close()
+    def pool_stats(self):
+        return _pool_stats(self.engine.pool)
+
+    def _bump_versions(self, collections):
+        # 커밋된 쓰기의 세대 번호 증가 - 짧은 별도 트랜잭션, 이 프로세스의 캐시에는 바로 반영
+        if not collections:
+            return
+        with self.engine.begin() as connection:
+            versions = {name: connection.execute(_bump_version_statement(name)).scalar() for name in sorted(collections)}
+        for name, version in versions.items():
+            self.cache.sync(name, version)
+
+    def collection_version(self, collection, session=None):
+        # DB의 공유 세대 번호 - 다른 프로세스의 쓰기로 바뀌었으면 이 프로세스의 캐시도 무효화
+        # 최근(READ_CACHE_SYNC_INTERVAL 안)에 확인한 값이 있으면 DB를 조회하지 않음
+        version = self.cache.generation(collection)
+        if version is MISSING:
+            with self.session_scope(session) as session:
+                version = session.execute(_version_statement(collection)).scalar() or 0
+            version = self.cache.sync(collection, version)
+        return version
+
+    def add_todo(self, task, due_date, priority, session=None):
+        with self.session_scope(session) as session:
+            new_todo = Todo(
+                task=task, 
+                due_date=datetime.strptime(due_date, "%Y-%m-%d").date(), 
+                priority=priority, 
+                status='Pending', 
+                created_at=datetime.now()
+            )
+            session.add(new_todo)
+            # flush로 INSERT 후 같은 트랜잭션 안에서 저장된 행을 반환
+            session.flush()
+            result = _todo_to_dict(new_todo)
+            _mark_changed(session, 'todos')
+        self.cache.invalidate('todos')
+        return result
+
+    def get_todos(self, session=None):
+        with self.session_scope(session) as session:
+            todos = session.query(Todo).all()
+            rows = [_todo_to_dict(todo) for todo in todos]
+        # pandas는 무거우므로 DataFrame이 필요한 경우에만 import
+        import pandas as pd
+        return pd.DataFrame(rows)
+
+    def get_todo_rows(self, session=None):
+        # DataFrame을 거치지 않는 빠른 조회 - TODO_COLUMNS 순서의 tuple 목록 반환
+        with self.session_scope(session) as session:
+            return session.execute(
+                select(*[getattr(Todo, column) for column in TODO_COLUMNS]).order_by(Todo.id)
+            ).all()
+
+    def iter_todo_rows(self, status=None, priority=None, due_from=None, due_to=None, batch_size=None):
+        """
+        할 일 전체를 batch_size개씩 스트리밍 조회 (내보내기용)
+
+        TODO_COLUMNS 순서의 tuple 목록을 batch 단위로 yield - 전체를 메모리에 올리지 않음
+        """
+        filters = _todo_filters(status, priority, due_from, due_to)
+        yield from self._iter_rows(_export_statement(Todo, TODO_COLUMNS, filters, batch_size))
+
+    def _iter_rows(self, stmt):
+        # 제너레이터가 끝날 때(또는 닫힐 때)까지 세션 유지
+        with self.session_scope() as session:
+            for partition in session.execute(stmt).partitions():
+                yield partition
+
+    def get_todo_page(self, status=None, priority=None, due_from=None, due_to=None,
+                      ordering='id', limit=100, cursor=None, session=None):
+        # 필터/정렬/페이지네이션을 모두 SQL로 처리 - (rows, next_cursor) 반환
+        key = ('page', status, priority, due_from, due_to, ordering, limit, cursor)
+        version = self.cache.version('todos')
+        page = self.cache.get('todos', key, version)
+        if page is not MISSING:
+            return page
+        filters = _todo_filters(status, priority, due_from, due_to)
+        stmt = _page_statement(Todo, TODO_COLUMNS, TODO_ORDERING_FIELDS, filters, ordering, limit, cursor)
+        with self.session_scope(session) as session:
+            rows = session.execute(stmt).all()
+        page = _split_page(rows, TODO_COLUMNS, ordering, limit)
+        self.cache.set('todos', key, version, page)
+        return page
+
+    def stats(self, session=None):
+        """
+        할 일 통계 - 집계 쿼리 한 번으로 계산
+
+        반환: total, completed, pending, completion_rate(%), by_status, by_priority,
+              overdue(마감일 지난 미완료), due_this_week(오늘~이번 주 일요일 마감 미완료)
+        """
+        today = date.today()
+        key = ('stats', today)
+        version = self.cache.version('todos')
+        result = self.cache.get('todos', key, version)
+        if result is not MISSING:
+            return result
+        with self.session_scope(session) as session:
+            rows = session.execute(_stats_statement(today)).all()
+        result = _stats_from_rows(rows)
+        self.cache.set('todos', key, version, result)
+        return result
+
+    def search_todos(self, query, limit=20, session=None):
+        """
+        할 일 전문 검색 - task 대상, 관련도 순
+
+        반환: TODO_COLUMNS + rank, snippet을 가진 dict 목록
+        """
+        return self._search(Todo, TODO_COLUMNS, query, limit, session)
+
+    def get_todo(self, todo_id, session=None):
+        # 기본 키 조회 - 테이블 크기와 무관
+        version = self.cache.version('todos')
+        result = self.cache.get('todos', todo_id, version)
+        if result is not MISSING:
+            return result
+        with self.session_scope(session) as session:
+            todo = session.get(Todo, todo_id)
+            result = _todo_to_dict(todo) if todo else None
+        self.cache.set('todos', todo_id, version, result)
+        return result
+
+    def exists(self, item_id, model=Todo, session=None):
+        with self.session_scope(session) as session:
+            return session.query(model.id).filter(model.id == item_id).first() is not None
+
+    def update_status(self, todo_id, new_status, session=None):
+        # UPDATE ... RETURNING - 변경된 행을 반환, 없으면 None
+        with self.session_scope(session) as session:
+            todo = session.execute(
+                update(Todo).where(Todo.id == todo_id).values(status=new_status).returning(Todo)
+            ).scalar_one_or_none()
+            result = _todo_to_dict(todo) if todo else None
+            _mark_changed(session, 'todos')
+        self.cache.invalidate('todos')
+        return result
+
+    def delete_todo(self, todo_id, session=None):
+        with self.session_scope(session) as session:
+            todo = session.query(Todo).filter(Todo.id == todo_id).first()
+            if todo:
+                session.delete(todo)
+            _mark_changed(session, 'todos')
+        self.cache.invalidate('todos')
+
+    def add_todos(self, items, session=None):
+        """
+        할 일 일괄 생성 - 한 트랜잭션에서 executemany INSERT ... RETURNING
+
+        items: task, due_date, priority, (status) 키를 가진 dict 목록
+        반환: 항목별 결과 목록 (created / error)
+        """
+        params, errors = _bulk_todo_inserts(items)
+        return _bulk_insert_results(params, self._bulk_insert(Todo, params, session), errors)
+
+    def load_rows(self, collection, rows, session=None):
+        """
+        대량 적재 - 검증된 파라미터 목록을 한 트랜잭션으로 기록 (importer.py에서 사용)
+
+        PostgreSQL(psycopg2)은 COPY FROM STDIN, 그 외에는 RETURNING 없는 executemany INSERT
+        SQLite는 드라이버에 tuple을 직접 넘기고, 행 단위 전문 검색 색인 트리거 대신 적재 후 한 번에 색인
+        rows: LOAD_COLUMNS[collection] 순서의 tuple 목록
+        반환: 기록한 행 수
+        """
+        if not rows:
+            return 0
+        table = LOAD_MODELS[collection].__table__
+        with self.session_scope(session) as session:
+            connection = session.connection()
+            if connection.dialect.driver == 'psycopg2':
+                cursor = connection.connection.cursor()
+                try:
+                    cursor.copy_expert(_copy_statement(collection), _copy_buffer(rows))
+                finally:
+                    cursor.close()
+            elif connection.dialect.name == 'sqlite':
+                drop_trigger, last_id, catch_up, create_trigger = _sqlite_load_statements(collection)
+                begin = _sqlite_begin_write(connection.connection.driver_connection.in_transaction)
+                if begin:
+                    connection.exec_driver_sql(begin)
+                connection.exec_driver_sql(drop_trigger)
+                start_id = connection.exec_driver_sql(last_id).scalar()
+                connection.exec_driver_sql(_sqlite_insert_statement(collection), _sqlite_load_params(rows, collection))
+                connection.exec_driver_sql(catch_up, (start_id,))
+                connection.exec_driver_sql(create_trigger)
+            else:
+                columns = LOAD_COLUMNS[collection]
+                connection.execute(insert(table), [dict(zip(columns, row)) for row in rows])
+            _mark_changed(session, collection)
+        self.cache.invalidate(collection)
+        return len(rows)
+
+    def update_todos(self, changes, session=None):
+        """
+        할 일 일괄 수정 - 한 트랜잭션에서 기본 키 기준 executemany UPDATE
+
+        changes: id와 변경할 필드(task, due_date, priority, status)를 가진 dict 목록
+        반환: 항목별 결과 목록 (updated / not_found / error)
+        """
+        return self._bulk_update(Todo, changes, TODO_UPDATE_FIELDS, session)
+
+    def delete_todos(self, todo_ids, session=None):
+        # 할 일 일괄 삭제 - DELETE ... WHERE id IN (...) 한 번
+        return _bulk_delete_results(todo_ids, self._bulk_delete(Todo, todo_ids, session))
+
+    def _bulk_insert(self, model, params, session=None):
+        if not params:
+            return []
+        with self.session_scope(session) as session:
+            ids = session.execute(
+                insert(model).returning(model.id, sort_by_parameter_order=True),
+                [values for _, values in params]
+            ).scalars().all()
+            _mark_changed(session, model.__tablename__)
+        self.cache.invalidate(model.__tablename__)
+        return ids
+
+    def _bulk_update(self, model, changes, fields, session=None):
+        ids = {change.get('id') for change in changes}
+        with self.session_scope(session) as session:
+            existing_ids = set(session.execute(select(model.id).where(model.id.in_(ids))).scalars())
+            params, results = _bulk_updates(changes, fields, existing_ids)
+            if params:
+                session.execute(update(model), params)
+            _mark_changed(session, model.__tablename__)
+        self.cache.invalidate(model.__tablename__)
+        return results
+
+    def _bulk_delete(self, model, ids, session=None):
+        with self.session_scope(session) as session:
+            deleted = set(session.execute(
+                delete(model).where(model.id.in_(ids)).returning(model.id)
+            ).scalars())
+            _mark_changed(session, model.__tablename__)
+        self.cache.invalidate(model.__tablename__)
+        return deleted
+
+    def add_note(self, title, content, session=None):
+        with self.session_scope(session) as session:
+            new_note = Note(
+                title=title,
+                content=content, 
+                created_at=datetime.now()
+            )
+            session.add(new_note)
+            session.flush()
+            result = _note_to_dict(new_note)
+            _mark_changed(session, 'notes')
+        self.cache.invalidate('notes')
+        return result
+
+    def get_notes(self, session=None):
+        with self.session_scope(session) as session:
+            notes = session.query(Note).all()
+            rows = [_note_to_dict(note) for note in notes]
+        import pandas as pd
+        return pd.DataFrame(rows)
+
+    def get_note_rows(self, session=None):
+        # NOTE_COLUMNS 순서의 tuple 목록 반환
+        with self.session_scope(session) as session:
+            return session.execute(
+                select(*[getattr(Note, column) for column in NOTE_COLUMNS]).order_by(Note.id)
+            ).all()
+
+    def iter_note_rows(self, batch_size=None):
+        # 노트 전체를 batch_size개씩 스트리밍 조회 (NOTE_COLUMNS 순서의 tuple 목록을 yield)
+        yield from self._iter_rows(_export_statement(Note, NOTE_COLUMNS, (), batch_size))
+
+    def get_note_page(self, ordering='id', limit=100, cursor=None, session=None):
+        key = ('page', ordering, limit, cursor)
+        version = self.cache.version('notes')
+        page = self.cache.get('notes', key, version)
+        if page is not MISSING:
+            return page
+        stmt = _page_statement(Note, NOTE_COLUMNS, NOTE_ORDERING_FIELDS, [], ordering, limit, cursor)
+        with self.session_scope(session) as session:
+            rows = session.execute(stmt).all()
+        page = _split_page(rows, NOTE_COLUMNS, ordering, limit)
+        self.cache.set('notes', key, version, page)
+        return page
+
+    def search_notes(self, query, limit=20, session=None):
+        # 노트 전문 검색 - title, content 대상
+        return self._search(Note, NOTE_COLUMNS, query, limit, session)
+
+    def _search(self, model, columns, query, limit, session=None):
+        terms = _search_terms(query)
+        if not terms:
+            return []
+        collection = model.__tablename__
+        key = ('search', tuple(terms), limit)
+        version = self.cache.version(collection)
+        results = self.cache.get(collection, key, version)
+        if results is not MISSING:
+            return results
+        stmt = _search_statement(model, columns, self.engine.dialect.name, terms, limit)
+        with self.session_scope(session) as session:
+            results = _search_results(session.execute(stmt).all(), columns)
+        self.cache.set(collection, key, version, results)
+        return results
+
+    def get_note(self, note_id, session=None):
+        version = self.cache.version('notes')
+        result = self.cache.get('notes', note_id, version)
+        if result is not MISSING:
+            return result
+        with self.session_scope(session) as session:
+            note = session.get(Note, note_id)
+            result = _note_to_dict(note) if note else None
+        self.cache.set('notes', note_id, version, result)
+        return result
+
+    def update_note(self, note_id, new_title, new_content, session=None):
+        with self.session_scope(session) as session:
+            note = session.execute(
+                update(Note).where(Note.id == note_id).values(title=new_title, content=new_content).returning(Note)
+            ).scalar_one_or_none()
+            result = _note_to_dict(note) if note else None
+            _mark_changed(session, 'notes')
+        self.cache.invalidate('notes')
+        return result
+
+    def delete_note(self, note_id, session=None):
+        with self.session_scope(session) as session:
+            note = session.query(Note).filter(Note.id == note_id).first()
+            if note:
+                session.delete(note)
+            _mark_changed(session, 'notes')
+        self.cache.invalidate('notes')
+
+    def add_notes(self, items, session=None):
+        # 노트 일괄 생성 - items: title, content 키를 가진 dict 목록
+        params, errors = _bulk_note_inserts(items)
+        return _bulk_insert_results(params, self._bulk_insert(Note, params, session), errors)
+
+    def update_notes(self, changes, session=None):
+        # 노트 일괄 수정 - changes: id와 title/content를 가진 dict 목록
+        return self._bulk_update(Note, changes, NOTE_UPDATE_FIELDS, session)
+
+    def delete_notes(self, note_ids, session=None):
+        return _bulk_delete_results(note_ids, self._bulk_delete(Note, note_ids, session))
+
+_db = None
+
+def get_db():
+    # 지연 생성 싱글턴 - import 시점이 아닌 첫 사용 시 엔진 생성
+    global _db
+    if _db is None:
+        _db = TodoDB()
+    return _db
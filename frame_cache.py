@@ -0,0 +1,155 @@
+import os
+import time
+import threading
+
+from db_manager import TODO_COLUMNS, NOTE_COLUMNS, TODO_UPDATE_FIELDS, _parse_date
+
+class FrameCache:
+    """
+    Streamlit 앱용 DataFrame 캐시
+
+    할 일/노트 목록을 처음 한 번만 DB에서 읽어 id 인덱스 DataFrame으로 보관하고,
+    이 객체를 통한 쓰기는 DB에 반영한 뒤 캐시된 DataFrame에 해당 행만 추가/수정/삭제합니다.
+    다른 프로세스(API 서버 등)의 변경은 ttl(APP_FRAME_TTL, 기본 300초)이 지나거나
+    refresh()를 호출하면 다시 읽어옵니다.
+
+    여러 세션이 같은 객체를 공유하므로 DataFrame은 제자리에서 바꾸지 않고
+    새 DataFrame으로 교체합니다 (이미 받아간 DataFrame은 변하지 않음).
+    """
+
+    def __init__(self, db, ttl=None):
+        self.db = db
+        self.ttl = ttl if ttl is not None else float(os.getenv('APP_FRAME_TTL', 300))
+        self._frames = {}
+        self._lock = threading.Lock()
+
+    def _load(self, name):
+        import pandas as pd
+        if name == 'todos':
+            rows, columns = self.db.get_todo_rows(), TODO_COLUMNS
+        else:
+            rows, columns = self.db.get_note_rows(), NOTE_COLUMNS
+        return pd.DataFrame.from_records(rows, columns=columns, index='id')
+
+    def _frame(self, name):
+        with self._lock:
+            entry = self._frames.get(name)
+            if entry is None or entry[0] < time.monotonic():
+                entry = (time.monotonic() + self.ttl, self._load(name))
+                self._frames[name] = entry
+            return entry[1]
+
+    def _patch(self, name, apply):
+        # 캐시된 DataFrame이 있을 때만 변경 내용 반영 (없으면 다음 조회 시 새로 읽음)
+        with self._lock:
+            entry = self._frames.get(name)
+            if entry is not None:
+                self._frames[name] = (entry[0], apply(entry[1]))
+
+    def _upsert(self, name, record):
+        if record is None:
+            return
+        record = dict(record)
+        item_id = record.pop('id')
+
+        def apply(frame):
+            frame = frame.copy()
+            frame.loc[item_id] = [record[column] for column in frame.columns]
+            return frame
+        self._patch(name, apply)
+
+    def _update_rows(self, name, changes):
+        # changes: id와 변경된 값만 가진 dict 목록
+        def apply(frame):
+            frame = frame.copy()
+            for change in changes:
+                values = {column: value for column, value in change.items() if column != 'id'}
+                frame.loc[change['id'], list(values)] = list(values.values())
+            return frame
+        self._patch(name, apply)
+
+    def _drop(self, name, ids):
+        self._patch(name, lambda frame: frame.drop(index=list(ids), errors='ignore'))
+
+    def refresh(self):
+        with self._lock:
+            self._frames.clear()
+
+    # 조회 - id를 일반 열로 되돌린 DataFrame 반환 (기존 get_todos()/get_notes()와 같은 모양)
+    def todos(self, status=None):
+        frame = self._frame('todos')
+        if status:
+            frame = frame[frame['status'] == status]
+        return frame.reset_index()
+
+    def notes(self):
+        return self._frame('notes').reset_index()
+
+    # 쓰기 - DB 반영 후 캐시된 DataFrame 갱신
+    def add_todo(self, task, due_date, priority):
+        todo = self.db.add_todo(task, due_date, priority)
+        self._upsert('todos', todo)
+        return todo
+
+    def update_status(self, todo_id, new_status):
+        # DataFrame에서 꺼낸 id는 numpy 정수이므로 int로 변환
+        todo_id = int(todo_id)
+        todo = self.db.update_status(todo_id, new_status)
+        self._upsert('todos', todo)
+        return todo
+
+    def delete_todo(self, todo_id):
+        todo_id = int(todo_id)
+        self.db.delete_todo(todo_id)
+        self._drop('todos', [todo_id])
+
+    def save_todos(self, changes, delete_ids):
+        """
+        할 일 일괄 수정 + 삭제 - 한 트랜잭션(db.session_scope)으로 반영 (그리드의 "변경 사항 저장")
+
+        changes: id와 변경할 필드를 가진 dict 목록 (due_date는 'YYYY-MM-DD' 문자열)
+        delete_ids: 삭제할 id 목록
+        반환: (TodoDB.update_todos 결과 목록, TodoDB.delete_todos 결과 목록) - 항목별 status 포함
+        """
+        changes = [{**change, 'id': int(change['id'])} for change in changes]
+        delete_ids = [int(todo_id) for todo_id in delete_ids]
+        with self.db.session_scope() as session:
+            update_results = self.db.update_todos(changes, session=session) if changes else []
+            delete_results = self.db.delete_todos(delete_ids, session=session) if delete_ids else []
+        # 커밋 전에 다른 세션이 읽어 간 값이 캐시에 남지 않도록 커밋 후 한 번 더 무효화
+        self.db.cache.invalidate('todos')
+
+        updated = []
+        for result in update_results:
+            if result['status'] != 'updated':
+                continue
+            change = changes[result['index']]
+            values = {field: change[field] for field in TODO_UPDATE_FIELDS if change.get(field) is not None}
+            if 'due_date' in values:
+                values['due_date'] = _parse_date(values['due_date'])
+            updated.append({'id': change['id'], **values})
+        self._update_rows('todos', updated)
+        self._drop('todos', delete_ids)
+        return update_results, delete_results
+
+    def update_todos(self, changes):
+        return self.save_todos(changes, [])[0]
+
+    def delete_todos(self, todo_ids):
+        return self.save_todos([], todo_ids)[1]
+
+    def add_note(self, title, content):
+        note = self.db.add_note(title, content)
+        self._upsert('notes', note)
+        return note
+
+    def update_note(self, note_id, new_title, new_content):
+        note_id = int(note_id)
+        note = self.db.update_note(note_id, new_title, new_content)
+        self._upsert('notes', note)
+        return note
+
+    def delete_note(self, note_id):
+        note_id = int(note_id)
+        self.db.delete_note(note_id)
+        self._drop('notes', [note_id])
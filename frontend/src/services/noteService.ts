@@ -16,8 +16,15 @@ export interface NoteInput {
 
 const noteService = {
   getAllNotes: async (): Promise<Note[]> => {
-    const response = await axios.get(`${API_URL}/notes/`);
-    return response.data;
+    // 목록은 페이지 단위로 반환되므로 X-Next-Cursor 헤더를 따라 모두 가져옴
+    const notes: Note[] = [];
+    let cursor: string | undefined;
+    do {
+      const response = await axios.get(`${API_URL}/notes/`, { params: cursor ? { cursor } : {} });
+      notes.push(...response.data);
+      cursor = response.headers['x-next-cursor'];
+    } while (cursor);
+    return notes;
   },
 
   getNoteById: async (id: number): Promise<Note> => {
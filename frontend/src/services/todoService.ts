@@ -24,8 +24,15 @@ export interface TodoInput {
 
 const todoService = {
   getAllTodos: async (): Promise<Todo[]> => {
-    const response = await axios.get(`${API_URL}/todos/`);
-    return response.data;
+    // 목록은 페이지 단위로 반환되므로 X-Next-Cursor 헤더를 따라 모두 가져옴
+    const todos: Todo[] = [];
+    let cursor: string | undefined;
+    do {
+      const response = await axios.get(`${API_URL}/todos/`, { params: cursor ? { cursor } : {} });
+      todos.push(...response.data);
+      cursor = response.headers['x-next-cursor'];
+    } while (cursor);
+    return todos;
   },
 
   getTodoById: async (id: number): Promise<Todo> => {
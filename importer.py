@@ -0,0 +1,205 @@
+"""
+할 일/노트 대량 가져오기(import)
+
+CSV 또는 NDJSON을 한 줄씩 읽어 chunk 단위로 검증하고, chunk마다 한 트랜잭션으로
+TodoDB.load_rows(대량 적재 경로)에 기록합니다. 잘못된 행은 건너뛰고 줄 번호와 함께 보고합니다.
+
+실행:
+    python importer.py todos todos.csv
+    python importer.py notes notes.ndjson --chunk-size 10000
+    cat todos.ndjson | python importer.py todos - --format ndjson
+"""
+import os
+import io
+import csv
+import sys
+import json
+import asyncio
+import argparse
+from datetime import date, datetime
+
+import orjson
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+# chunk 하나가 트랜잭션 하나 - 클수록 빠르지만 실패 시 되돌리는 범위도 커짐
+IMPORT_CHUNK_SIZE = int(os.getenv('IMPORT_CHUNK_SIZE', 20000))
+# 보고서에 상세 내용을 남길 최대 오류 수 (개수는 모두 셈)
+IMPORT_MAX_ERRORS = int(os.getenv('IMPORT_MAX_ERRORS', 1000))
+
+TODO_PRIORITIES = ('High', 'Medium', 'Low')
+TODO_STATUSES = ('Pending', 'Completed')
+
+def todo_params(record, now):
+    task = record.get('task')
+    if not task:
+        raise ValueError("task is required")
+    due_date = record.get('due_date')
+    if not isinstance(due_date, str):
+        raise ValueError("due_date must be a YYYY-MM-DD string")
+    priority = record.get('priority') or 'Medium'
+    if priority not in TODO_PRIORITIES:
+        raise ValueError(f"Invalid priority: {priority}")
+    status = record.get('status') or 'Pending'
+    if status not in TODO_STATUSES:
+        raise ValueError(f"Invalid status: {status}")
+    # db_manager.LOAD_COLUMNS['todos'] 순서 (task, due_date, priority, status, created_at)
+    # date.fromisoformat은 strptime보다 훨씬 빠름
+    return (task, date.fromisoformat(due_date), priority, status, now)
+
+def note_params(record, now):
+    content = record.get('content')
+    if not content:
+        raise ValueError("content is required")
+    # db_manager.LOAD_COLUMNS['notes'] 순서 (title, content, created_at)
+    return (record.get('title') or 'Untitled Note', content, now)
+
+VALIDATORS = {
+    'todos': todo_params,
+    'notes': note_params,
+}
+
+def read_records(lines, format):
+    """
+    텍스트 줄 iterator에서 (줄 번호, dict) 또는 (줄 번호, 예외)를 yield
+
+    CSV는 첫 줄을 헤더로 사용하며, 줄 번호는 원본 파일 기준(헤더 = 1)입니다.
+    """
+    if format == 'csv':
+        # csv.DictReader보다 빠르게 헤더와 zip
+        reader = csv.reader(lines)
+        header = next(reader, None)
+        line = reader.line_num
+        for row in reader:
+            if row:
+                yield line + 1, dict(zip(header, row))
+            line = reader.line_num
+    else:
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                yield number, e
+                continue
+            if not isinstance(record, dict):
+                yield number, ValueError("Each line must be a JSON object")
+                continue
+            yield number, record
+
+class ImportReport:
+    """가져오기 진행 상황과 결과 (행 수, 생성 수, 오류 목록)"""
+
+    def __init__(self, max_errors=None):
+        self.max_errors = max_errors if max_errors is not None else IMPORT_MAX_ERRORS
+        self.rows = 0
+        self.created = 0
+        self.error_count = 0
+        self.errors = []
+        self.started = datetime.now()
+
+    def add_error(self, line, error):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'line': line, 'detail': str(error)})
+
+    def progress(self):
+        elapsed = (datetime.now() - self.started).total_seconds()
+        return {
+            'rows': self.rows,
+            'created': self.created,
+            'errors': self.error_count,
+            'elapsed': round(elapsed, 3),
+            'rows_per_sec': round(self.rows / elapsed) if elapsed else None,
+        }
+
+    def summary(self):
+        return {**self.progress(), 'done': True, 'error_details': self.errors}
+
+def parse_chunks(lines, format, collection, report, chunk_size=None):
+    # 검증을 통과한 행(LOAD_COLUMNS 순서의 tuple) 목록을 chunk_size개씩 yield
+    chunk_size = chunk_size or IMPORT_CHUNK_SIZE
+    validate = VALIDATORS[collection]
+    now = datetime.now()
+    chunk = []
+    for line, record in read_records(lines, format):
+        report.rows += 1
+        if isinstance(record, Exception):
+            report.add_error(line, record)
+            continue
+        try:
+            chunk.append(validate(record, now))
+        except (TypeError, ValueError) as e:
+            report.add_error(line, e)
+            continue
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def import_rows(db, collection, lines, format, chunk_size=None, progress=None, report=None):
+    """
+    동기 TodoDB로 가져오기 - chunk마다 load_rows 한 번(한 트랜잭션)
+
+    progress: chunk를 기록할 때마다 report.progress()로 호출되는 콜백
+    반환: report.summary()
+    """
+    report = report or ImportReport()
+    for chunk in parse_chunks(lines, format, collection, report, chunk_size):
+        report.created += db.load_rows(collection, chunk)
+        if progress:
+            progress(report.progress())
+    return report.summary()
+
+async def import_rows_async(db, collection, lines, format, chunk_size=None, report=None):
+    """
+    AsyncTodoDB로 가져오기 - chunk를 기록할 때마다 report.progress()를 yield
+
+    마지막으로 report.summary()를 yield합니다.
+    """
+    report = report or ImportReport()
+    chunks = parse_chunks(lines, format, collection, report, chunk_size)
+    while True:
+        # 파일 읽기/검증은 이벤트 루프를 막지 않도록 스레드에서 수행
+        chunk = await asyncio.to_thread(next, chunks, None)
+        if chunk is None:
+            break
+        report.created += await db.load_rows(collection, chunk)
+        yield report.progress()
+    yield report.summary()
+
+def detect_format(path):
+    return 'csv' if path.lower().endswith('.csv') else 'ndjson'
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV/NDJSON 파일에서 할 일 또는 노트를 가져옵니다.")
+    parser.add_argument('collection', choices=sorted(VALIDATORS))
+    parser.add_argument('path', help="가져올 파일 경로 ('-'이면 표준 입력)")
+    parser.add_argument('--format', choices=IMPORT_FORMATS, help="기본값: 파일 확장자로 판단 (.csv 외에는 ndjson)")
+    parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument('--database-url', help="기본값: DATABASE_URL")
+    args = parser.parse_args(argv)
+
+    from db_manager import TodoDB
+    db = TodoDB(args.database_url)
+    format = args.format or detect_format(args.path)
+
+    def progress(state):
+        print(f"\r{state['rows']:>10} rows  {state['created']:>10} created  "
+              f"{state['errors']:>6} errors  {state['rows_per_sec'] or 0:>8} rows/s",
+              end='', file=sys.stderr, flush=True)
+
+    if args.path == '-':
+        lines = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8-sig', newline='')
+        summary = import_rows(db, args.collection, lines, format, args.chunk_size, progress)
+    else:
+        with open(args.path, encoding='utf-8-sig', newline='') as lines:
+            summary = import_rows(db, args.collection, lines, format, args.chunk_size, progress)
+    print(file=sys.stderr)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    return 1 if summary['errors'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
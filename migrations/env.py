@@ -0,0 +1,57 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, make_url
+
+from db_manager import Base, database_url, configure_engine, is_search_index_table
+
+config = context.config
+
+# migrate()로 실행될 때는 애플리케이션 로깅 설정을 건드리지 않음
+if config.config_file_name is not None and config.attributes.get('configure_logger', True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+def include_name(name, type_, parent_names):
+    # 전문 검색 색인 테이블(FTS5)은 모델에 없으므로 비교에서 제외
+    if type_ == 'table':
+        return not is_search_index_table(name)
+    return True
+
+def get_url():
+    # migrate(url)로 전달된 URL이 있으면 우선 사용
+    return make_url(config.attributes.get('url') or database_url())
+
+def run_migrations_offline():
+    url = get_url()
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        include_name=include_name,
+        render_as_batch=url.get_backend_name() == 'sqlite',
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    url = get_url()
+    engine = create_engine(url)
+    configure_engine(engine)
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            # SQLite는 ALTER TABLE 제약이 있어 batch 모드 사용
+            render_as_batch=url.get_backend_name() == 'sqlite',
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,41 @@
+"""initial schema: todos, notes
+
+기존에 Base.metadata.create_all로 만든 DB는 이 리비전으로 stamp 후 업그레이드합니다.
+    alembic stamp 0001 && alembic upgrade head
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'todos',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('task', sa.Text(), nullable=False),
+        sa.Column('due_date', sa.Date()),
+        sa.Column('priority', sa.String()),
+        sa.Column('status', sa.String()),
+        sa.Column('created_at', sa.DateTime()),
+    )
+    op.create_table(
+        'notes',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('title', sa.String(255), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime()),
+    )
+
+
+def downgrade():
+    op.drop_table('notes')
+    op.drop_table('todos')
@@ -0,0 +1,27 @@
+"""add indexes for status/priority filters and created_at ordering
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_todos_status_due_date', 'todos', ['status', 'due_date'])
+    op.create_index('ix_todos_priority_due_date', 'todos', ['priority', 'due_date'])
+    op.create_index('ix_todos_created_at', 'todos', ['created_at'])
+    op.create_index('ix_notes_created_at', 'notes', ['created_at'])
+
+
+def downgrade():
+    op.drop_index('ix_notes_created_at', table_name='notes')
+    op.drop_index('ix_todos_created_at', table_name='todos')
+    op.drop_index('ix_todos_priority_due_date', table_name='todos')
+    op.drop_index('ix_todos_status_due_date', table_name='todos')
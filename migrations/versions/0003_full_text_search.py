@@ -0,0 +1,74 @@
+"""add full-text search indexes for todos.task and notes.title/content
+
+SQLite: FTS5 external content 테이블(todos_fts, notes_fts)과 색인 갱신 트리거
+PostgreSQL: to_tsvector 식에 대한 GIN 인덱스
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+# 테이블별 검색 대상 필드 (db_manager.SEARCH_FIELDS와 같아야 함)
+SEARCH_FIELDS = {
+    'todos': ('task',),
+    'notes': ('title', 'content'),
+}
+
+
+def sqlite_upgrade(table_name, fields):
+    fts = f"{table_name}_fts"
+    columns = ', '.join(fields)
+    new_values = ', '.join(f"new.{field}" for field in fields)
+    old_values = ', '.join(f"old.{field}" for field in fields)
+    op.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, content='{table_name}', content_rowid='id')")
+    op.execute(
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {columns} ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+    )
+    # 기존 행 색인
+    op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def postgresql_upgrade(table_name, fields):
+    document = " || ' ' || ".join(f"coalesce({field}, '')" for field in fields)
+    op.execute(
+        f"CREATE INDEX ix_{table_name}_search ON {table_name} "
+        f"USING GIN (to_tsvector('simple', {document}))"
+    )
+
+
+def upgrade():
+    dialect_name = op.get_bind().dialect.name
+    for table_name, fields in SEARCH_FIELDS.items():
+        if dialect_name == 'sqlite':
+            sqlite_upgrade(table_name, fields)
+        elif dialect_name == 'postgresql':
+            postgresql_upgrade(table_name, fields)
+
+
+def downgrade():
+    dialect_name = op.get_bind().dialect.name
+    for table_name in SEARCH_FIELDS:
+        if dialect_name == 'sqlite':
+            # 가상 테이블을 지워도 트리거는 남으므로 먼저 삭제
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table_name}_fts_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {table_name}_fts")
+        elif dialect_name == 'postgresql':
+            op.execute(f"DROP INDEX IF EXISTS ix_{table_name}_search")
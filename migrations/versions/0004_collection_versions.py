@@ -0,0 +1,29 @@
+"""add collection_versions: shared per-collection write generation
+
+모든 쓰기 트랜잭션이 해당 컬렉션의 version을 1 올리며, API의 ETag와 읽기 캐시 동기화에 사용합니다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    table = op.create_table(
+        'collection_versions',
+        sa.Column('name', sa.String(32), primary_key=True),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.bulk_insert(table, [{'name': 'todos', 'version': 0}, {'name': 'notes', 'version': 0}])
+
+
+def downgrade():
+    op.drop_table('collection_versions')
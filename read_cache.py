@@ -0,0 +1,106 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+
+# 캐시에 없음을 나타내는 값 (None도 캐시할 수 있도록 별도 객체 사용)
+MISSING = object()
+
+class ReadCache:
+    """
+    프로세스 내 읽기 캐시 (TTL + LRU)
+
+    컬렉션('todos', 'notes')마다 버전 번호를 두고, 쓰기가 일어나면
+    invalidate()로 버전을 올려 해당 컬렉션의 항목을 모두 무효화합니다.
+    항목은 (컬렉션, 버전, 키)로 저장되므로 조회 시작 시점의 버전으로 저장된
+    오래된 값은 다시 반환되지 않습니다.
+    다른 프로세스의 쓰기는 sync()에 DB의 공유 세대 번호를 넘겨 반영합니다.
+    """
+
+    def __init__(self, max_entries=None, ttl=None):
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv('READ_CACHE_SIZE', 1024))
+        self.ttl = ttl if ttl is not None else float(os.getenv('READ_CACHE_TTL', 30))
+        self._entries = OrderedDict()
+        self._versions = {}
+        self.sync_interval = float(os.getenv('READ_CACHE_SYNC_INTERVAL', 1))
+        self._generations = {}
+        self._synced_at = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, collection):
+        return self._versions.get(collection, 0)
+
+    def get(self, collection, key, version):
+        if self.max_entries <= 0:
+            return MISSING
+        entry_key = (collection, version, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[entry_key]
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, collection, key, version, value):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            # 조회 중에 쓰기가 있었다면 저장하지 않음
+            if version != self._versions.get(collection, 0):
+                return
+            self._entries[(collection, version, key)] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end((collection, version, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, collection):
+        with self._lock:
+            self._versions[collection] = self._versions.get(collection, 0) + 1
+            for entry_key in [k for k in self._entries if k[0] == collection]:
+                del self._entries[entry_key]
+
+    def generation(self, collection):
+        # sync_interval 안에 확인한 세대 번호 (지났거나 없으면 MISSING - DB에서 다시 읽어야 함)
+        with self._lock:
+            synced_at = self._synced_at.get(collection)
+            if synced_at is None or time.monotonic() - synced_at >= self.sync_interval:
+                return MISSING
+            return self._generations[collection]
+
+    def sync(self, collection, generation):
+        """
+        DB 공유 세대 번호 반영 - 마지막으로 본 값보다 크면 (다른 프로세스의 쓰기) 컬렉션 무효화
+
+        세대 번호는 증가만 하므로 늦게 도착한 이전 값은 무시합니다. 반환: 현재 세대 번호
+
+        프로세스 간 일관성: 세대 번호는 쓰기 커밋 직후 별도 트랜잭션에서 올라가고, 각 프로세스는
+        sync_interval(READ_CACHE_SYNC_INTERVAL, 기본 1초)마다 한 번만 DB에서 읽습니다. 따라서 다른 프로세스의
+        쓰기는 최대 sync_interval 동안 이 프로세스의 캐시와 ETag(304 응답)에 반영되지 않을 수 있습니다.
+        이 프로세스의 쓰기는 증가한 값을 바로 sync()하므로 즉시 반영됩니다. 0이면 매번 DB에서 읽습니다.
+        """
+        with self._lock:
+            self._synced_at[collection] = time.monotonic()
+            current = self._generations.get(collection)
+            if current is not None and generation <= current:
+                return current
+            self._generations[collection] = generation
+        self.invalidate(collection)
+        return generation
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl': self.ttl,
+            'sync_interval': self.sync_interval,
+            'hits': self.hits,
+            'misses': self.misses,
+            'versions': dict(self._versions),
+            'generations': dict(self._generations),
+        }
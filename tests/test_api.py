@@ -0,0 +1,229 @@
+"""FastAPI(api.py) + AsyncTodoDB 테스트 - 임시 SQLite 파일 사용"""
+import csv
+import io
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from unittest import mock
+
+import orjson
+from fastapi.testclient import TestClient
+
+import api
+import async_db_manager
+from db_manager import TodoDB, Todo, _encode_cursor, _decode_cursor
+
+
+class APITestCase(unittest.TestCase):
+    """요청마다 같은 임시 DB를 쓰는 TestClient (다른 프로세스의 쓰기는 self.db로 흉내)"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, 'api.db')
+        # 다른 프로세스의 쓰기가 바로 보이도록 세대 번호를 매번 DB에서 확인
+        environ = mock.patch.dict(os.environ, {
+            'DATABASE_URL': f'sqlite:///{path}',
+            'ASYNC_DATABASE_URL': f'sqlite+aiosqlite:///{path}',
+            'READ_CACHE_SYNC_INTERVAL': '0',
+        })
+        environ.start()
+        self.addCleanup(environ.stop)
+        self.db = TodoDB()
+        self.db.create_all()
+        async_db_manager._db = None
+        self.client = TestClient(api.app)
+        self.client.__enter__()
+
+    def tearDown(self):
+        self.client.__exit__(None, None, None)
+        async_db_manager._db = None
+        self.db.engine.dispose()
+        self.tmp.cleanup()
+
+    def load_todos(self, due_dates):
+        now = datetime(2025, 1, 1)
+        self.db.load_rows('todos', [(f'할 일 {i}', due, 'Medium', 'Pending', now) for i, due in enumerate(due_dates)])
+
+    def read_pages(self, url, **params):
+        # X-Next-Cursor를 따라 모든 페이지의 id 목록 반환
+        ids, cursor = [], None
+        while True:
+            response = self.client.get(url, params={**params, **({'cursor': cursor} if cursor else {})})
+            self.assertEqual(response.status_code, 200)
+            ids += [item['id'] for item in response.json()]
+            cursor = response.headers.get('x-next-cursor')
+            if not cursor:
+                return ids
+
+
+class PaginationTest(APITestCase):
+    """keyset 페이지네이션 (NULL은 정렬 방향과 관계없이 마지막)"""
+
+    def setUp(self):
+        super().setUp()
+        self.due_dates = [date(2025, 3, 2), None, date(2025, 3, 1), date(2025, 3, 2), None, date(2025, 3, 3), None]
+        self.load_todos(self.due_dates)
+        self.rows = [(item_id, due) for item_id, due in enumerate(self.due_dates, 1)]
+
+    def test_due_date_ascending(self):
+        expected = [item_id for item_id, due in sorted(self.rows, key=lambda row: (row[1] is None, row[1] or date.min, row[0]))]
+        self.assertEqual(expected[-3:], [2, 5, 7])
+        for limit in (1, 2, 3, 100):
+            with self.subTest(limit=limit):
+                self.assertEqual(self.read_pages('/api/todos/', ordering='due_date', limit=limit), expected)
+
+    def test_due_date_descending(self):
+        dated = sorted([row for row in self.rows if row[1]], key=lambda row: (row[1], row[0]), reverse=True)
+        undated = sorted([row for row in self.rows if row[1] is None], reverse=True)
+        expected = [item_id for item_id, _ in dated + undated]
+        self.assertEqual(expected[-3:], [7, 5, 2])
+        for limit in (1, 2, 3, 100):
+            with self.subTest(limit=limit):
+                self.assertEqual(self.read_pages('/api/todos/', ordering='-due_date', limit=limit), expected)
+
+    def test_id_ordering_and_filters(self):
+        self.assertEqual(self.read_pages('/api/todos/', limit=2), list(range(1, 8)))
+        self.assertEqual(self.read_pages('/api/todos/', ordering='-id', limit=3), list(range(7, 0, -1)))
+        self.assertEqual(self.read_pages('/api/todos/', ordering='due_date', limit=1, due_from='2025-03-02'), [1, 4, 6])
+
+    def test_invalid_cursor(self):
+        cursor = self.client.get('/api/todos/', params={'ordering': 'due_date', 'limit': 2}).headers['x-next-cursor']
+        for params in [{'cursor': 'not-a-cursor'}, {'cursor': '!!!'},
+                       {'cursor': _encode_cursor('due_date', 'tomorrow', 1), 'ordering': 'due_date'},
+                       {'cursor': cursor, 'ordering': '-due_date'},
+                       {'ordering': 'task'}]:
+            with self.subTest(**params):
+                response = self.client.get('/api/todos/', params=params)
+                self.assertEqual(response.status_code, 400)
+
+    def test_cursor_round_trip(self):
+        sort_column = Todo.__table__.c.due_date
+        self.assertEqual(_decode_cursor(_encode_cursor('due_date', date(2025, 3, 1), 4), 'due_date', sort_column),
+                         (date(2025, 3, 1), 4))
+        self.assertEqual(_decode_cursor(_encode_cursor('-due_date', None, 7), '-due_date', sort_column), (None, 7))
+
+
+class BulkTest(APITestCase):
+    """일괄 생성/수정/삭제의 항목별 결과"""
+
+    def test_bulk_create_reports_row_errors(self):
+        response = self.client.post('/api/todos/bulk', json=[
+            {'task': '정상', 'due_date': '2025-03-01', 'priority': 'High'},
+            {'task': '잘못된 날짜', 'due_date': '2025-13-40', 'priority': 'Low'},
+            {'task': '정상 2', 'due_date': '2025-03-02', 'priority': 'Low', 'status': 'Completed'},
+        ])
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual([result['status'] for result in results], ['created', 'error', 'created'])
+        self.assertEqual([result['index'] for result in results], [0, 1, 2])
+        self.assertIn('detail', results[1])
+        self.assertEqual([row[1] for row in self.db.get_todo_rows()], ['정상', '정상 2'])
+
+    def test_bulk_update_and_delete_report_missing_rows(self):
+        self.load_todos([date(2025, 3, 1), date(2025, 3, 2)])
+        response = self.client.patch('/api/todos/bulk', json=[
+            {'id': 1, 'status': 'Completed'},
+            {'id': 99, 'status': 'Completed'},
+            {'id': 2, 'due_date': 'tomorrow'},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(result['id'], result['status']) for result in response.json()['results']],
+                         [(1, 'updated'), (99, 'not_found'), (2, 'error')])
+        self.assertEqual(self.db.get_todo(1)['status'], 'Completed')
+        self.assertEqual(self.db.get_todo(2)['due_date'], date(2025, 3, 2))
+
+        response = self.client.request('DELETE', '/api/todos/bulk', json=[2, 42])
+        self.assertEqual([result['status'] for result in response.json()['results']], ['deleted', 'not_found'])
+
+    def test_bulk_batch_limits(self):
+        self.assertEqual(self.client.post('/api/notes/bulk', json=[]).status_code, 400)
+        with mock.patch.object(api, 'BULK_MAX_BATCH_SIZE', 2):
+            response = self.client.post('/api/notes/bulk', json=[{'title': str(i), 'content': 'x'} for i in range(3)])
+        self.assertEqual(response.status_code, 413)
+
+
+class ConditionalGetTest(APITestCase):
+    """컬렉션 ETag - If-None-Match가 같으면 304, 쓰기(다른 프로세스 포함) 후에는 200"""
+
+    def get(self, url, etag=None):
+        return self.client.get(url, headers={'If-None-Match': etag} if etag else {})
+
+    def test_list_not_modified(self):
+        self.load_todos([date(2025, 3, 1)])
+        response = self.get('/api/todos/')
+        etag = response.headers['etag']
+        response = self.get('/api/todos/', etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['etag'], etag)
+        # URL(쿼리)마다 다른 ETag
+        self.assertNotEqual(self.get('/api/todos/?limit=1').headers['etag'], etag)
+
+        # API로 쓰기
+        self.client.post('/api/todos/', json={'task': '새 할 일', 'due_date': '2025-03-02', 'priority': 'High'})
+        response = self.get('/api/todos/', etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+        etag = response.headers['etag']
+
+        # 다른 프로세스의 쓰기
+        self.db.update_todos([{'id': 1, 'status': 'Completed'}])
+        response = self.get('/api/todos/', etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]['status'], 'Completed')
+        self.assertEqual(self.get('/api/todos/', response.headers['etag']).status_code, 304)
+
+    def test_detail_and_collections(self):
+        self.load_todos([date(2025, 3, 1)])
+        etag = self.get('/api/todos/1').headers['etag']
+        self.assertEqual(self.get('/api/todos/1', etag).status_code, 304)
+        # 노트 쓰기는 할 일 ETag에 영향 없음
+        self.db.add_note('노트', '내용')
+        self.assertEqual(self.get('/api/todos/1', etag).status_code, 304)
+        self.db.update_status(1, 'Completed')
+        response = self.get('/api/todos/1', etag)
+        self.assertEqual((response.status_code, response.json()['status']), (200, 'Completed'))
+
+
+class ExportImportTest(APITestCase):
+    """스트리밍 내보내기와 가져오기 결과(오류 줄 번호 포함)"""
+
+    def test_export(self):
+        self.load_todos([date(2025, 3, 1), None])
+        response = self.client.get('/api/todos/export')
+        self.assertEqual(response.headers['content-type'], 'application/x-ndjson')
+        rows = [orjson.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([(row['id'], row['due_date']) for row in rows], [(1, '2025-03-01'), (2, None)])
+
+        response = self.client.get('/api/todos/export', params={'format': 'csv'})
+        self.assertIn('attachment; filename="todos.csv"', response.headers['content-disposition'])
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        self.assertEqual([(row['id'], row['due_date']) for row in rows], [('1', '2025-03-01'), ('2', '')])
+
+    def test_import_reports_errors(self):
+        body = '\n'.join([
+            '{"task": "사과", "due_date": "2025-03-01", "priority": "High"}',
+            '{"task": "날짜 없음"}',
+            'not json',
+            '',
+            '{"task": "바나나", "due_date": "2025-03-02", "status": "Done"}',
+            '{"task": "체리", "due_date": "2025-03-03"}',
+        ])
+        response = self.client.post('/api/todos/import', content=body.encode())
+        events = [orjson.loads(line) for line in response.text.splitlines()]
+        summary = events[-1]
+        self.assertTrue(summary['done'])
+        self.assertEqual((summary['rows'], summary['created'], summary['errors']), (5, 2, 3))
+        self.assertEqual([error['line'] for error in summary['error_details']], [2, 3, 5])
+        # 가져온 행도 검색 색인에 포함
+        self.assertEqual([todo['task'] for todo in self.db.search_todos('체리')], ['체리'])
+
+        response = self.client.post('/api/notes/import', params={'format': 'csv'},
+                                    content='title,content\n제목,\n,내용\n'.encode())
+        summary = orjson.loads(response.text.splitlines()[-1])
+        self.assertEqual((summary['created'], summary['errors']), (1, 1))
+        self.assertEqual(summary['error_details'][0]['line'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
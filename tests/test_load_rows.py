@@ -0,0 +1,66 @@
+"""TodoDB/AsyncTodoDB.load_rows 테스트 (SQLite 대량 적재 경로)"""
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from db_manager import TodoDB
+from async_db_manager import AsyncTodoDB
+from sqlalchemy import exc
+
+
+def sqlite_triggers(db):
+    with db.engine.connect() as connection:
+        return {name for (name,) in connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+
+
+class LoadRowsTest(unittest.TestCase):
+    """실패한 chunk가 색인 트리거를 남기지 않고 rollback되는지 확인"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'load.db')
+        self.db = TodoDB(f'sqlite:///{self.path}')
+        self.db.create_all()
+        self.now = datetime.now()
+
+    def tearDown(self):
+        self.db.engine.dispose()
+        self.tmp.cleanup()
+
+    def test_load_rows_indexes_rows(self):
+        rows = [('사과 파이', None, 'High', 'Pending', self.now), ('바나나 우유', None, 'Low', 'Completed', self.now)]
+        self.assertEqual(self.db.load_rows('todos', rows), 2)
+        self.assertEqual([todo['task'] for todo in self.db.search_todos('바나나')], ['바나나 우유'])
+        self.assertIn('todos_fts_ai', sqlite_triggers(self.db))
+
+    def test_failed_chunk_keeps_insert_trigger(self):
+        # task NOT NULL 위반으로 chunk 전체가 rollback
+        rows = [('사과', None, 'High', 'Pending', self.now), (None, None, 'High', 'Pending', self.now)]
+        with self.assertRaises(exc.IntegrityError):
+            self.db.load_rows('todos', rows)
+
+        self.assertIn('todos_fts_ai', sqlite_triggers(self.db))
+        self.assertEqual(self.db.get_todo_rows(), [])
+        # 이후 추가한 행도 검색됨
+        self.db.add_todo('banana', '2025-01-01', 'High')
+        self.assertEqual([todo['task'] for todo in self.db.search_todos('banana')], ['banana'])
+
+    def test_failed_chunk_keeps_insert_trigger_async(self):
+        async def run():
+            db = AsyncTodoDB(f'sqlite+aiosqlite:///{self.path}')
+            try:
+                with self.assertRaises(exc.IntegrityError):
+                    await db.load_rows('notes', [('제목', None, self.now)])
+                await db.add_note('cherry', 'cherry note')
+                return await db.search_notes('cherry')
+            finally:
+                await db.dispose()
+
+        self.assertEqual([note['title'] for note in asyncio.run(run())], ['cherry'])
+        self.assertIn('notes_fts_ai', sqlite_triggers(self.db))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # 응답 캐시 무효화, SQLite 연결 설정 신호 등록
+        from . import signals  # noqa: F401
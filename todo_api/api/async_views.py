@@ -0,0 +1,145 @@
+"""
+네이티브 비동기 뷰 (ASGI 서버에서 요청 전체를 스레드로 넘기지 않고 처리)
+
+DRF 뷰셋(views.py)의 필터/검색/정렬/페이지네이션/serializer 설정을 그대로 사용하고
+DB 접근만 Django 비동기 ORM(acount, aget, acreate, asave, adelete, async for)으로 실행합니다.
+응답 본문과 오류 형식은 뷰셋의 JSON 응답과 같습니다 (JSON만 지원, 응답 캐시/조건부 GET 제외).
+
+URL:
+    /api/async/todos/, /api/async/todos/{id}/
+    /api/async/notes/, /api/async/notes/{id}/
+"""
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import serializers, status
+from rest_framework.exceptions import MethodNotAllowed
+from rest_framework.request import Request
+from rest_framework.views import exception_handler
+from .renderers import FastJSONRenderer
+from .serializers import get_row_encoder
+from .views import TodoViewSet, NoteViewSet
+
+class AsyncModelView(View):
+    """
+    viewset_class와 같은 동작의 비동기 list/create/retrieve/update/partial_update/destroy
+    
+    /{id}/가 없으면 목록(GET: list, POST: create), 있으면 항목(GET/PUT/PATCH/DELETE)입니다.
+    """
+    viewset_class = None
+    renderer = FastJSONRenderer()
+    
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # DRF APIView와 같이 CSRF 검사 제외 (세션 인증을 사용하지 않음)
+        return csrf_exempt(super().as_view(**initkwargs))
+    
+    async def get(self, request, pk=None):
+        return await self.handle(request, 'list' if pk is None else 'retrieve')
+    
+    async def post(self, request, pk=None):
+        return await self.handle(request, 'create' if pk is None else None)
+    
+    async def put(self, request, pk=None):
+        return await self.handle(request, None if pk is None else 'update')
+    
+    async def patch(self, request, pk=None):
+        return await self.handle(request, None if pk is None else 'partial_update')
+    
+    async def delete(self, request, pk=None):
+        return await self.handle(request, None if pk is None else 'destroy')
+    
+    def get_viewset(self, request, action):
+        # 설정(queryset, serializer, 필터, 페이지네이션)은 DRF 뷰셋 인스턴스에서 가져옴 - 생성 시 DB 접근 없음
+        parsers = [parser() for parser in self.viewset_class.parser_classes]
+        return self.viewset_class(
+            request=Request(request, parsers=parsers), args=self.args, kwargs=self.kwargs,
+            action=action, format_kwarg=None,
+        )
+    
+    def render(self, data, status_code=status.HTTP_200_OK):
+        response = HttpResponse(self.renderer.render(data), status=status_code, content_type=self.renderer.media_type)
+        patch_vary_headers(response, ('Accept',))
+        return response
+    
+    async def handle(self, request, action):
+        viewset = self.get_viewset(request, action)
+        try:
+            if action is None:
+                raise MethodNotAllowed(request.method)
+            return await getattr(self, action)(viewset)
+        except Exception as exc:
+            # DRF 뷰와 같은 오류 응답 (ValidationError 400, Http404 404 등)
+            response = exception_handler(exc, {'view': viewset, 'request': viewset.request})
+            if response is None:
+                raise
+            return self.render(response.data, response.status_code)
+    
+    async def aget_object(self, viewset):
+        # GenericAPIView.get_object와 같은 조회 (없거나 잘못된 id면 404)
+        queryset = viewset.filter_queryset(viewset.get_queryset())
+        lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+        try:
+            return await queryset.aget(**{viewset.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, TypeError, ValueError):
+            raise Http404
+    
+    async def list(self, viewset):
+        serializer_class = viewset.get_serializer_class()
+        encoder = get_row_encoder(serializer_class)
+        queryset = viewset.filter_queryset(viewset.get_queryset())
+        if encoder.supported:
+            # FastListMixin과 같은 values() 경로
+            queryset = viewset.get_list_rows(queryset, encoder)
+            encode = encoder.encode
+        else:
+            encode = lambda page: viewset.get_serializer(page, many=True).data
+    
+        paginator = viewset.paginator
+        page = None
+        if paginator is not None:
+            page = await paginator.apaginate_queryset(queryset, viewset.request, viewset)
+        if page is not None:
+            return self.render(paginator.get_paginated_response(encode(page)).data)
+        return self.render(encode([item async for item in queryset]))
+    
+    async def retrieve(self, viewset):
+        instance = await self.aget_object(viewset)
+        return self.render(viewset.get_serializer(instance).data)
+    
+    async def create(self, viewset):
+        serializer = viewset.get_serializer(data=viewset.request.data)
+        serializer.is_valid(raise_exception=True)
+        if isinstance(serializer, serializers.ListSerializer):
+            # 배열이면 뷰셋과 같은 일괄 생성 (BulkListSerializer - 트랜잭션이 필요해 스레드에서 실행)
+            await sync_to_async(serializer.save)()
+        else:
+            # ModelSerializer.create와 같음 (다대다 필드 없음)
+            serializer.instance = await serializer.Meta.model._default_manager.acreate(**serializer.validated_data)
+        return self.render(serializer.data, status.HTTP_201_CREATED)
+    
+    async def update(self, viewset, partial=False):
+        instance = await self.aget_object(viewset)
+        serializer = viewset.get_serializer(instance, data=viewset.request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        # ModelSerializer.update와 같음 (다대다 필드 없음)
+        for attr, value in serializer.validated_data.items():
+            setattr(instance, attr, value)
+        await instance.asave()
+        return self.render(serializer.data)
+    
+    async def partial_update(self, viewset):
+        return await self.update(viewset, partial=True)
+    
+    async def destroy(self, viewset):
+        instance = await self.aget_object(viewset)
+        await instance.adelete()
+        return self.render(None, status.HTTP_204_NO_CONTENT)
+
+class AsyncTodoView(AsyncModelView):
+    viewset_class = TodoViewSet
+
+class AsyncNoteView(AsyncModelView):
+    viewset_class = NoteViewSet
@@ -0,0 +1,52 @@
+import django_filters
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.filters import OrderingFilter
+from .models import Todo, PRIORITY_RANKS
+
+class MappedOrderingFilter(OrderingFilter):
+    """
+    정렬 필드 이름을 실제 정렬 컬럼으로 바꾸는 OrderingFilter
+    
+    뷰의 ordering_field_map에 따라 바꾸고(예: priority -> priority_rank, due_date),
+    같은 값끼리의 순서가 항상 같도록 마지막에 id를 추가합니다.
+    """
+    
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        field_map = getattr(view, 'ordering_field_map', {})
+        mapped, seen = [], set()
+        for term in ordering:
+            descending = term.startswith('-')
+            fields = field_map.get(term.lstrip('-'), term.lstrip('-'))
+            for field in (fields,) if isinstance(fields, str) else fields:
+                # 같은 필드를 두 번 정렬하지 않음 (예: ordering=priority,due_date)
+                if field not in seen:
+                    seen.add(field)
+                    mapped.append(f"-{field}" if descending else field)
+        if not {'id', 'pk'} & seen:
+            mapped.append('-id' if mapped[-1].startswith('-') else 'id')
+        return mapped
+
+class TodoFilter(django_filters.FilterSet):
+    """
+    할 일 필터 (status, priority, overdue)
+    
+    priority는 priority_rank로 조회해 (priority_rank, ...) 인덱스를 사용합니다.
+    overdue는 통계(TodoQuerySet.stats)와 같이 마감일이 지난 미완료 항목입니다.
+    """
+    priority = django_filters.ChoiceFilter(choices=Todo.PRIORITY_CHOICES, method='filter_priority')
+    overdue = django_filters.BooleanFilter(method='filter_overdue')
+    
+    class Meta:
+        model = Todo
+        fields = ['status', 'priority']
+    
+    def filter_priority(self, queryset, name, value):
+        return queryset.filter(priority_rank=PRIORITY_RANKS[value])
+    
+    def filter_overdue(self, queryset, name, value):
+        overdue = Q(due_date__lt=timezone.localdate()) & ~Q(status='Completed')
+        return queryset.filter(overdue) if value else queryset.exclude(overdue)
@@ -0,0 +1,64 @@
+from django.db import migrations
+
+# 이 마이그레이션 시점의 검색 대상 필드와 색인 SQL (api.search가 바뀌어도 이전 마이그레이션은 그대로 유지)
+SEARCH_FIELDS = {
+    'api_todo': ('task',),
+    'api_note': ('content',),
+}
+
+
+def create_index_sql(vendor, table, fields):
+    if vendor == 'sqlite':
+        fts = f"{table}_fts"
+        columns = ', '.join(fields)
+        new_values = ', '.join(f"new.{field}" for field in fields)
+        old_values = ', '.join(f"old.{field}" for field in fields)
+        return [
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, content='{table}', content_rowid='id')",
+            f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END",
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {columns} ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+    if vendor == 'postgresql':
+        document = " || ' ' || ".join(f"coalesce({field}, '')" for field in fields)
+        return [f"CREATE INDEX {table}_search ON {table} USING GIN (to_tsvector('simple', {document}))"]
+    return []
+
+
+def drop_index_sql(vendor, table):
+    if vendor == 'sqlite':
+        fts = f"{table}_fts"
+        return [f"DROP TRIGGER IF EXISTS {fts}_{suffix}" for suffix in ('ai', 'ad', 'au')] + [
+            f"DROP TABLE IF EXISTS {fts}"
+        ]
+    if vendor == 'postgresql':
+        return [f"DROP INDEX IF EXISTS {table}_search"]
+    return []
+
+
+def create_search_index(apps, schema_editor):
+    for table, fields in SEARCH_FIELDS.items():
+        for sql in create_index_sql(schema_editor.connection.vendor, table, fields):
+            schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    for table in SEARCH_FIELDS:
+        for sql in drop_index_sql(schema_editor.connection.vendor, table):
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
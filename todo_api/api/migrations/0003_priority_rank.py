@@ -0,0 +1,69 @@
+# Generated by Django 5.0.2 on 2026-10-17 07:14
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+
+def fill_priority_rank(apps, schema_editor):
+    # 기존 할 일의 priority -> priority_rank (High 1, Medium 2, Low 3)
+    Todo = apps.get_model('api', 'Todo')
+    Todo.objects.update(priority_rank=Case(
+        When(priority='High', then=Value(1)),
+        When(priority='Low', then=Value(3)),
+        default=Value(2),
+    ))
+
+
+# SQLite의 AddField/RemoveField는 테이블을 다시 만들면서 전문 검색 트리거를 지우므로
+# 필드 변경 전후로 api_todo 검색 색인을 내렸다가 다시 생성 (이 마이그레이션 시점의 SQL)
+CREATE_TODO_SEARCH_INDEX = [
+    "CREATE VIRTUAL TABLE api_todo_fts USING fts5(task, content='api_todo', content_rowid='id')",
+    "CREATE TRIGGER api_todo_fts_ai AFTER INSERT ON api_todo BEGIN "
+    "INSERT INTO api_todo_fts(rowid, task) VALUES (new.id, new.task); END",
+    "CREATE TRIGGER api_todo_fts_ad AFTER DELETE ON api_todo BEGIN "
+    "INSERT INTO api_todo_fts(api_todo_fts, rowid, task) VALUES ('delete', old.id, old.task); END",
+    "CREATE TRIGGER api_todo_fts_au AFTER UPDATE OF task ON api_todo BEGIN "
+    "INSERT INTO api_todo_fts(api_todo_fts, rowid, task) VALUES ('delete', old.id, old.task); "
+    "INSERT INTO api_todo_fts(rowid, task) VALUES (new.id, new.task); END",
+    "INSERT INTO api_todo_fts(api_todo_fts) VALUES ('rebuild')",
+]
+DROP_TODO_SEARCH_INDEX = [
+    "DROP TRIGGER IF EXISTS api_todo_fts_ai",
+    "DROP TRIGGER IF EXISTS api_todo_fts_ad",
+    "DROP TRIGGER IF EXISTS api_todo_fts_au",
+    "DROP TABLE IF EXISTS api_todo_fts",
+]
+
+
+def drop_todo_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for sql in DROP_TODO_SEARCH_INDEX:
+            schema_editor.execute(sql)
+
+
+def create_todo_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for sql in CREATE_TODO_SEARCH_INDEX:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_todo_search_index, create_todo_search_index),
+        migrations.AddField(
+            model_name='todo',
+            name='priority_rank',
+            field=models.PositiveSmallIntegerField(default=2, editable=False),
+        ),
+        migrations.RunPython(fill_priority_rank, migrations.RunPython.noop),
+        migrations.RunPython(create_todo_search_index, drop_todo_search_index),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['priority_rank', 'due_date', 'id'], name='api_todo_priority_due_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.0.2 on 2026-10-17 07:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_priority_rank'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['created_at', 'id'], name='api_note_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['due_date', 'id'], name='api_todo_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['created_at', 'id'], name='api_todo_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['status', 'id'], name='api_todo_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['status', 'due_date', 'id'], name='api_todo_status_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['status', 'priority_rank', 'due_date', 'id'], name='api_todo_status_priority_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='api_todo_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['priority_rank', 'id'], name='api_todo_priority_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['priority_rank', 'created_at', 'id'], name='api_todo_priority_created_idx'),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 5.0.2 on 2026-10-17 07:23
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+# SQLite의 AddField/RemoveField는 테이블을 다시 만들면서 전문 검색 트리거를 지우므로
+# 필드 변경 전후로 검색 색인을 내렸다가 다시 생성 (0003_priority_rank와 같은 방식, 이 마이그레이션 시점의 SQL)
+CREATE_SEARCH_INDEX = {
+    'api_todo': [
+        "CREATE VIRTUAL TABLE api_todo_fts USING fts5(task, content='api_todo', content_rowid='id')",
+        "CREATE TRIGGER api_todo_fts_ai AFTER INSERT ON api_todo BEGIN "
+        "INSERT INTO api_todo_fts(rowid, task) VALUES (new.id, new.task); END",
+        "CREATE TRIGGER api_todo_fts_ad AFTER DELETE ON api_todo BEGIN "
+        "INSERT INTO api_todo_fts(api_todo_fts, rowid, task) VALUES ('delete', old.id, old.task); END",
+        "CREATE TRIGGER api_todo_fts_au AFTER UPDATE OF task ON api_todo BEGIN "
+        "INSERT INTO api_todo_fts(api_todo_fts, rowid, task) VALUES ('delete', old.id, old.task); "
+        "INSERT INTO api_todo_fts(rowid, task) VALUES (new.id, new.task); END",
+        "INSERT INTO api_todo_fts(api_todo_fts) VALUES ('rebuild')",
+    ],
+    'api_note': [
+        "CREATE VIRTUAL TABLE api_note_fts USING fts5(content, content='api_note', content_rowid='id')",
+        "CREATE TRIGGER api_note_fts_ai AFTER INSERT ON api_note BEGIN "
+        "INSERT INTO api_note_fts(rowid, content) VALUES (new.id, new.content); END",
+        "CREATE TRIGGER api_note_fts_ad AFTER DELETE ON api_note BEGIN "
+        "INSERT INTO api_note_fts(api_note_fts, rowid, content) VALUES ('delete', old.id, old.content); END",
+        "CREATE TRIGGER api_note_fts_au AFTER UPDATE OF content ON api_note BEGIN "
+        "INSERT INTO api_note_fts(api_note_fts, rowid, content) VALUES ('delete', old.id, old.content); "
+        "INSERT INTO api_note_fts(rowid, content) VALUES (new.id, new.content); END",
+        "INSERT INTO api_note_fts(api_note_fts) VALUES ('rebuild')",
+    ],
+}
+DROP_SEARCH_INDEX = {
+    'api_todo': [
+        "DROP TRIGGER IF EXISTS api_todo_fts_ai",
+        "DROP TRIGGER IF EXISTS api_todo_fts_ad",
+        "DROP TRIGGER IF EXISTS api_todo_fts_au",
+        "DROP TABLE IF EXISTS api_todo_fts",
+    ],
+    'api_note': [
+        "DROP TRIGGER IF EXISTS api_note_fts_ai",
+        "DROP TRIGGER IF EXISTS api_note_fts_ad",
+        "DROP TRIGGER IF EXISTS api_note_fts_au",
+        "DROP TABLE IF EXISTS api_note_fts",
+    ],
+}
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for statements in DROP_SEARCH_INDEX.values():
+            for sql in statements:
+                schema_editor.execute(sql)
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for statements in CREATE_SEARCH_INDEX.values():
+            for sql in statements:
+                schema_editor.execute(sql)
+
+
+def fill_updated_at(apps, schema_editor):
+    # 기존 항목은 생성일시를 마지막 수정일시로 사용
+    for model_name in ('Todo', 'Note'):
+        apps.get_model('api', model_name).objects.update(updated_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_search_index, create_search_index),
+        migrations.AddField(
+            model_name='note',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name='todo',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.RunPython(fill_updated_at, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -1,7 +1,108 @@
+from datetime import timedelta
 from django.db import models
+from django.db.models import Count, Q
+from django.utils import timezone
+from .response_cache import invalidate
 
 # Create your models here.
 
+# 우선순위 정렬용 정수 값 (작을수록 높은 우선순위)
+PRIORITY_RANKS = {
+    'High': 1,
+    'Medium': 2,
+    'Low': 3,
+}
+
+class CachedQuerySet(models.QuerySet):
+    """
+    신호를 보내지 않는 일괄 수정/생성에서도 API 응답 캐시 무효화 (response_cache.py)
+    
+    save()를 거치지 않는 update()/bulk_update()에서도 updated_at(auto_now)을 갱신합니다.
+    """
+    
+    def _auto_now_fields(self):
+        return [field.name for field in self.model._meta.concrete_fields if getattr(field, 'auto_now', False)]
+    
+    def update(self, **kwargs):
+        now = timezone.now()
+        for field in self._auto_now_fields():
+            kwargs.setdefault(field, now)
+        rows = super().update(**kwargs)
+        invalidate(self.model, self.db)
+        return rows
+    
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        invalidate(self.model, self.db)
+        return objs
+    
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs, now = list(objs), timezone.now()
+        auto_now = [field for field in self._auto_now_fields() if field not in fields]
+        for obj in objs:
+            for field in auto_now:
+                setattr(obj, field, now)
+        rows = super().bulk_update(objs, [*fields, *auto_now], *args, **kwargs)
+        invalidate(self.model, self.db)
+        return rows
+
+class TodoQuerySet(CachedQuerySet):
+    def update(self, **kwargs):
+        # save()를 거치지 않는 일괄 수정에서도 priority_rank 유지
+        if 'priority' in kwargs and 'priority_rank' not in kwargs:
+            kwargs['priority_rank'] = PRIORITY_RANKS.get(kwargs['priority'], PRIORITY_RANKS['Medium'])
+        return super().update(**kwargs)
+    
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.priority_rank = obj.get_priority_rank()
+        return super().bulk_create(objs, *args, **kwargs)
+    
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if 'priority' in fields and 'priority_rank' not in fields:
+            for obj in objs:
+                obj.priority_rank = obj.get_priority_rank()
+            fields = [*fields, 'priority_rank']
+        return super().bulk_update(objs, fields, *args, **kwargs)
+    
+    def stats(self):
+        """
+        할 일 통계 - (status, priority) 그룹별 집계 쿼리 한 번으로 계산
+        
+        overdue: 마감일이 지난 미완료 항목
+        due_this_week: 오늘부터 이번 주 일요일까지 마감인 미완료 항목
+        """
+        today = timezone.localdate()
+        week_end = today + timedelta(days=6 - today.weekday())
+        open_todo = ~Q(status='Completed')
+        groups = self.order_by().values('status', 'priority').annotate(
+            count=Count('id'),
+            overdue=Count('id', filter=open_todo & Q(due_date__lt=today)),
+            due_this_week=Count('id', filter=open_todo & Q(due_date__gte=today, due_date__lte=week_end)),
+        )
+        
+        by_status, by_priority = {}, {}
+        total = overdue = due_this_week = 0
+        for group in groups:
+            by_status[group['status']] = by_status.get(group['status'], 0) + group['count']
+            by_priority[group['priority']] = by_priority.get(group['priority'], 0) + group['count']
+            total += group['count']
+            overdue += group['overdue']
+            due_this_week += group['due_this_week']
+        completed = by_status.get('Completed', 0)
+        return {
+            'total': total,
+            'completed': completed,
+            'pending': total - completed,
+            'completion_rate': round(completed / total * 100, 1) if total else 0.0,
+            'by_status': by_status,
+            'by_priority': by_priority,
+            'overdue': overdue,
+            'due_this_week': due_this_week,
+        }
+
 class Todo(models.Model):
     PRIORITY_CHOICES = [
         ('High', 'High'),
@@ -19,6 +120,41 @@ class Todo(models.Model):
     priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default='Medium')
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='Pending')
     created_at = models.DateTimeField(auto_now_add=True)
+    # 조건부 GET(ETag/Last-Modified)용 - 컬렉션은 MAX(updated_at)로 계산하므로 인덱스
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # priority 정렬용 정수 값 - 문자열 정렬(High, Low, Medium) 대신 인덱스로 정렬
+    priority_rank = models.PositiveSmallIntegerField(default=PRIORITY_RANKS['Medium'], editable=False)
+    
+    objects = TodoQuerySet.as_manager()
+    
+    class Meta:
+        # TodoViewSet의 필터(status, priority) + 정렬(due_date, priority, created_at, 마지막에 id) 조합별 인덱스
+        # - 필터는 앞쪽 등호 조건, 정렬은 뒤쪽 컬럼 순서로 찾기 때문에 별도 정렬(filesort) 없이 필요한 행만 읽음
+        # - priority 필터/정렬은 priority_rank 사용 (filters.TodoFilter, ordering_field_map)
+        indexes = [
+            # 필터 없음
+            models.Index(fields=['due_date', 'id'], name='api_todo_due_idx'),
+            models.Index(fields=['priority_rank', 'due_date', 'id'], name='api_todo_priority_due_idx'),
+            models.Index(fields=['created_at', 'id'], name='api_todo_created_idx'),
+            # status 필터 (+ priority 필터)
+            models.Index(fields=['status', 'id'], name='api_todo_status_idx'),
+            models.Index(fields=['status', 'due_date', 'id'], name='api_todo_status_due_idx'),
+            models.Index(fields=['status', 'priority_rank', 'due_date', 'id'], name='api_todo_status_priority_idx'),
+            models.Index(fields=['status', 'created_at', 'id'], name='api_todo_status_created_idx'),
+            # priority 필터 (due_date/priority 정렬은 api_todo_priority_due_idx)
+            models.Index(fields=['priority_rank', 'id'], name='api_todo_priority_idx'),
+            models.Index(fields=['priority_rank', 'created_at', 'id'], name='api_todo_priority_created_idx'),
+        ]
+    
+    def get_priority_rank(self):
+        return PRIORITY_RANKS.get(self.priority, PRIORITY_RANKS['Medium'])
+    
+    def save(self, *args, **kwargs):
+        self.priority_rank = self.get_priority_rank()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'priority' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'priority_rank'}
+        super().save(*args, **kwargs)
     
     def __str__(self):
         return self.task
@@ -26,6 +162,15 @@ class Todo(models.Model):
 class Note(models.Model):
     content = models.TextField(null=False, blank=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    
+    objects = CachedQuerySet.as_manager()
+    
+    class Meta:
+        indexes = [
+            # ordering=created_at
+            models.Index(fields=['created_at', 'id'], name='api_note_created_idx'),
+        ]
     
     def __str__(self):
         return f"Note {self.id}"
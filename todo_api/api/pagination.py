@@ -0,0 +1,219 @@
+import base64
+import json
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from django.db.models.expressions import Col
+from django.db.models.lookups import Exact
+from django.db.models.sql.where import AND
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+class KeysetCursorPagination(BasePagination):
+    """
+    keyset(seek) 방식 커서 페이지네이션
+    
+    queryset의 정렬 필드(없으면 id, 마지막에 항상 id 포함) 값으로 다음 페이지 위치를 정하므로
+    COUNT(*)와 OFFSET 없이 (정렬 필드, id) 인덱스 seek로 조회합니다.
+    여러 정렬 필드와 오름/내림차순 혼합을 지원하며, 정렬 필드는 NULL이 아니어야 합니다.
+    
+    응답: {"next": 다음 페이지 URL 또는 null, "results": [...]}
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 10
+    max_page_size = 1000
+    invalid_cursor_message = 'Invalid cursor'
+    
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+    
+    def get_fixed_fields(self, queryset):
+        # WHERE의 등호 조건(field = 상수)으로 값이 고정된 필드
+        where = queryset.query.where
+        if where.connector != AND or where.negated:
+            return set()
+        return {
+            child.lhs.target.name for child in where.children
+            if isinstance(child, Exact) and isinstance(child.lhs, Col)
+            and not hasattr(child.rhs, 'resolve_expression')
+        }
+    
+    def get_ordering(self, queryset):
+        ordering = [term for term in queryset.query.order_by if isinstance(term, str)] or ['id']
+        ordering = ['-id' if term == '-pk' else 'id' if term == 'pk' else term for term in ordering]
+        # 필터로 고정된 필드는 정렬해도 순서가 같으므로 제외 (예: priority=High&ordering=priority)
+        # - 제외하지 않으면 seek 조건의 범위 검색 때문에 인덱스 순서를 쓰지 못함
+        fixed = self.get_fixed_fields(queryset)
+        ordering = [term for term in ordering if term.lstrip('-') not in fixed] or ['id']
+        if not {'id', '-id'} & set(ordering):
+            ordering.append('-id' if ordering[-1].startswith('-') else 'id')
+        return ordering
+    
+    def encode_cursor(self, ordering, values):
+        raw = json.dumps([ordering, [value.isoformat() if hasattr(value, 'isoformat') else value for value in values]])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+    
+    def decode_cursor(self, cursor, ordering, model):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            cursor_ordering, values = json.loads(raw)
+            if cursor_ordering != ordering or len(values) != len(ordering):
+                raise ValueError
+            return [
+                model._meta.get_field(term.lstrip('-')).to_python(value)
+                for term, value in zip(ordering, values)
+            ]
+        except (ValueError, TypeError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+    
+    def seek_filter(self, ordering, values):
+        # (a, b, id) > (va, vb, vid) -> a >= va AND (a > va OR (b >= vb AND (b > vb OR id > vid)))
+        # 앞 필드의 범위 조건(a >= va)이 바깥에 있어야 인덱스 범위 검색에 사용됨
+        condition = None
+        for term, value in reversed(list(zip(ordering, values))):
+            field = term.lstrip('-')
+            after, from_ = ('lt', 'lte') if term.startswith('-') else ('gt', 'gte')
+            if condition is None:
+                condition = Q(**{f"{field}__{after}": value})
+            else:
+                condition = Q(**{f"{field}__{from_}": value}) & (Q(**{f"{field}__{after}": value}) | condition)
+        return condition
+    
+    def get_position(self, item, field):
+        # 모델 인스턴스 또는 values() 행(dict)
+        return item[field] if isinstance(item, dict) else getattr(item, field)
+    
+    def get_page_queryset(self, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*self.ordering)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.decode_cursor(cursor, self.ordering, queryset.model)
+            queryset = queryset.filter(self.seek_filter(self.ordering, values))
+        # 다음 페이지 존재 여부 확인을 위해 page_size + 1개 조회
+        return queryset[:self.page_size + 1]
+    
+    def set_page(self, page):
+        self.next_cursor = None
+        if len(page) > self.page_size:
+            page = page[:self.page_size]
+            last = page[-1]
+            self.next_cursor = self.encode_cursor(
+                self.ordering, [self.get_position(last, term.lstrip('-')) for term in self.ordering]
+            )
+        return page
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.set_page(list(self.get_page_queryset(queryset, request)))
+    
+    async def apaginate_queryset(self, queryset, request, view=None):
+        # 비동기 뷰(async_views.py)용 - 페이지 조회만 비동기 ORM으로 실행
+        return self.set_page([item async for item in self.get_page_queryset(queryset, request)])
+    
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), 'page')
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+    
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
+    
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+class OptionalCursorPagination(PageNumberPagination):
+    """
+    기본은 PageNumberPagination, ?pagination=cursor 또는 ?cursor=...이면 KeysetCursorPagination
+    
+    기존 클라이언트 응답(count/next/previous/results)은 그대로 두고 커서 방식은 선택적으로 사용합니다.
+    """
+    mode_query_param = 'pagination'
+    cursor_class = KeysetCursorPagination
+    
+    def use_cursor(self, request):
+        return (request.query_params.get(self.mode_query_param) == 'cursor'
+                or self.cursor_class.cursor_query_param in request.query_params)
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_class()
+            self.cursor_paginator.page_size = self.page_size
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+    
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        비동기 뷰(async_views.py)용 paginate_queryset
+        
+        PageNumberPagination.paginate_queryset과 같은 처리에서 COUNT와 페이지 조회만 비동기 ORM으로 실행합니다.
+        """
+        self.cursor_paginator = None
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_class()
+            self.cursor_paginator.page_size = self.page_size
+            return await self.cursor_paginator.apaginate_queryset(queryset, request, view)
+        
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator.count(cached_property)를 미리 채워 동기 COUNT 쿼리를 막음
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        self.page.object_list = [item async for item in self.page.object_list]
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        self.request = request
+        return list(self.page)
+    
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+    
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "'cursor'이면 커서 페이지네이션 사용 (응답: next, results)",
+                'schema': {'type': 'string', 'enum': ['cursor']},
+            },
+            {
+                'name': self.cursor_class.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': '커서 페이지네이션의 다음 페이지 커서 (next URL에 포함됨)',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.cursor_class.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': f'커서 페이지네이션의 페이지 크기 (최대 {self.cursor_class.max_page_size})',
+                'schema': {'type': 'integer'},
+            },
+        ]
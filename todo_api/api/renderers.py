@@ -0,0 +1,27 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 JSONRenderer로 렌더링
+    orjson = None
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson을 사용하는 JSONRenderer
+    
+    JSON 기본 타입(str, int, bool, None, list, dict - float 제외)만 담은 데이터를
+    JSONRenderer(UNICODE_JSON, COMPACT_JSON)와 바이트 단위로 같은 결과로 렌더링합니다.
+    들여쓰기를 요청했거나 orjson으로 변환할 수 없는 값이 있으면 JSONRenderer로 렌더링합니다.
+    """
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (orjson is None or data is None or not (api_settings.UNICODE_JSON and api_settings.COMPACT_JSON)
+                or self.get_indent(accepted_media_type, renderer_context or {})):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # JSONRenderer와 같이 U+2028/U+2029는 이스케이프 (JavaScript 호환)
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -0,0 +1,100 @@
+"""
+API 응답 캐시
+
+뷰셋별로 렌더링된 응답을 Django 캐시(settings.CACHES['default'])에 저장합니다.
+키에는 전체 URL(쿼리 문자열 포함), Accept 헤더와 함께 모델별 세대 번호가 들어가고,
+세대 번호는 post_save/post_delete 신호(api/signals.py)와 QuerySet 일괄 수정에서 올라갑니다.
+세대가 바뀌면 이전 세대의 항목은 더 이상 조회되지 않으므로 오래된 응답을 반환하지 않습니다.
+
+세대 번호도 같은 캐시에 저장되므로 file 캐시를 쓰면 여러 프로세스가 무효화를 공유합니다.
+hit/miss 횟수는 프로세스별로 셉니다.
+
+삭제는 updated_at에 남지 않으므로 모델별 마지막 삭제 시각도 함께 저장합니다 (컬렉션 Last-Modified용).
+"""
+import time
+import hashlib
+import threading
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+GENERATION_KEY = 'api:generation:{}'
+DELETED_KEY = 'api:deleted:{}'
+RESPONSE_KEY = 'api:response:{}:{}:{}'
+
+def _generation_key(model):
+    return GENERATION_KEY.format(model._meta.label_lower)
+
+def get_generations(models):
+    """모델별 현재 세대 번호 tuple (없으면 현재 시각으로 시작 - 캐시를 비운 뒤에도 이전 값과 겹치지 않음)"""
+    keys = [_generation_key(model) for model in models]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns(), None)
+            found[key] = cache.get(key)
+    return tuple(found[key] for key in keys)
+
+def bump_generation(model):
+    try:
+        cache.incr(_generation_key(model))
+    except ValueError:
+        # 세대 번호가 없음 (캐시를 비웠거나 아직 조회 전)
+        cache.add(_generation_key(model), time.time_ns(), None)
+
+def invalidate(model, using=None):
+    """
+    model의 캐시된 응답을 모두 무효화
+    
+    트랜잭션 안이면 커밋 후에 한 번 더 올립니다 - 커밋 전에 다른 요청이
+    이전 데이터를 새 세대로 저장했더라도 커밋 시점에 다시 무효화됩니다.
+    """
+    bump_generation(model)
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(lambda: bump_generation(model), using=using)
+
+def mark_deleted(model):
+    cache.set(DELETED_KEY.format(model._meta.label_lower), timezone.now(), None)
+
+def last_deleted(model):
+    """
+    model의 마지막 삭제 시각
+    
+    기록이 없으면(캐시를 비운 경우 등) 삭제 여부를 알 수 없으므로 지금 시각으로 기록합니다.
+    """
+    key = DELETED_KEY.format(model._meta.label_lower)
+    cache.add(key, timezone.now(), None)
+    return cache.get(key)
+
+def response_key(prefix, models, request):
+    url = f"{request.build_absolute_uri()}|{request.META.get('HTTP_ACCEPT', '')}"
+    generations = '.'.join(str(generation) for generation in get_generations(models))
+    return RESPONSE_KEY.format(prefix, generations, hashlib.md5(url.encode()).hexdigest())
+
+class CacheStats:
+    """이름(뷰셋 basename)별 hit/miss 횟수"""
+    
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+    
+    def record(self, name, hit):
+        with self._lock:
+            counts = self._counts.setdefault(name, [0, 0])
+            counts[0 if hit else 1] += 1
+    
+    def get(self, name):
+        with self._lock:
+            hits, misses = self._counts.get(name, (0, 0))
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total * 100, 1) if total else 0.0,
+        }
+    
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+stats = CacheStats()
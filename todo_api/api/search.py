@@ -0,0 +1,82 @@
+"""
+전문 검색(full-text search)
+
+SQLite: FTS5 external content 테이블({db_table}_fts) + 트리거로 쓰기마다 색인 갱신
+PostgreSQL: to_tsvector 식에 대한 GIN 인덱스 (쓰기 시 자동 갱신)
+그 밖의 데이터베이스: 색인 없이 icontains 필터로 대체 (rank는 0)
+
+색인은 migrations/0002_search_index.py에서 생성합니다. 마이그레이션은 그 시점의 필드와 SQL을
+직접 가지고 있으므로 SEARCH_FIELDS나 색인 SQL을 바꾸면 새 마이그레이션을 추가해야 합니다.
+"""
+import re
+from functools import reduce
+from operator import and_, or_
+from django.db import connection
+from django.db.models import Q
+
+# 테이블별 검색 대상 필드
+SEARCH_FIELDS = {
+    'api_todo': ('task',),
+    'api_note': ('content',),
+}
+
+# 검색 결과 강조 표시
+HIGHLIGHT = ('<mark>', '</mark>')
+
+def _document_sql(table):
+    return " || ' ' || ".join(f"coalesce({field}, '')" for field in SEARCH_FIELDS[table])
+
+def _vector_sql(table):
+    # PostgreSQL 인덱스 식과 검색 쿼리 식이 정확히 같아야 인덱스가 사용됨
+    return f"to_tsvector('simple', {_document_sql(table)})"
+
+def search_terms(query):
+    # 검색어를 단어 단위로 분리 (FTS 쿼리 문법 문자는 모두 제거)
+    return re.findall(r'\w+', query or '')
+
+def _fallback_search(model, terms, limit):
+    # 전문 검색 색인이 없는 데이터베이스 - 모든 단어를 (어느 필드든) 포함하는 항목을 id 순으로 조회
+    fields = SEARCH_FIELDS[model._meta.db_table]
+    condition = reduce(and_, (
+        reduce(or_, (Q(**{f"{field}__icontains": term}) for field in fields)) for term in terms
+    ))
+    pattern = re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+    start, stop = HIGHLIGHT
+    results = list(model.objects.filter(condition).order_by('id')[:limit])
+    for item in results:
+        document = ' '.join(getattr(item, field) or '' for field in fields)
+        item.rank = 0.0
+        item.snippet = pattern.sub(lambda match: f"{start}{match.group()}{stop}", document)
+    return results
+
+def search(model, query, limit=20):
+    """
+    모든 단어(접두어 일치)를 포함하는 항목을 관련도 순으로 조회
+
+    반환: rank(클수록 관련도 높음), snippet(검색어를 강조한 일부 내용) 속성을 가진 모델 인스턴스 목록
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+    table = model._meta.db_table
+    start, stop = HIGHLIGHT
+    if connection.vendor == 'sqlite':
+        fts = f"{table}_fts"
+        sql = (
+            f"SELECT {table}.*, -bm25({fts}) AS rank, snippet({fts}, -1, %s, %s, '…', 16) AS snippet "
+            f"FROM {table} JOIN {fts} ON {fts}.rowid = {table}.id "
+            f"WHERE {fts} MATCH %s ORDER BY bm25({fts}), {table}.id LIMIT %s"
+        )
+        params = [start, stop, ' '.join('"%s"*' % term for term in terms), limit]
+    elif connection.vendor == 'postgresql':
+        sql = (
+            f"SELECT {table}.*, ts_rank({_vector_sql(table)}, query) AS rank, "
+            f"ts_headline('simple', {_document_sql(table)}, query, %s) AS snippet "
+            f"FROM {table}, to_tsquery('simple', %s) query "
+            f"WHERE {_vector_sql(table)} @@ query ORDER BY rank DESC, {table}.id LIMIT %s"
+        )
+        params = [f"StartSel={start}, StopSel={stop}, MaxWords=16, MinWords=5",
+                  ' & '.join(f"{term}:*" for term in terms), limit]
+    else:
+        return _fallback_search(model, terms, limit)
+    return list(model.objects.raw(sql, params))
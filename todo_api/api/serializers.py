@@ -1,8 +1,43 @@
-from rest_framework import serializers
+from functools import lru_cache
+from operator import methodcaller
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
 from .models import Todo, Note
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
 
+class BulkListSerializer(serializers.ListSerializer):
+    """
+    목록 일괄 생성/수정 - 한 트랜잭션에서 bulk_create/bulk_update를 API_BULK_BATCH_SIZE개씩 실행
+    
+    save()와 저장 신호를 거치지 않으므로 응답 캐시 무효화와 updated_at 갱신은
+    CachedQuerySet이 처리합니다 (models.py).
+    update()의 instance는 data와 같은 순서의 모델 인스턴스 목록입니다.
+    """
+    
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        with transaction.atomic():
+            return model._default_manager.bulk_create(
+                [model(**attrs) for attrs in validated_data], batch_size=settings.API_BULK_BATCH_SIZE,
+            )
+    
+    def update(self, instances, validated_data):
+        # 부분 수정이면 항목마다 바뀐 필드가 다르므로 합집합으로 수정 (나머지는 읽어 온 값 그대로)
+        fields = {}
+        for instance, attrs in zip(instances, validated_data):
+            for attr, value in attrs.items():
+                setattr(instance, attr, value)
+            fields.update(dict.fromkeys(attrs))
+        with transaction.atomic():
+            self.child.Meta.model._default_manager.bulk_update(
+                instances, list(fields), batch_size=settings.API_BULK_BATCH_SIZE,
+            )
+        return instances
+
 class TodoSerializer(serializers.ModelSerializer):
     """
     할 일(Todo) 항목을 위한 시리얼라이저
@@ -14,10 +49,12 @@ class TodoSerializer(serializers.ModelSerializer):
     - priority: 우선순위 (High, Medium, Low)
     - status: 상태 (Pending, Completed)
     - created_at: 생성일시
+    - updated_at: 마지막 수정일시
     """
     
     # 읽기 전용 필드 추가
     created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
     
     # 선택 필드에 대한 표시 메서드
     @extend_schema_field(OpenApiTypes.STR)
@@ -30,13 +67,29 @@ class TodoSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Todo
-        fields = ['id', 'task', 'due_date', 'priority', 'status', 'created_at']
+        fields = ['id', 'task', 'due_date', 'priority', 'status', 'created_at', 'updated_at']
         extra_kwargs = {
             'task': {'help_text': '할 일 내용'},
             'due_date': {'help_text': '마감일 (YYYY-MM-DD)'},
             'priority': {'help_text': '우선순위 (High, Medium, Low)'},
             'status': {'help_text': '상태 (Pending, Completed)'},
         }
+        list_serializer_class = BulkListSerializer
+
+class TodoSearchSerializer(TodoSerializer):
+    """
+    할 일 전문 검색 결과 시리얼라이저
+    
+    TodoSerializer 필드에 더해:
+    - rank: 관련도 점수 (클수록 관련도 높음)
+    - snippet: 검색어를 <mark>로 강조한 일부 내용
+    """
+    
+    rank = serializers.FloatField(read_only=True)
+    snippet = serializers.CharField(read_only=True)
+    
+    class Meta(TodoSerializer.Meta):
+        fields = TodoSerializer.Meta.fields + ['rank', 'snippet']
 
 class NoteSerializer(serializers.ModelSerializer):
     """
@@ -46,14 +99,120 @@ class NoteSerializer(serializers.ModelSerializer):
     - id: 노트 항목의 고유 식별자
     - content: 노트 내용 (마크다운 형식 지원)
     - created_at: 생성일시
+    - updated_at: 마지막 수정일시
     """
     
     # 읽기 전용 필드 추가
     created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
     
     class Meta:
         model = Note
-        fields = ['id', 'content', 'created_at']
+        fields = ['id', 'content', 'created_at', 'updated_at']
         extra_kwargs = {
             'content': {'help_text': '노트 내용'},
         }
+        list_serializer_class = BulkListSerializer
+
+class NoteSearchSerializer(NoteSerializer):
+    """노트 전문 검색 결과 시리얼라이저 (rank, snippet 포함)"""
+    
+    rank = serializers.FloatField(read_only=True)
+    snippet = serializers.CharField(read_only=True)
+    
+    class Meta(NoteSerializer.Meta):
+        fields = NoteSerializer.Meta.fields + ['rank', 'snippet']
+
+class TodoBulkStatusSerializer(serializers.Serializer):
+    """필터 조건에 맞는 할 일의 상태 일괄 변경 요청"""
+    
+    status = serializers.ChoiceField(choices=Todo.STATUS_CHOICES, help_text='변경할 상태 (Pending, Completed)')
+
+
+class FastRowEncoder:
+    """
+    읽기 전용 목록용 빠른 변환기
+    
+    serializer_class의 읽기 필드를 한 번만 분석해 (이름, 모델 컬럼, 변환 함수) 목록으로 만들어 두고,
+    queryset.values() 행을 모델 인스턴스/필드별 serializer 없이 바로 dict로 바꿉니다.
+    결과는 serializer_class(many=True).data와 같은 값, 같은 키 순서입니다.
+    
+    모든 읽기 필드가 모델 컬럼을 그대로 가리킬 때만 사용할 수 있습니다 (supported).
+    """
+    
+    def __init__(self, serializer_class):
+        model = serializer_class.Meta.model
+        self.names, self.sources, self.converters = [], [], []
+        self.supported = True
+        for name, field in serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if not self._is_column(model, field.source):
+                self.supported = False
+                return
+            self.names.append(name)
+            self.sources.append(field.source)
+            self.converters.append(self._converter(field))
+    
+    @staticmethod
+    def _is_column(model, source):
+        try:
+            field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            return False
+        return field.concrete and not field.is_relation
+    
+    @staticmethod
+    def _iso_format(field, default):
+        output_format = getattr(field, 'format', default)
+        return output_format is not None and output_format.lower() == ISO_8601
+    
+    def _converter(self, field):
+        """
+        필드별 변환 함수를 만드는 함수 반환 - encode() 호출마다 한 번 실행
+        
+        변환 함수가 None이면 DB에서 읽은 값이 to_representation 결과와 같아 변환을 생략합니다.
+        """
+        representation = type(field).to_representation
+        if representation in (serializers.CharField.to_representation, serializers.IntegerField.to_representation):
+            return lambda: None
+        if (representation is serializers.ChoiceField.to_representation
+                and all(isinstance(choice, str) for choice in field.choices)):
+            return lambda: None
+        if (representation is serializers.DateField.to_representation
+                and self._iso_format(field, api_settings.DATE_FORMAT)):
+            return lambda: methodcaller('isoformat')
+        if (representation is serializers.DateTimeField.to_representation
+                and self._iso_format(field, api_settings.DATETIME_FORMAT)):
+            return lambda: self._datetime_converter(field)
+        return lambda: field.to_representation
+    
+    @staticmethod
+    def _datetime_converter(field):
+        # DateTimeField.to_representation과 같은 결과 - 현재 시간대는 행마다가 아니라 한 번만 조회
+        field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+        if field_timezone is None:
+            return field.to_representation
+        
+        def convert(value):
+            if isinstance(value, str) or value.utcoffset() is None:
+                return field.to_representation(value)
+            value = value.astimezone(field_timezone).isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+        return convert
+    
+    def encode(self, rows):
+        """values() 행(dict) 목록 -> serializer 표현(dict) 목록 (None은 변환하지 않음)"""
+        fields = list(zip(self.names, self.sources, [bind() for bind in self.converters]))
+        encoded = []
+        for row in rows:
+            item = {}
+            for name, source, convert in fields:
+                value = row[source]
+                item[name] = value if convert is None or value is None else convert(value)
+            encoded.append(item)
+        return encoded
+
+@lru_cache(maxsize=None)
+def get_row_encoder(serializer_class):
+    return FastRowEncoder(serializer_class)
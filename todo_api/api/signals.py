@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Todo, Note
+from .response_cache import invalidate, mark_deleted
+
+@receiver([post_save, post_delete], sender=Todo)
+@receiver([post_save, post_delete], sender=Note)
+def invalidate_response_cache(sender, using=None, **kwargs):
+    # 저장/삭제 시 해당 모델의 API 응답 캐시 무효화
+    invalidate(sender, using)
+
+@receiver(post_delete, sender=Todo)
+@receiver(post_delete, sender=Note)
+def record_deletion(sender, **kwargs):
+    # 컬렉션 Last-Modified 계산용 (삭제는 updated_at에 남지 않음)
+    mark_deleted(sender)
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    # 새 SQLite 연결 튜닝 (settings.SQLITE_PRAGMAS) - 지속 연결이면 연결당 한 번만 실행
+    if connection.vendor != 'sqlite':
+        return
+    cursor = connection.connection.cursor()
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
@@ -1,10 +1,25 @@
-from django.test import TestCase
+import tempfile
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 from .models import Todo, Note
 import json
-from datetime import date
+import os
+import time
+from unittest import mock, skipUnless
+from datetime import date, timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date, parse_http_date
+from rest_framework.renderers import JSONRenderer
+from .renderers import FastJSONRenderer
+from .serializers import TodoSerializer, get_row_encoder
+from .views import TodoViewSet, NoteViewSet
 
 class TodoAPITest(TestCase):
     """Todo API 테스트 클래스"""
@@ -119,6 +134,110 @@ class TodoAPITest(TestCase):
         self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0]['task'], '중요한 할 일')
 
+    def test_todo_stats(self):
+        """할 일 통계 테스트"""
+        today = timezone.localdate()
+        Todo.objects.create(task='지난 할 일', due_date=today - timedelta(days=1), priority='High', status='Pending')
+        Todo.objects.create(task='오늘 할 일', due_date=today, priority='High', status='Pending')
+        Todo.objects.create(task='완료된 할 일', due_date=today - timedelta(days=3), priority='Low', status='Completed')
+        
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('todo-stats'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total'], 4)
+        self.assertEqual(response.data['completed'], 1)
+        self.assertEqual(response.data['completion_rate'], 25.0)
+        self.assertEqual(response.data['by_priority'], {'High': 2, 'Medium': 1, 'Low': 1})
+        self.assertEqual(response.data['overdue'], Todo.objects.filter(
+            status='Pending', due_date__lt=today).count())
+        self.assertEqual(response.data['due_this_week'], Todo.objects.filter(
+            status='Pending', due_date__gte=today,
+            due_date__lte=today + timedelta(days=6 - today.weekday())).count())
+        
+        # 필터 적용
+        response = self.client.get(f"{reverse('todo-stats')}?priority=High")
+        self.assertEqual(response.data['total'], 2)
+
+    def test_full_text_search_todos(self):
+        """할 일 전문 검색 테스트 (쓰기 시 색인 갱신 포함)"""
+        report = Todo.objects.create(task='분기 보고서 작성', due_date='2025-03-20')
+        Todo.objects.create(task='보고서 검토 회의', due_date='2025-03-21')
+        search_url = reverse('todo-full-text-search')
+        
+        response = self.client.get(search_url, {'q': '보고서'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+        self.assertIn('<mark>보고서</mark>', response.data[0]['snippet'])
+        self.assertIn('rank', response.data[0])
+        
+        # 모든 단어 포함 + 접두어 일치
+        response = self.client.get(search_url, {'q': '보고 회의'})
+        self.assertEqual([todo['task'] for todo in response.data], ['보고서 검토 회의'])
+        
+        # 수정/삭제가 색인에 반영됨
+        report.task = '분기 계획 작성'
+        report.save()
+        response = self.client.get(search_url, {'q': '계획'})
+        self.assertEqual([todo['id'] for todo in response.data], [report.id])
+        report.delete()
+        response = self.client.get(search_url, {'q': '계획'})
+        self.assertEqual(response.data, [])
+        
+        # 검색어 없음
+        response = self.client.get(search_url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_full_text_search_fallback(self):
+        """색인을 지원하지 않는 데이터베이스에서는 icontains 필터로 검색"""
+        Todo.objects.create(task='분기 보고서 작성', due_date='2025-03-20')
+        Todo.objects.create(task='보고서 검토 회의', due_date='2025-03-21')
+        
+        with mock.patch.object(connection, 'vendor', 'mysql'):
+            response = self.client.get(reverse('todo-full-text-search'), {'q': '보고 회의'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([todo['task'] for todo in response.data], ['보고서 검토 회의'])
+        self.assertEqual(response.data[0]['snippet'], '<mark>보고</mark>서 검토 <mark>회의</mark>')
+        self.assertEqual(response.data[0]['rank'], 0.0)
+
+    def test_priority_ordering(self):
+        """우선순위 정렬 테스트 (High, Medium, Low 순, priority_rank 유지)"""
+        low = Todo.objects.create(task='낮음', due_date='2025-03-01', priority='Low')
+        high = Todo.objects.create(task='높음', due_date='2025-03-20', priority='High')
+        
+        response = self.client.get(self.todos_url, {'ordering': 'priority,due_date'})
+        self.assertEqual([todo['id'] for todo in response.data['results']], [high.id, self.todo.id, low.id])
+        response = self.client.get(self.todos_url, {'ordering': '-priority'})
+        self.assertEqual([todo['id'] for todo in response.data['results']], [low.id, self.todo.id, high.id])
+        
+        # API 수정과 queryset.update()에도 priority_rank가 따라감
+        self.client.patch(reverse('todo-detail', kwargs={'pk': low.pk}), {'priority': 'High'}, format='json')
+        Todo.objects.filter(pk=high.pk).update(priority='Low')
+        self.assertEqual(Todo.objects.get(pk=low.pk).priority_rank, 1)
+        self.assertEqual(Todo.objects.get(pk=high.pk).priority_rank, 3)
+
+    def test_cursor_pagination(self):
+        """커서 페이지네이션 테스트 (중복/누락 없이 정렬 순서대로 전체 조회)"""
+        priorities = ['High', 'Medium', 'Low']
+        Todo.objects.bulk_create([
+            Todo(task=f'할 일 {i}', due_date=date(2025, 3, 1) + timedelta(days=i % 4), priority=priorities[i % 3])
+            for i in range(25)
+        ])
+        expected = list(Todo.objects.order_by('priority_rank', 'due_date', 'id').values_list('id', flat=True))
+        
+        ids, url = [], self.todos_url
+        params = {'pagination': 'cursor', 'ordering': 'priority,due_date', 'page_size': 7}
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            ids += [todo['id'] for todo in response.data['results']]
+            url, params = response.data['next'], None
+        self.assertEqual(ids, expected)
+        
+        # 잘못된 커서
+        response = self.client.get(self.todos_url, {'cursor': 'invalid'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
 class NoteAPITest(TestCase):
     """Note API 테스트 클래스"""
     
@@ -198,3 +317,542 @@ class NoteAPITest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0]['content'], '중요한 회의 내용')
+    
+    def test_full_text_search_notes(self):
+        """노트 전문 검색 테스트"""
+        Note.objects.create(content='중요한 회의 내용')
+        Note.objects.create(content='프로젝트 아이디어 회의')
+        Note.objects.create(content='장보기 목록')
+        
+        response = self.client.get(reverse('note-full-text-search'), {'q': '회의', 'limit': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertIn('<mark>회의</mark>', response.data[0]['snippet'])
+
+
+class FastListTest(TestCase):
+    """빠른 목록 경로 테스트 (기존 serializer 응답과 바이트 비교, 처리량 측정)"""
+    
+    def setUp(self):
+        self.client = APIClient()
+        texts = ['일반 할 일', '따옴표 "와" \\ 역슬래시', '줄바꿈\n탭\t제어\x01문자', '구분자\u2028\u2029', '이모지 ✅🎉']
+        Todo.objects.bulk_create([
+            Todo(task=f'{texts[i % len(texts)]} {i}', due_date=date(2025, 3, 1) + timedelta(days=i % 9),
+                 priority=['High', 'Medium', 'Low'][i % 3], status=['Pending', 'Completed'][i % 2])
+            for i in range(30)
+        ])
+        Note.objects.bulk_create([Note(content=f'{texts[i % len(texts)]} 노트 {i}') for i in range(15)])
+    
+    def assertSameResponse(self, viewset, url, params=None):
+        fast = self.client.get(url, params)
+        cache.clear()  # 캐시된 응답이 아니라 기존 경로로 다시 생성
+        with mock.patch.object(viewset, 'fast_list', False):
+            slow = self.client.get(url, params)
+        self.assertEqual(fast.status_code, status.HTTP_200_OK)
+        self.assertEqual(fast['Content-Type'], slow['Content-Type'])
+        self.assertEqual(fast.content, slow.content)
+        return fast
+    
+    def test_identical_output(self):
+        todos_url = reverse('todo-list')
+        self.assertSameResponse(TodoViewSet, todos_url, {'ordering': 'id'})
+        self.assertSameResponse(TodoViewSet, todos_url, {'ordering': '-priority,due_date', 'page': 2})
+        self.assertSameResponse(TodoViewSet, todos_url, {'status': 'Completed', 'search': '할 일', 'ordering': 'due_date'})
+        response = self.assertSameResponse(TodoViewSet, todos_url, {'pagination': 'cursor', 'ordering': 'priority'})
+        self.assertSameResponse(TodoViewSet, response.data['next'])
+        self.assertSameResponse(NoteViewSet, reverse('note-list'), {'ordering': '-created_at'})
+        
+        # 들여쓰기 요청은 기존 경로로 렌더링
+        response = self.client.get(todos_url, {'ordering': 'id'}, HTTP_ACCEPT='application/json; indent=2')
+        self.assertIn(b'\n  ', response.content)
+    
+    @skipUnless(os.environ.get('RUN_BENCHMARKS'), 'RUN_BENCHMARKS=1일 때만 처리량 측정')
+    def test_fast_list_benchmark(self):
+        """
+        목록 직렬화 처리량 비교 (serializer + JSONRenderer vs values() + FastRowEncoder + FastJSONRenderer)
+        
+        실행 환경에 따라 결과가 달라지므로 측정값만 출력하고 성능 비교는 검사하지 않음.
+        실행: RUN_BENCHMARKS=1 python manage.py test api.tests.FastListTest
+        """
+        Todo.objects.bulk_create([
+            Todo(task=f'벤치마크 할 일 {i}', due_date=date(2025, 1, 1) + timedelta(days=i % 365),
+                 priority=['High', 'Medium', 'Low'][i % 3])
+            for i in range(5000)
+        ])
+        queryset = Todo.objects.order_by('id')
+        rows = queryset.count()
+        encoder = get_row_encoder(TodoSerializer)
+        
+        start = time.perf_counter()
+        before = JSONRenderer().render(TodoSerializer(queryset.all(), many=True).data)
+        before_rate = rows / (time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        after = FastJSONRenderer().render(encoder.encode(queryset.values(*encoder.sources)))
+        after_rate = rows / (time.perf_counter() - start)
+        
+        self.assertEqual(after, before)
+        print(f"\n목록 직렬화 {rows}행: 기존 {before_rate:,.0f} rows/s -> 빠른 경로 {after_rate:,.0f} rows/s "
+              f"({after_rate / before_rate:.1f}배)")
+
+
+class QueryPlanTest(TestCase):
+    """
+    목록 API가 실행하는 쿼리의 실행 계획 테스트
+    
+    지원하는 필터/정렬 조합마다 실제 요청의 쿼리를 EXPLAIN해서
+    전체 테이블 스캔이나 별도 정렬(인덱스를 사용하지 않는 ORDER BY)이 있으면 실패합니다.
+    """
+    
+    FILTERS = [{}, {'status': 'Pending'}, {'priority': 'High'}, {'status': 'Completed', 'priority': 'Low'}]
+    TODO_ORDERINGS = [None, 'due_date', '-due_date', 'priority', '-priority', 'created_at', '-created_at']
+    
+    def setUp(self):
+        self.client = APIClient()
+        cache.clear()
+        Todo.objects.bulk_create([
+            Todo(task=f'할 일 {i}', due_date=date(2025, 3, 1) + timedelta(days=i % 7),
+                 priority=['High', 'Medium', 'Low'][i % 3], status=['Pending', 'Completed'][i % 2])
+            for i in range(60)
+        ])
+        Note.objects.bulk_create([Note(content=f'노트 {i}') for i in range(30)])
+    
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # 작은 테스트 테이블에서는 순차 스캔이 더 싸므로 인덱스 사용 가능 여부만 확인
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute(f"EXPLAIN {sql}")
+            else:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            return '\n'.join(str(row[-1]) for row in cursor.fetchall())
+    
+    def assertIndexedPlan(self, url, params, filtered):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for query in context.captured_queries:
+            plan = self.explain(query['sql'])
+            message = f"{params}\n{query['sql']}\n{plan}"
+            if connection.vendor == 'postgresql':
+                self.assertNotIn('Seq Scan', plan, message)
+                self.assertNotIn('Sort Key', plan, message)
+                continue
+            self.assertNotIn('TEMP B-TREE', plan, message)
+            # 필터가 있으면 인덱스 검색(SEARCH), 없으면 인덱스 순서대로 읽기(SCAN ... USING INDEX)만 허용
+            # (조건부 GET의 컬렉션 전체 MAX(updated_at)/COUNT 집계는 WHERE 없이 인덱스만 읽음)
+            for line in plan.splitlines():
+                if line.startswith('SCAN'):
+                    self.assertFalse(filtered and ' WHERE ' in query['sql'], message)
+                    self.assertIn('INDEX', line, message)
+    
+    def test_todo_list_plans(self):
+        url = reverse('todo-list')
+        for filters in self.FILTERS:
+            for ordering in self.TODO_ORDERINGS:
+                if not filters and ordering is None:
+                    continue  # 필터/정렬 없는 목록은 id 순서 그대로 읽음
+                params = {**filters, **({'ordering': ordering} if ordering else {})}
+                with self.subTest(**params):
+                    self.assertIndexedPlan(url, params, bool(filters))
+                    # 커서 페이지네이션 두 번째 페이지 (seek)
+                    response = self.client.get(url, {**params, 'pagination': 'cursor', 'page_size': 5})
+                    self.assertIndexedPlan(response.data['next'], None, bool(filters))
+    
+    def test_note_list_plans(self):
+        url = reverse('note-list')
+        for ordering in ['created_at', '-created_at']:
+            with self.subTest(ordering=ordering):
+                self.assertIndexedPlan(url, {'ordering': ordering}, False)
+
+
+class ResponseCacheTest(TestCase):
+    """응답 캐시 테스트 (세대 번호 무효화, hit/miss 횟수, locmem/file 캐시)"""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.todo = Todo.objects.create(task='캐시 할 일', due_date='2025-03-15')
+        self.todos_url = reverse('todo-list')
+        self.stats_url = reverse('todo-cache-stats')
+    
+    def assertCached(self, url, params=None):
+        first = self.client.get(url, params)
+        with self.assertNumQueries(0):
+            second = self.client.get(url, params)
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(first.content, second.content)
+        return json.loads(second.content)
+    
+    def check_invalidation(self):
+        cache.clear()
+        response_cache_stats = self.client.get(self.stats_url).data
+        detail_url = reverse('todo-detail', kwargs={'pk': self.todo.pk})
+        
+        self.assertEqual(self.assertCached(self.todos_url)['count'], 1)
+        self.assertEqual(self.assertCached(detail_url)['task'], '캐시 할 일')
+        self.assertCached(self.todos_url, {'status': 'Pending', 'ordering': 'due_date'})
+        self.assertCached(reverse('todo-stats'))
+        
+        # API 쓰기 (post_save)
+        self.client.patch(detail_url, {'task': '수정된 할 일'}, format='json')
+        self.assertEqual(self.assertCached(detail_url)['task'], '수정된 할 일')
+        # QuerySet 일괄 수정 (신호 없음)
+        Todo.objects.filter(pk=self.todo.pk).update(status='Completed')
+        self.assertEqual(self.assertCached(detail_url)['status'], 'Completed')
+        self.assertEqual(self.assertCached(reverse('todo-stats'))['completed'], 1)
+        # 생성/삭제 (post_save/post_delete)
+        other = Todo.objects.create(task='다른 할 일', due_date='2025-03-16')
+        self.assertEqual(self.assertCached(self.todos_url)['count'], 2)
+        other.delete()
+        self.assertEqual(self.assertCached(self.todos_url)['count'], 1)
+        # 노트 쓰기는 할 일 캐시에 영향 없음
+        Note.objects.create(content='노트')
+        self.assertEqual(self.client.get(self.todos_url)['X-Cache'], 'HIT')
+        
+        stats = self.client.get(self.stats_url).data
+        self.assertEqual(stats['hits'] - response_cache_stats['hits'], 10)
+        self.assertEqual(stats['misses'] - response_cache_stats['misses'], 9)
+        self.assertIn('api.todo', stats['generations'])
+    
+    def test_locmem_cache(self):
+        self.check_invalidation()
+    
+    def test_file_cache(self):
+        with tempfile.TemporaryDirectory() as location:
+            with override_settings(CACHES={'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': location,
+            }}):
+                self.check_invalidation()
+    
+    def test_uncached_responses(self):
+        # HTML(Browsable API) 응답과 오류 응답은 저장하지 않음
+        for params in [{'format': 'api'}, {'status': 'Unknown'}]:
+            with self.subTest(**params):
+                self.client.get(self.todos_url, params)
+                self.assertNotIn('X-Cache', self.client.get(self.todos_url, params))
+        with override_settings(API_RESPONSE_CACHE_TIMEOUT=0):
+            self.assertNotIn('X-Cache', self.client.get(self.todos_url))
+
+
+@override_settings(API_RESPONSE_CACHE_TIMEOUT=0)
+class ConditionalGetTest(TestCase):
+    """조건부 GET 테스트 (ETag/Last-Modified, 304) - 응답 캐시 없이 확인"""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.todo = Todo.objects.create(task='조건부 할 일', due_date='2025-03-15')
+        self.todos_url = reverse('todo-list')
+        self.detail_url = reverse('todo-detail', kwargs={'pk': self.todo.pk})
+    
+    def test_list_not_modified(self):
+        response = self.client.get(self.todos_url, {'ordering': 'due_date'})
+        etag, last_modified = response['ETag'], response['Last-Modified']
+        
+        # 집계 쿼리 한 번 후 목록 쿼리/serializer 없이 304
+        with self.assertNumQueries(1):
+            response = self.client.get(self.todos_url, {'ordering': 'due_date'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        response = self.client.get(self.todos_url, {'ordering': 'due_date'}, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        earlier = http_date(parse_http_date(last_modified) - 10)
+        response = self.client.get(self.todos_url, {'ordering': 'due_date'}, HTTP_IF_MODIFIED_SINCE=earlier)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        # 쿼리 문자열이 다르면 ETag도 다름
+        self.assertNotEqual(self.client.get(self.todos_url, {'ordering': 'priority'})['ETag'], etag)
+        
+        # 수정(QuerySet 일괄 수정 포함), 생성, 삭제 후에는 새 응답
+        for write in [
+            lambda: Todo.objects.filter(pk=self.todo.pk).update(status='Completed'),
+            lambda: Todo.objects.create(task='새 할 일', due_date='2025-03-16'),
+            lambda: Todo.objects.filter(task='새 할 일').delete(),
+        ]:
+            write()
+            response = self.client.get(self.todos_url, {'ordering': 'due_date'}, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotEqual(response['ETag'], etag)
+            etag = response['ETag']
+    
+    def test_detail_not_modified(self):
+        response = self.client.get(self.detail_url)
+        etag = response['ETag']
+        self.assertIn('updated_at', response.data)
+        
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        self.client.patch(self.detail_url, {'priority': 'High'}, format='json')
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertGreater(Todo.objects.get(pk=self.todo.pk).updated_at, self.todo.updated_at)
+        
+        # 없는 항목은 그대로 404
+        response = self.client.get(reverse('todo-detail', kwargs={'pk': 0}), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=300)
+    def test_cached_not_modified(self):
+        # 응답 캐시에 있으면 쿼리 없이 304
+        cache.clear()
+        etag = self.client.get(self.todos_url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.todos_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+
+@override_settings(API_RESPONSE_CACHE_TIMEOUT=0)
+class AsyncViewTest(TestCase):
+    """비동기 뷰 테스트 (DRF 뷰셋과 같은 응답인지 비교)"""
+    
+    def setUp(self):
+        self.client = APIClient()
+        Todo.objects.bulk_create([
+            Todo(task=f'할 일 {i}', due_date=date(2025, 3, 1) + timedelta(days=i % 5),
+                 priority=['High', 'Medium', 'Low'][i % 3], status=['Pending', 'Completed'][i % 2])
+            for i in range(25)
+        ])
+        Note.objects.bulk_create([Note(content=f'노트 {i}') for i in range(12)])
+        self.todo = Todo.objects.order_by('id').first()
+    
+    def async_request(self, method, url, data=None, **params):
+        request = getattr(self.async_client, method)
+        if method == 'get':
+            return async_to_sync(request)(url, params)
+        return async_to_sync(request)(url, json.dumps(data), content_type='application/json')
+    
+    def test_list(self):
+        for name in ['todo', 'note']:
+            for params in [{}, {'page': 2}, {'page': 9}, {'ordering': '-created_at'},
+                           {'status': 'Completed', 'priority': 'High', 'ordering': 'due_date'},
+                           {'search': '1', 'ordering': 'priority'}, {'priority': 'Unknown'},
+                           {'pagination': 'cursor', 'ordering': '-priority', 'page_size': 7}]:
+                if name == 'note' and ({'status', 'priority'} & set(params) or params.get('ordering') in ('due_date', 'priority', '-priority')):
+                    continue
+                with self.subTest(name=name, **params):
+                    expected = self.client.get(reverse(f'{name}-list'), params)
+                    response = self.async_request('get', reverse(f'async-{name}-list'), **params)
+                    self.assertEqual(response.status_code, expected.status_code)
+                    # 페이지 링크(next/previous)만 비동기 URL로 다름
+                    self.assertEqual(response.content, expected.content.replace(b'http://testserver/api/', b'http://testserver/api/async/'))
+        
+        # 커서로 다음 페이지
+        response = self.async_request('get', reverse('async-todo-list'), pagination='cursor', page_size=10)
+        response = async_to_sync(self.async_client.get)(json.loads(response.content)['next'])
+        self.assertEqual(len(json.loads(response.content)['results']), 10)
+    
+    def test_detail_and_writes(self):
+        url = reverse('async-todo-detail', kwargs={'pk': self.todo.pk})
+        response = self.async_request('get', url)
+        self.assertEqual(response.content, self.client.get(reverse('todo-detail', kwargs={'pk': self.todo.pk})).content)
+        
+        # 생성 (검증 오류 포함)
+        response = self.async_request('post', reverse('async-todo-list'),
+                                      {'task': '비동기 할 일', 'due_date': '2025-04-01', 'priority': 'High'})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        created = Todo.objects.get(task='비동기 할 일')
+        self.assertEqual(created.priority_rank, 1)
+        self.assertEqual(response.content, self.client.get(reverse('todo-detail', kwargs={'pk': created.pk})).content)
+        invalid = {'task': '', 'due_date': 'tomorrow'}
+        response = self.async_request('post', reverse('async-todo-list'), invalid)
+        expected = self.client.post(reverse('todo-list'), invalid, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.content, expected.content)
+        
+        # 수정 / 부분 수정
+        response = self.async_request('put', url, {'task': '전체 수정', 'due_date': '2025-05-01',
+                                                   'priority': 'Low', 'status': 'Completed'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Todo.objects.get(pk=self.todo.pk).priority_rank, 3)
+        response = self.async_request('patch', url, {'status': 'Pending'})
+        self.assertEqual(json.loads(response.content)['status'], 'Pending')
+        self.assertEqual(json.loads(response.content)['task'], '전체 수정')
+        
+        # 삭제 / 없는 항목 / 허용되지 않는 메서드
+        response = self.async_request('delete', url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Todo.objects.filter(pk=self.todo.pk).exists())
+        response = self.async_request('get', url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.content, self.client.get(reverse('todo-detail', kwargs={'pk': self.todo.pk})).content)
+        response = self.async_request('delete', reverse('async-todo-list'))
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+class BulkAPITest(TestCase):
+    """일괄 생성/수정 테스트 (배치 INSERT/UPDATE, 한 트랜잭션)"""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.todos_url = reverse('todo-list')
+        self.bulk_url = reverse('todo-bulk-update')
+    
+    def post(self, url, data):
+        return self.client.post(url, data=json.dumps(data), content_type='application/json')
+    
+    def count_queries(self, queries, statement):
+        return sum(query['sql'].startswith(statement) for query in queries)
+    
+    @override_settings(API_BULK_BATCH_SIZE=100)
+    def test_bulk_create(self):
+        items = [{'task': f'가져온 할 일 {i}', 'due_date': '2025-03-10', 'priority': ['High', 'Medium', 'Low'][i % 3]}
+                 for i in range(1200)]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post(self.todos_url, items)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 1200)
+        self.assertEqual(self.count_queries(queries, 'INSERT'), 12)
+        self.assertEqual(Todo.objects.count(), 1200)
+        self.assertEqual(Todo.objects.filter(priority_rank=1).count(), 400)
+        created = Todo.objects.get(pk=response.data[0]['id'])
+        self.assertEqual(response.data[0], TodoSerializer(created).data)
+        
+        # 한 항목이라도 잘못되면 아무것도 저장하지 않음
+        response = self.post(self.todos_url, [{'task': '정상', 'due_date': '2025-03-10'}, {'task': '', 'due_date': 'x'}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(set(response.data[1]), {'task', 'due_date'})
+        self.assertEqual(Todo.objects.count(), 1200)
+        
+        # 노트, 비동기 뷰
+        response = self.post(reverse('note-list'), [{'content': '노트 1'}, {'content': '노트 2'}])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = async_to_sync(self.async_client.post)(reverse('async-note-list'), json.dumps([{'content': '노트 3'}]),
+                                                         content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(list(Note.objects.order_by('id').values_list('content', flat=True)), ['노트 1', '노트 2', '노트 3'])
+    
+    def test_bulk_update(self):
+        todos = Todo.objects.bulk_create([
+            Todo(task=f'할 일 {i}', due_date=date(2025, 3, 1), priority='Medium') for i in range(5)
+        ])
+        before = Todo.objects.get(pk=todos[2].pk).updated_at
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.bulk_url, data=json.dumps([
+                {'id': todos[0].pk, 'status': 'Completed'},
+                {'id': todos[1].pk, 'priority': 'High', 'task': '바뀐 할 일'},
+                {'id': todos[2].pk},
+            ]), content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['id'] for item in response.data], [todo.pk for todo in todos[:3]])
+        self.assertEqual(self.count_queries(queries, 'UPDATE'), 1)
+        values = {todo.pk: todo for todo in Todo.objects.all()}
+        self.assertEqual(values[todos[0].pk].status, 'Completed')
+        self.assertEqual(values[todos[0].pk].priority, 'Medium')
+        self.assertEqual((values[todos[1].pk].task, values[todos[1].pk].priority_rank), ('바뀐 할 일', 1))
+        self.assertEqual(values[todos[1].pk].status, 'Pending')
+        self.assertGreater(values[todos[2].pk].updated_at, before)
+        
+        # 전체 수정은 필수 필드 검증 - 실패하면 아무것도 저장하지 않음
+        response = self.client.put(self.bulk_url, data=json.dumps([
+            {'id': todos[3].pk, 'task': '전체 수정', 'due_date': '2025-05-01', 'priority': 'Low', 'status': 'Pending'},
+            {'id': todos[4].pk, 'task': '필수 필드 누락'},
+        ]), content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('due_date', response.data[1])
+        self.assertEqual(Todo.objects.get(pk=todos[3].pk).task, '할 일 3')
+        
+        # id 누락/중복/없는 항목
+        for items, status_code in [([{'task': 'id 없음'}], status.HTTP_400_BAD_REQUEST),
+                                   ({'id': todos[0].pk}, status.HTTP_400_BAD_REQUEST),
+                                   ([{'id': todos[0].pk}, {'id': todos[0].pk}], status.HTTP_400_BAD_REQUEST),
+                                   ([{'id': todos[0].pk, 'status': 'Pending'}, {'id': 99999}], status.HTTP_404_NOT_FOUND)]:
+            with self.subTest(items=items):
+                response = self.client.patch(self.bulk_url, data=json.dumps(items), content_type='application/json')
+                self.assertEqual(response.status_code, status_code)
+        self.assertEqual(Todo.objects.get(pk=todos[0].pk).status, 'Completed')
+    
+    def test_list_body_on_detail(self):
+        """단건 수정에 배열을 보내면 뷰셋/비동기 뷰 모두 400 (일괄 처리하지 않음)"""
+        todo = Todo.objects.create(task='단건', due_date='2025-03-01')
+        items = [{'id': todo.pk, 'task': '배열', 'due_date': '2025-03-02', 'priority': 'Low', 'status': 'Pending'}]
+        body = json.dumps(items)
+        for method in ['put', 'patch']:
+            with self.subTest(method=method):
+                responses = [
+                    getattr(self.client, method)(reverse('todo-detail', kwargs={'pk': todo.pk}), body,
+                                                 content_type='application/json'),
+                    async_to_sync(getattr(self.async_client, method))(reverse('async-todo-detail', kwargs={'pk': todo.pk}),
+                                                                      body, content_type='application/json'),
+                ]
+                for response in responses:
+                    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                    self.assertIn('non_field_errors', json.loads(response.content))
+        self.assertEqual(Todo.objects.get(pk=todo.pk).task, '단건')
+    
+    def test_bulk_status(self):
+        today = timezone.localdate()
+        Todo.objects.bulk_create([
+            Todo(task=f'할 일 {i}', due_date=today + timedelta(days=i % 4 - 2),
+                 priority=['High', 'Low'][i % 2], status=['Pending', 'Completed'][i % 3 == 0])
+            for i in range(24)
+        ])
+        overdue_high = Todo.objects.filter(priority='High', status='Pending', due_date__lt=today)
+        expected = overdue_high.count()
+        self.assertGreater(expected, 0)
+        self.assertEqual(self.client.get(self.todos_url, {'overdue': 'true', 'priority': 'High'}).data['count'], expected)
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post(f"{reverse('todo-bulk-status')}?overdue=true&priority=High", {'status': 'Completed'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'updated': expected})
+        self.assertEqual(self.count_queries(queries, 'UPDATE'), 1)
+        self.assertEqual(self.count_queries(queries, 'SELECT'), 0)
+        self.assertFalse(overdue_high.exists())
+        
+        # 응답 캐시도 바로 갱신
+        self.assertEqual(self.client.get(self.todos_url, {'overdue': 'true', 'priority': 'High'}).data['count'], 0)
+        self.assertEqual(self.client.get(self.todos_url, {'overdue': 'false'}).data['count'],
+                         Todo.objects.count() - Todo.objects.filter(status='Pending', due_date__lt=today).count())
+        
+        response = self.post(reverse('todo-bulk-status'), {'status': 'Done'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        # 필터 없음(빈 값 포함)은 전체 변경이 되므로 거부
+        completed = Todo.objects.filter(status='Completed').count()
+        for query in ['', '?search=', '?ordering=due_date']:
+            with self.subTest(query=query):
+                response = self.post(f"{reverse('todo-bulk-status')}{query}", {'status': 'Pending'})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('filter', response.data)
+        self.assertEqual(Todo.objects.filter(status='Completed').count(), completed)
+
+class DatabaseSettingsTest(TestCase):
+    """SQLite 연결 설정 테스트 (PRAGMA, 지속 연결)"""
+    
+    def open_connection(self, path):
+        wrapper = DatabaseWrapper({**connection.settings_dict, 'NAME': path}, alias='pragma-test')
+        wrapper.ensure_connection()
+        self.addCleanup(wrapper.close)
+        return wrapper
+    
+    def pragma(self, wrapper, name):
+        with wrapper.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+    
+    def test_sqlite_pragmas(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            wrapper = self.open_connection(f"{tmp}/pragma.sqlite3")
+            self.assertEqual(self.pragma(wrapper, 'journal_mode'), 'wal')
+            self.assertEqual(self.pragma(wrapper, 'synchronous'), 1)  # NORMAL
+            self.assertEqual(self.pragma(wrapper, 'busy_timeout'), 5000)
+            self.assertEqual(self.pragma(wrapper, 'cache_size'), -65536)
+            self.assertEqual(self.pragma(wrapper, 'temp_store'), 2)  # MEMORY
+            wrapper.close()
+            
+            # 설정을 바꾸면 다음 연결부터 적용
+            pragmas = {'journal_mode': 'DELETE', 'synchronous': 'FULL', 'busy_timeout': 100}
+            with override_settings(SQLITE_PRAGMAS=pragmas):
+                wrapper = self.open_connection(f"{tmp}/pragma.sqlite3")
+                self.assertEqual(self.pragma(wrapper, 'journal_mode'), 'delete')
+                self.assertEqual(self.pragma(wrapper, 'synchronous'), 2)
+                self.assertEqual(self.pragma(wrapper, 'busy_timeout'), 100)
+    
+    def test_persistent_connection(self):
+        self.assertGreater(connection.settings_dict['CONN_MAX_AGE'], 0)
+        self.assertTrue(connection.settings_dict['CONN_HEALTH_CHECKS'])
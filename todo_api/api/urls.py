@@ -1,11 +1,17 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import TodoViewSet, NoteViewSet
+from .async_views import AsyncTodoView, AsyncNoteView
 
 router = DefaultRouter()
 router.register(r'todos', TodoViewSet)
 router.register(r'notes', NoteViewSet)
 
 urlpatterns = [
+    # 네이티브 비동기 뷰 (ASGI 서버용, 응답은 아래 뷰셋과 같음)
+    path('async/todos/', AsyncTodoView.as_view(), name='async-todo-list'),
+    path('async/todos/<int:pk>/', AsyncTodoView.as_view(), name='async-todo-detail'),
+    path('async/notes/', AsyncNoteView.as_view(), name='async-note-list'),
+    path('async/notes/<int:pk>/', AsyncNoteView.as_view(), name='async-note-detail'),
     path('', include(router.urls)),
 ]
@@ -1,12 +1,243 @@
 from django.shortcuts import render
 from rest_framework import viewsets
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.filters import SearchFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Todo, Note
-from .serializers import TodoSerializer, NoteSerializer
+from .serializers import (TodoSerializer, NoteSerializer, TodoSearchSerializer, NoteSearchSerializer,
+                          TodoBulkStatusSerializer, get_row_encoder)
+from .search import search
+from .filters import MappedOrderingFilter, TodoFilter
+from .pagination import OptionalCursorPagination
+from .renderers import FastJSONRenderer
+from . import response_cache
+import hashlib
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
+# 전문 검색 결과 최대 개수
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+SEARCH_PARAMETERS = [
+    OpenApiParameter(name="q", description="검색어 (모든 단어를 포함하는 항목, 접두어 일치)", type=OpenApiTypes.STR, required=True),
+    OpenApiParameter(name="limit", description=f"최대 결과 수 (기본 {DEFAULT_SEARCH_LIMIT}, 최대 {MAX_SEARCH_LIMIT})", type=OpenApiTypes.INT),
+]
+
+class ResponseCacheMixin:
+    """
+    GET 응답 캐시 - 렌더링된 JSON 응답을 (전체 URL, Accept, 모델 세대 번호) 키로 저장
+    
+    저장/삭제 신호와 QuerySet 일괄 수정이 세대 번호를 올리므로 쓰기 직후부터 새 응답을 반환합니다.
+    응답에는 X-Cache: HIT/MISS 헤더가 붙고, /cache-stats/에서 hit/miss 횟수를 볼 수 있습니다.
+    """
+    cache_models = None  # 응답이 의존하는 모델 (기본: queryset.model)
+    uncached_actions = ('cache_stats',)
+    
+    def get_cache_models(self):
+        return self.cache_models or [self.queryset.model]
+    
+    def get_cache_name(self):
+        return getattr(self, 'basename', None) or type(self).__name__
+    
+    def dispatch(self, request, *args, **kwargs):
+        # self.action은 super().dispatch()에서 정해지므로 action_map으로 확인
+        action = self.action_map.get('get') if request.method == 'GET' else None
+        timeout = settings.API_RESPONSE_CACHE_TIMEOUT
+        if action is None or action in self.uncached_actions or timeout <= 0:
+            return super().dispatch(request, *args, **kwargs)
+        
+        name = self.get_cache_name()
+        key = response_cache.response_key(name, self.get_cache_models(), request)
+        response = response_cache.cache.get(key)
+        response_cache.stats.record(name, hit=response is not None)
+        if response is not None:
+            response['X-Cache'] = 'HIT'
+            # 캐시된 응답의 ETag/Last-Modified로 조건부 GET 처리 (쿼리 없음)
+            return get_conditional_response(
+                request, etag=response.get('ETag'),
+                last_modified=parse_http_date_safe(response.get('Last-Modified')), response=response,
+            ) or response
+        
+        response = super().dispatch(request, *args, **kwargs)
+        # JSON 성공 응답만 저장 (Browsable API 등 HTML 응답 제외)
+        if response.status_code == 200 and isinstance(getattr(response, 'accepted_renderer', None), JSONRenderer):
+            response.render()
+            response_cache.cache.set(key, response, timeout)
+            response['X-Cache'] = 'MISS'
+        return response
+    
+    @extend_schema(
+        summary="응답 캐시 통계",
+        description="이 프로세스의 응답 캐시 hit/miss 횟수와 현재 세대 번호를 조회합니다.",
+        responses=OpenApiTypes.OBJECT
+    )
+    @action(detail=False, methods=['get'], url_path='cache-stats', filter_backends=[], pagination_class=None)
+    def cache_stats(self, request):
+        return Response({
+            **response_cache.stats.get(self.get_cache_name()),
+            'generations': dict(zip(
+                [model._meta.label_lower for model in self.get_cache_models()],
+                response_cache.get_generations(self.get_cache_models()),
+            )),
+            'backend': settings.CACHES['default']['BACKEND'],
+            'timeout': settings.API_RESPONSE_CACHE_TIMEOUT,
+        })
+
+class ConditionalGetMixin:
+    """
+    조건부 GET (ETag / Last-Modified)
+    
+    If-None-Match/If-Modified-Since가 맞으면 목록 쿼리와 serializer를 실행하지 않고 304를 반환합니다.
+    
+    - 목록: 컬렉션 전체의 MAX(updated_at)과 행 수로 계산 (인덱스 집계 쿼리 한 번)
+      ETag는 URL(쿼리 문자열)별로 다르고, Last-Modified에는 마지막 삭제 시각도 반영합니다.
+    - 상세: 항목의 updated_at
+    
+    JSON 응답에만 적용합니다 (Browsable API 제외).
+    """
+    
+    def use_conditional(self, request):
+        return request.method in ('GET', 'HEAD') and isinstance(request.accepted_renderer, JSONRenderer)
+    
+    def conditional_response(self, request, etag, last_modified, render):
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = render()
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+    
+    def collection_validators(self, request):
+        model = self.queryset.model
+        aggregate = model._default_manager.aggregate(last_modified=Max('updated_at'), count=Count('pk'))
+        deleted_at = response_cache.last_deleted(model)
+        last_modified = max(filter(None, (aggregate['last_modified'], deleted_at)))
+        raw = f"{request.build_absolute_uri()}|{aggregate['last_modified']}|{aggregate['count']}|{deleted_at}"
+        return f'W/"{hashlib.md5(raw.encode()).hexdigest()}"', int(last_modified.timestamp())
+    
+    def list(self, request, *args, **kwargs):
+        if not self.use_conditional(request):
+            return super().list(request, *args, **kwargs)
+        handler = super().list
+        etag, last_modified = self.collection_validators(request)
+        return self.conditional_response(request, etag, last_modified, lambda: handler(request, *args, **kwargs))
+    
+    def retrieve(self, request, *args, **kwargs):
+        handler = super().retrieve
+        lookup = self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        updated_at = None
+        if self.use_conditional(request):
+            updated_at = (self.filter_queryset(self.get_queryset()).filter(**{self.lookup_field: lookup})
+                          .values_list('updated_at', flat=True).first())
+        if updated_at is None:
+            return handler(request, *args, **kwargs)
+        etag = f'W/"{lookup}-{int(updated_at.timestamp() * 1_000_000)}"'
+        return self.conditional_response(request, etag, int(updated_at.timestamp()),
+                                         lambda: handler(request, *args, **kwargs))
+
+class FastListMixin:
+    """
+    list 응답의 빠른 경로 - 모델 인스턴스와 필드별 serializer를 거치지 않음
+    
+    queryset.values() 행을 FastRowEncoder(serializer 필드를 미리 컴파일한 변환기)로 바꾸고
+    FastJSONRenderer(orjson)로 렌더링합니다. 응답은 기존 경로와 바이트 단위로 같습니다.
+    JSON 응답(들여쓰기 없음)이고 serializer 필드가 모두 모델 컬럼일 때만 사용합니다.
+    """
+    fast_list = True
+    
+    def use_fast_list(self, request):
+        renderer = request.accepted_renderer
+        return (self.fast_list and type(renderer) is JSONRenderer
+                and not renderer.get_indent(request.accepted_media_type, {})
+                and get_row_encoder(self.get_serializer_class()).supported)
+    
+    def get_list_rows(self, queryset, encoder):
+        # 정렬 필드(priority_rank 등)는 커서 페이지네이션 위치 계산에 필요하므로 함께 조회
+        ordering = [term.lstrip('-') for term in queryset.query.order_by if isinstance(term, str)]
+        extra = [field for field in ordering if field != 'pk' and field not in encoder.sources]
+        return queryset.values(*encoder.sources, *extra)
+    
+    def list(self, request, *args, **kwargs):
+        if not self.use_fast_list(request):
+            return super().list(request, *args, **kwargs)
+        encoder = get_row_encoder(self.get_serializer_class())
+        rows = self.get_list_rows(self.filter_queryset(self.get_queryset()), encoder)
+        
+        request.accepted_renderer = FastJSONRenderer()
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(encoder.encode(page))
+        return Response(encoder.encode(rows))
+
+class BulkMixin:
+    """
+    목록 일괄 생성/수정 (serializer의 BulkListSerializer 사용)
+    
+    - POST /{목록}/ 에 배열을 보내면 bulk_create로 일괄 생성
+    - PUT/PATCH /{목록}/bulk/ 에 id가 포함된 배열을 보내면 bulk_update로 일괄 수정
+    
+    전체가 한 트랜잭션이므로 한 항목이라도 검증에 실패하면 아무것도 저장하지 않습니다.
+    단건 수정(PUT/PATCH /{목록}/{id}/)에 배열을 보내면 기존과 같이 400입니다.
+    """
+    
+    def get_serializer(self, *args, **kwargs):
+        # 배열 본문은 생성에서만 일괄 처리 (bulk_update는 many=True를 직접 전달)
+        if self.action == 'create' and isinstance(kwargs.get('data'), list):
+            kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
+    
+    @action(detail=False, methods=['put', 'patch'], url_path='bulk', filter_backends=[], pagination_class=None)
+    def bulk_update(self, request):
+        try:
+            ids = [int(item['id']) for item in request.data]
+        except (TypeError, KeyError, ValueError):
+            raise ValidationError({'id': ['모든 항목에 정수 id가 필요합니다.']})
+        if len(set(ids)) != len(ids):
+            raise ValidationError({'id': ['id가 중복되었습니다.']})
+        
+        with transaction.atomic():
+            instances = self.get_queryset().in_bulk(ids)
+            missing = [pk for pk in ids if pk not in instances]
+            if missing:
+                raise NotFound(f"항목을 찾을 수 없습니다: {missing}")
+            serializer = self.get_serializer([instances[pk] for pk in ids], data=request.data, many=True,
+                                             partial=request.method == 'PATCH')
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+        return Response(serializer.data)
+
+class FullTextSearchMixin:
+    """
+    /search/ 액션 - 전문 검색 색인을 사용해 관련도 순으로 조회
+    
+    결과에는 rank(관련도)와 snippet(검색어 강조)이 포함됩니다.
+    """
+    search_serializer_class = None
+    
+    @action(detail=False, methods=['get'], url_path='search', filter_backends=[], pagination_class=None)
+    def full_text_search(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            raise ValidationError({'q': '검색어를 입력하세요.'})
+        try:
+            limit = min(int(request.query_params.get('limit', DEFAULT_SEARCH_LIMIT)), MAX_SEARCH_LIMIT)
+        except ValueError:
+            raise ValidationError({'limit': '정수를 입력하세요.'})
+        if limit < 1:
+            raise ValidationError({'limit': '1 이상이어야 합니다.'})
+        results = search(self.queryset.model, query, limit)
+        return Response(self.search_serializer_class(results, many=True).data)
+
 @extend_schema_view(
     list=extend_schema(
         summary="할 일 목록 조회",
@@ -14,13 +245,14 @@ from drf_spectacular.types import OpenApiTypes
         parameters=[
             OpenApiParameter(name="status", description="상태 필터링 (Pending/Completed)", type=OpenApiTypes.STR),
             OpenApiParameter(name="priority", description="우선순위 필터링 (High/Medium/Low)", type=OpenApiTypes.STR),
+            OpenApiParameter(name="overdue", description="마감일이 지난 미완료 항목 필터링 (true/false)", type=OpenApiTypes.BOOL),
             OpenApiParameter(name="search", description="할 일 내용 검색", type=OpenApiTypes.STR),
-            OpenApiParameter(name="ordering", description="정렬 기준 (due_date, priority, created_at)", type=OpenApiTypes.STR),
+            OpenApiParameter(name="ordering", description="정렬 기준 (due_date, priority, created_at, 여러 개는 쉼표로 구분, -는 내림차순). priority는 High, Medium, Low 순(같으면 마감일 순)", type=OpenApiTypes.STR),
         ]
     ),
     create=extend_schema(
         summary="할 일 생성",
-        description="새로운 할 일 항목을 생성합니다."
+        description="새로운 할 일 항목을 생성합니다. 배열을 보내면 한 트랜잭션에서 일괄 생성합니다."
     ),
     retrieve=extend_schema(
         summary="할 일 상세 조회",
@@ -37,21 +269,52 @@ from drf_spectacular.types import OpenApiTypes
     destroy=extend_schema(
         summary="할 일 삭제",
         description="특정 할 일 항목을 삭제합니다."
+    ),
+    bulk_update=extend_schema(
+        summary="할 일 일괄 수정",
+        description="id가 포함된 할 일 배열을 한 트랜잭션에서 일괄 수정합니다 (PATCH는 부분 수정).",
+        request=TodoSerializer(many=True),
+        responses=TodoSerializer(many=True)
+    ),
+    bulk_status=extend_schema(
+        summary="할 일 상태 일괄 변경",
+        description="status, priority, overdue, search 필터에 맞는 할 일의 상태를 UPDATE 한 번으로 변경하고 변경된 개수를 반환합니다. "
+                    "전체 변경을 막기 위해 필터를 하나 이상 지정해야 합니다.",
+        parameters=[
+            OpenApiParameter(name="status", description="현재 상태 필터링 (Pending/Completed)", type=OpenApiTypes.STR),
+            OpenApiParameter(name="priority", description="우선순위 필터링 (High/Medium/Low)", type=OpenApiTypes.STR),
+            OpenApiParameter(name="overdue", description="마감일이 지난 미완료 항목 필터링 (true/false)", type=OpenApiTypes.BOOL),
+            OpenApiParameter(name="search", description="할 일 내용 검색", type=OpenApiTypes.STR),
+        ],
+        request=TodoBulkStatusSerializer,
+        responses=OpenApiTypes.OBJECT
+    ),
+    full_text_search=extend_schema(
+        summary="할 일 전문 검색",
+        description="할 일 내용을 전문 검색 색인으로 검색해 관련도 순으로 반환합니다.",
+        parameters=SEARCH_PARAMETERS,
+        responses=TodoSearchSerializer(many=True)
+    ),
+    stats=extend_schema(
+        summary="할 일 통계",
+        description="상태/우선순위별 개수, 완료율, 지연 개수, 이번 주 마감 개수를 집계 쿼리 한 번으로 조회합니다. status, priority, search 필터를 함께 사용할 수 있습니다.",
+        responses=OpenApiTypes.OBJECT
     )
 )
-class TodoViewSet(viewsets.ModelViewSet):
+class TodoViewSet(ResponseCacheMixin, ConditionalGetMixin, FastListMixin, BulkMixin, FullTextSearchMixin, viewsets.ModelViewSet):
     """
     할 일(Todo) 항목을 관리하기 위한 API 뷰셋
     
     list:
         모든 할 일 항목을 조회합니다.
         
-        - status, priority로 필터링 가능
+        - status, priority, overdue로 필터링 가능
         - task 내용으로 검색 가능
-        - due_date, priority, created_at으로 정렬 가능
+        - due_date, priority, created_at으로 정렬 가능 (priority는 High, Medium, Low 순, 같으면 마감일 순)
+        - pagination=cursor이면 커서 페이지네이션 (깊은 페이지도 인덱스 seek)
         
     create:
-        새로운 할 일 항목을 생성합니다.
+        새로운 할 일 항목을 생성합니다. (배열이면 일괄 생성)
         
     retrieve:
         특정 할 일 항목의 상세 정보를 조회합니다.
@@ -64,13 +327,49 @@ class TodoViewSet(viewsets.ModelViewSet):
         
     destroy:
         특정 할 일 항목을 삭제합니다.
+        
+    bulk_update:
+        id가 포함된 할 일 배열을 일괄 수정합니다.
+        
+    bulk_status:
+        필터에 맞는 할 일의 상태를 한 번에 변경합니다. (예: 지연된 High 항목 모두 완료)
+        
+    full_text_search:
+        할 일 내용을 전문 검색합니다.
+        
+    stats:
+        할 일 통계를 조회합니다.
+        
+    cache_stats:
+        응답 캐시 hit/miss 횟수를 조회합니다.
     """
     queryset = Todo.objects.all()
     serializer_class = TodoSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['status', 'priority']
+    search_serializer_class = TodoSearchSerializer
+    filter_backends = [DjangoFilterBackend, SearchFilter, MappedOrderingFilter]
+    pagination_class = OptionalCursorPagination
+    filterset_class = TodoFilter
     search_fields = ['task']
     ordering_fields = ['due_date', 'priority', 'created_at']
+    # priority 문자열 대신 인덱스가 있는 priority_rank로 정렬 (같으면 마감일 순)
+    ordering_field_map = {'priority': ('priority_rank', 'due_date')}
+    
+    @action(detail=False, methods=['get'])
+    def stats(self, request):
+        return Response(self.filter_queryset(self.get_queryset()).stats())
+    
+    @action(detail=False, methods=['post'], url_path='bulk-status', pagination_class=None)
+    def bulk_status(self, request):
+        serializer = TodoBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # 필터 없이 호출하면 전체 할 일이 바뀌므로 거부
+        filters = [*self.filterset_class.base_filters, SearchFilter.search_param]
+        if not any(request.query_params.get(name) for name in filters):
+            raise ValidationError({'filter': [f"필터를 하나 이상 지정하세요: {', '.join(filters)}"]})
+        # 필터 조건으로 UPDATE 한 번 (행마다 읽거나 저장하지 않음)
+        with transaction.atomic():
+            updated = self.filter_queryset(self.get_queryset()).update(status=serializer.validated_data['status'])
+        return Response({'updated': updated})
 
 @extend_schema_view(
     list=extend_schema(
@@ -83,7 +382,7 @@ class TodoViewSet(viewsets.ModelViewSet):
     ),
     create=extend_schema(
         summary="노트 생성",
-        description="새로운 노트 항목을 생성합니다."
+        description="새로운 노트 항목을 생성합니다. 배열을 보내면 한 트랜잭션에서 일괄 생성합니다."
     ),
     retrieve=extend_schema(
         summary="노트 상세 조회",
@@ -100,9 +399,21 @@ class TodoViewSet(viewsets.ModelViewSet):
     destroy=extend_schema(
         summary="노트 삭제",
         description="특정 노트 항목을 삭제합니다."
+    ),
+    bulk_update=extend_schema(
+        summary="노트 일괄 수정",
+        description="id가 포함된 노트 배열을 한 트랜잭션에서 일괄 수정합니다 (PATCH는 부분 수정).",
+        request=NoteSerializer(many=True),
+        responses=NoteSerializer(many=True)
+    ),
+    full_text_search=extend_schema(
+        summary="노트 전문 검색",
+        description="노트 내용을 전문 검색 색인으로 검색해 관련도 순으로 반환합니다.",
+        parameters=SEARCH_PARAMETERS,
+        responses=NoteSearchSerializer(many=True)
     )
 )
-class NoteViewSet(viewsets.ModelViewSet):
+class NoteViewSet(ResponseCacheMixin, ConditionalGetMixin, FastListMixin, BulkMixin, FullTextSearchMixin, viewsets.ModelViewSet):
     """
     노트(Note) 항목을 관리하기 위한 API 뷰셋
     
@@ -111,9 +422,10 @@ class NoteViewSet(viewsets.ModelViewSet):
         
         - content 내용으로 검색 가능
         - created_at으로 정렬 가능
+        - pagination=cursor이면 커서 페이지네이션 (깊은 페이지도 인덱스 seek)
         
     create:
-        새로운 노트 항목을 생성합니다.
+        새로운 노트 항목을 생성합니다. (배열이면 일괄 생성)
         
     retrieve:
         특정 노트 항목의 상세 정보를 조회합니다.
@@ -126,9 +438,20 @@ class NoteViewSet(viewsets.ModelViewSet):
         
     destroy:
         특정 노트 항목을 삭제합니다.
+        
+    bulk_update:
+        id가 포함된 노트 배열을 일괄 수정합니다.
+        
+    full_text_search:
+        노트 내용을 전문 검색합니다.
+        
+    cache_stats:
+        응답 캐시 hit/miss 횟수를 조회합니다.
     """
     queryset = Note.objects.all()
     serializer_class = NoteSerializer
-    filter_backends = [SearchFilter, OrderingFilter]
+    search_serializer_class = NoteSearchSerializer
+    filter_backends = [SearchFilter, MappedOrderingFilter]
+    pagination_class = OptionalCursorPagination
     search_fields = ['content']
     ordering_fields = ['created_at']
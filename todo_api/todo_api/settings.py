@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 from pathlib import Path
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # Load .env file
@@ -88,14 +89,62 @@ WSGI_APPLICATION = 'todo_api.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
+# DJANGO_DB_ENGINE/NAME/USER/PASSWORD/HOST/PORT로 변경 (기본: SQLite db.sqlite3)
+# 연결은 요청마다 새로 열지 않고 DJANGO_DB_CONN_MAX_AGE초 동안 재사용하며, 재사용 전에 상태를 확인
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'ENGINE': os.getenv('DJANGO_DB_ENGINE', 'django.db.backends.sqlite3'),
+        'NAME': os.getenv('DJANGO_DB_NAME', BASE_DIR / 'db.sqlite3'),
+        'USER': os.getenv('DJANGO_DB_USER', ''),
+        'PASSWORD': os.getenv('DJANGO_DB_PASSWORD', ''),
+        'HOST': os.getenv('DJANGO_DB_HOST', ''),
+        'PORT': os.getenv('DJANGO_DB_PORT', ''),
+        'CONN_MAX_AGE': int(os.getenv('DJANGO_DB_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': os.getenv('DJANGO_DB_CONN_HEALTH_CHECKS', '1').lower() in ('1', 'true', 'yes', 'on'),
     }
 }
 
+# SQLite 연결마다 적용할 PRAGMA (api/signals.py) - FastAPI 서버(db_manager.py)와 같은 환경 변수
+SQLITE_PRAGMAS = {
+    'journal_mode': os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),
+    'synchronous': os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),
+    'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+    'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT', 5000)),
+    # 음수는 KiB 단위 (-65536 = 64MB)
+    'cache_size': int(os.getenv('SQLITE_CACHE_SIZE', -65536)),
+    'temp_store': 'MEMORY',
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# DJANGO_CACHE_BACKEND: locmem(기본, 프로세스별) 또는 file(여러 프로세스가 공유)
+
+CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'todo-api'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache',
+             os.path.join(tempfile.gettempdir(), 'todo_api_cache')),
+}
+_cache_backend, _cache_location = CACHE_BACKENDS[os.getenv('DJANGO_CACHE_BACKEND', 'locmem')]
+
+CACHES = {
+    'default': {
+        'BACKEND': _cache_backend,
+        'LOCATION': os.getenv('DJANGO_CACHE_LOCATION', _cache_location),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('DJANGO_CACHE_MAX_ENTRIES', 1000)),
+        },
+    }
+}
+
+# API 응답 캐시 유지 시간(초) - 쓰기가 있으면 세대 번호가 바뀌어 바로 무효화되므로 메모리 상한 용도
+# 0이면 응답 캐시 사용 안 함
+API_RESPONSE_CACHE_TIMEOUT = int(os.getenv('API_RESPONSE_CACHE_TIMEOUT', 300))
+
+# 목록 일괄 생성/수정 시 INSERT/UPDATE 한 번에 처리할 행 수 (전체는 한 트랜잭션)
+API_BULK_BATCH_SIZE = int(os.getenv('API_BULK_BATCH_SIZE', 500))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators